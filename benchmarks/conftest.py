@@ -0,0 +1,157 @@
+import json
+import os
+import re
+import shutil
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlparse
+
+import ffmpeg
+import pytest
+from PIL import Image as PILImage
+
+import nucleus.core.cache as cache
+import nucleus.sdk.harvest.models as models
+from nucleus.core.types import CID, Any, Iterator, List, Path, Tuple
+
+# Synthetic media settings
+IMAGE_SIZE = (1920, 1080)
+VIDEO_DURATION = 5
+BLOB_SIZE = 2**24
+
+
+def _parts(content_type: str, body: bytes) -> List[Tuple[str, bytes]]:
+    """Split the multipart body sent by the RPC client into (filename, content) parts"""
+    boundary = content_type.split('boundary=')[1].encode()
+    # skip the preamble and the closing delimiter
+    segments = body.split(b'--' + boundary)[1:-1]
+
+    parts = []
+    for segment in segments:
+        headers, content = segment.split(b'\r\n\r\n', 1)
+        filename = re.search(rb'filename="([^"]*)"', headers)
+        parts.append((unquote(filename.group(1).decode()) if filename else '', content[:-2]))
+    return parts
+
+
+def _add(parts: List[Tuple[str, bytes]], _: Any) -> Iterator[Any]:
+    total = 0
+    for name, content in parts:
+        total += len(content)
+        yield {'Name': name, 'Hash': CID.from_bytes(content), 'Size': str(len(content))}
+    # wrapping directory reported as the largest entry
+    yield {'Name': '', 'Hash': CID.from_bytes(str(total).encode(), 'dag-pb'), 'Size': str(total + 1)}
+
+
+def _block_put(parts: List[Tuple[str, bytes]], params: Any) -> Iterator[Any]:
+    codec = params.get('cid-codec', ['raw'])[0]
+    for _, content in parts:
+        yield {'Key': CID.from_bytes(content, codec), 'Size': len(content)}
+
+
+def _dag_put(parts: List[Tuple[str, bytes]], params: Any) -> Iterator[Any]:
+    codec = params.get('store-codec', ['dag-cbor'])[0]
+    for _, content in parts:
+        yield {'Cid': {'/': CID.from_bytes(content, codec)}}
+
+
+class _FakeIPFS(BaseHTTPRequestHandler):
+    """Minimal kubo RPC server replying with locally computed CIDs, so only the client cost is measured"""
+
+    protocol_version = 'HTTP/1.1'
+    # reply headers and body without waiting for client acks
+    disable_nagle_algorithm = True
+    routes = {'/api/v0/add': _add, '/api/v0/block/put': _block_put, '/api/v0/dag/put': _dag_put}
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        route = self.routes.get(url.path)
+
+        if route is None:
+            self._reply(500, json.dumps({'Message': 'not found', 'Code': 0}).encode())
+            return
+
+        parts = _parts(self.headers['Content-Type'], body)
+        entries = route(parts, parse_qs(url.query))
+        self._reply(200, b''.join(json.dumps(e).encode() + b'\n' for e in entries))
+
+    def _reply(self, status: int, content: bytes):
+        self.send_response(status)
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, *_: Any):
+        ...
+
+
+def _models(base: Any) -> Iterator[Any]:
+    """Walk the declared models, including the models declared by the benchmarks"""
+    for model in base.__subclasses__():
+        yield model
+        yield from _models(model)
+
+
+@pytest.fixture(scope='session', autouse=True)
+def models_path(tmp_path_factory: pytest.TempPathFactory):
+    """Store the model databases in a temporary directory, so every run starts from empty databases"""
+    path = tmp_path_factory.mktemp('models')
+    providers = []
+
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(models, 'MODELS_PATH', f'{path}/')
+        for model in _models(models.Base):
+            provider = cache.Provider(f'{path}/{model._alias}.db', setup=cache.tune)
+            monkeypatch.setattr(model, '_provider', provider)
+            monkeypatch.setattr(model, '_ready', False)
+            providers.append(provider)
+
+        yield Path(str(path))
+        for provider in providers:
+            provider.close()
+
+
+@pytest.fixture(scope='session')
+def ipfs_endpoint():
+    """Start a local fake IPFS RPC server and return its endpoint"""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _FakeIPFS)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield f'http://127.0.0.1:{server.server_port}'
+    server.shutdown()
+
+
+@pytest.fixture(scope='session')
+def media_dir(tmp_path_factory: pytest.TempPathFactory):
+    return tmp_path_factory.mktemp('media')
+
+
+@pytest.fixture(scope='session')
+def synthetic_image(media_dir: Any):
+    """Generate a noisy full HD image, noise avoids the compression shortcuts of flat images"""
+    path = media_dir / 'image.png'
+    noise = os.urandom(IMAGE_SIZE[0] * IMAGE_SIZE[1] * 3)
+    PILImage.frombytes('RGB', IMAGE_SIZE, noise).save(path)
+    return Path(str(path))
+
+
+@pytest.fixture(scope='session')
+def synthetic_blob(media_dir: Any):
+    """Generate a random binary file to measure storage throughput"""
+    path = media_dir / 'blob.bin'
+    path.write_bytes(os.urandom(BLOB_SIZE))
+    return Path(str(path))
+
+
+@pytest.fixture(scope='session')
+def synthetic_video(media_dir: Any):
+    """Generate a test pattern video using ffmpeg lavfi source"""
+    if shutil.which('ffmpeg') is None:
+        pytest.skip('ffmpeg is required to generate synthetic videos')
+
+    path = media_dir / 'video.mp4'
+    source = ffmpeg.input(f'testsrc=duration={VIDEO_DURATION}:size=1280x720:rate=30', f='lavfi')
+    ffmpeg.output(source, str(path), vcodec='libx264', pix_fmt='yuv420p').run(quiet=True)
+    return Path(str(path))
@@ -0,0 +1,37 @@
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+import nucleus.sdk.expose as expose
+import nucleus.sdk.storage as storage
+from nucleus.core.types import CID, Any
+from nucleus.sdk.expose import Compact, DagJose, Descriptive, Sign, Structural, Technical
+
+ROUNDS = 20
+MEDIA_CID = CID('bafkreiafogsmhi4yvuk7z4suhcr3rcnztqmt7rydgj3dmk6jeylmglnq5u')
+
+
+def _sep001(serialization: type) -> Any:
+    sep001 = expose.standard('image/png')
+    sep001.set_operation(Sign)
+    sep001.set_serialization(serialization)
+    sep001.add_key(expose.es256())
+    sep001.add_metadata(Descriptive(title='Nucleus the SDK', description='Building block for decentralized media'))
+    sep001.add_metadata(Structural(cid=MEDIA_CID))
+    sep001.add_metadata(Technical(size=1024, width=1920, height=1080))
+    return sep001
+
+
+@pytest.mark.parametrize('serialization', [DagJose, Compact])
+def test_sep001_serialize(benchmark: BenchmarkFixture, serialization: type):
+    """Measure the latency of signing and serializing the metadata"""
+    # serialization consumes the standard payload, so a fresh standard is prepared for each round
+    setup = lambda: ((_sep001(serialization),), {})  # noqa: E731
+    benchmark.pedantic(lambda sep001: sep001.serialize(), setup=setup, rounds=ROUNDS)
+
+
+@pytest.mark.parametrize('serialization', [DagJose, Compact])
+def test_serialization_save_to(benchmark: BenchmarkFixture, ipfs_endpoint: str, serialization: type):
+    """Measure the latency of storing the serialized metadata"""
+    store = storage.ipfs(ipfs_endpoint)
+    serialized = _sep001(serialization).serialize()
+    benchmark.pedantic(serialized.save_to, args=(store,), rounds=ROUNDS)
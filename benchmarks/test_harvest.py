@@ -0,0 +1,107 @@
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+import nucleus.sdk.harvest.codecs as codecs
+from nucleus.core.types import List
+from nucleus.sdk.harvest import Codec, Model
+
+ROUNDS = 5
+ENTRIES = 1000
+
+
+class Nucleus(Model):
+    contributors: List[str]
+
+
+class Catalog(Model):
+    contributors: List[str]
+
+
+class IndexedCatalog(Model):
+    contributors: List[str]
+
+    class Config:
+        indexes = ('title',)
+
+
+def _entries(model: type[Model]) -> List[Model]:
+    return [
+        model(title=f'title {i}', description=f'description {i}', contributors=['Jacob', 'Geo', 'Dennis'])
+        for i in range(ENTRIES)
+    ]
+
+
+@pytest.fixture(scope='module')
+def catalogs():
+    """Seed the catalogs once per run, so the fetch benchmarks always read the same entries"""
+    for model in (Catalog, IndexedCatalog):
+        model.save_many(_entries(model))
+
+
+def test_model_init(benchmark: BenchmarkFixture):
+    """Measure the cost of building validated models"""
+    benchmark.extra_info['entries'] = ENTRIES
+    benchmark.pedantic(_entries, args=(Nucleus,), rounds=ROUNDS)
+
+
+def test_model_construct(benchmark: BenchmarkFixture):
+    """Measure the cost of building models from trusted data without validation"""
+    raw = [dict(entry) for entry in _entries(Nucleus)]
+    benchmark.extra_info['entries'] = ENTRIES
+    benchmark.pedantic(lambda: [Nucleus.construct(**data) for data in raw], rounds=ROUNDS)
+
+
+def test_model_save(benchmark: BenchmarkFixture):
+    """Measure the throughput of storing model snapshots"""
+    entries = _entries(Nucleus)
+    benchmark.extra_info['entries'] = ENTRIES
+    benchmark.pedantic(lambda: [entry.save() for entry in entries], rounds=ROUNDS)
+
+
+def test_model_load(benchmark: BenchmarkFixture):
+    """Measure the throughput of bulk loading trusted data"""
+    raw = [dict(entry) for entry in _entries(Nucleus)]
+    benchmark.extra_info['entries'] = ENTRIES
+    benchmark.pedantic(Nucleus.load, args=(raw,), rounds=ROUNDS)
+
+
+def test_model_all(benchmark: BenchmarkFixture, catalogs: None):
+    """Measure the throughput of fetching model snapshots"""
+    benchmark.extra_info['entries'] = ENTRIES
+    benchmark.pedantic(lambda: list(Catalog.all()), rounds=ROUNDS)
+
+
+def test_model_save_many(benchmark: BenchmarkFixture):
+    """Measure the throughput of storing model snapshots in batches"""
+    entries = _entries(Nucleus)
+    benchmark.extra_info['entries'] = ENTRIES
+    benchmark.pedantic(Nucleus.save_many, args=(entries,), rounds=ROUNDS)
+
+
+def test_model_iter_all(benchmark: BenchmarkFixture, catalogs: None):
+    """Measure the throughput of walking model snapshots by pages"""
+    benchmark.extra_info['entries'] = ENTRIES
+    benchmark.pedantic(lambda: list(Catalog.iter_all()), rounds=ROUNDS)
+
+
+@pytest.mark.parametrize('model', [Catalog, IndexedCatalog])
+def test_model_get(benchmark: BenchmarkFixture, catalogs: None, model: type[Model]):
+    """Measure the latency of looking up a snapshot by field, scanning or using the index"""
+    benchmark.extra_info['entries'] = ENTRIES
+    benchmark.pedantic(model.get, kwargs={'title': f'title {ENTRIES - 1}'}, rounds=ROUNDS)
+
+
+@pytest.mark.parametrize('codec', [codecs.Pickle(), codecs.JSON()], ids=['pickle', 'json'])
+def test_snapshot_encode(benchmark: BenchmarkFixture, codec: Codec):
+    """Measure the throughput of encoding model snapshots"""
+    entries = _entries(Catalog)
+    benchmark.extra_info['entries'] = ENTRIES
+    benchmark.pedantic(lambda: [codec.encode(entry) for entry in entries], rounds=ROUNDS)
+
+
+@pytest.mark.parametrize('codec', [codecs.Pickle(), codecs.JSON()], ids=['pickle', 'json'])
+def test_snapshot_decode(benchmark: BenchmarkFixture, codec: Codec):
+    """Measure the throughput of decoding model snapshots"""
+    payloads = [codec.encode(entry) for entry in _entries(Catalog)]
+    benchmark.extra_info['entries'] = ENTRIES
+    benchmark.pedantic(lambda: [codec.decode(Catalog, payload, 0) for payload in payloads], rounds=ROUNDS)
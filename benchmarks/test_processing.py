@@ -0,0 +1,34 @@
+from pytest_benchmark.fixture import BenchmarkFixture
+
+import nucleus.sdk.harvest as harvest
+import nucleus.sdk.processing as processing
+from nucleus.core.types import Any, Path
+from nucleus.sdk.processing import H264, HLS, Resize
+
+ROUNDS = 5
+
+
+def test_image_engine_save(benchmark: BenchmarkFixture, synthetic_image: Path, media_dir: Any):
+    """Measure the latency of resizing and saving a full HD image"""
+    output = Path(str(media_dir / 'resized.png'))
+
+    def _save():
+        image = harvest.image(path=synthetic_image)
+        engine = processing.engine(image)
+        engine.configure(Resize(640, 360))
+        return engine.save(output)
+
+    benchmark.pedantic(_save, rounds=ROUNDS)
+
+
+def test_video_engine_save(benchmark: BenchmarkFixture, synthetic_video: Path, media_dir: Any):
+    """Measure the latency of transcoding a short video to HLS"""
+    output = Path(str(media_dir / 'index.m3u8'))
+
+    def _save():
+        video = harvest.video(path=synthetic_video)
+        engine = processing.engine(video)
+        engine.configure(HLS(H264()))
+        return engine.save(output)
+
+    benchmark.pedantic(_save, rounds=1)
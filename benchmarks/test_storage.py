@@ -0,0 +1,46 @@
+import os
+
+from pytest_benchmark.fixture import BenchmarkFixture
+
+import nucleus.sdk.storage as storage
+from nucleus.core.types import JSON, Path
+from nucleus.sdk.processing import File, Introspection
+
+ROUNDS = 10
+BLOCKS = 500
+
+
+def test_store_bytes(benchmark: BenchmarkFixture, ipfs_endpoint: str):
+    """Measure the latency of storing a small raw block"""
+    store = storage.ipfs(ipfs_endpoint)
+    benchmark(store, os.urandom(1024))
+
+
+def test_store_json(benchmark: BenchmarkFixture, ipfs_endpoint: str):
+    """Measure the latency of storing a small dag"""
+    store = storage.ipfs(ipfs_endpoint)
+    benchmark(store, JSON({'title': 'benchmark', 'contributors': ['Jacob', 'Geo', 'Dennis']}))
+
+
+def test_store_file(benchmark: BenchmarkFixture, ipfs_endpoint: str, synthetic_blob: Path):
+    """Measure the throughput of streaming a large file"""
+    store = storage.ipfs(ipfs_endpoint)
+    file = File(path=synthetic_blob, meta=Introspection(size=synthetic_blob.size(), type='video/mp4'))
+    benchmark.extra_info['bytes'] = synthetic_blob.size()
+    benchmark.pedantic(store, args=(file,), rounds=ROUNDS)
+
+
+def test_store_many(benchmark: BenchmarkFixture, ipfs_endpoint: str):
+    """Measure the throughput of storing many raw blocks in batch"""
+    store = storage.ipfs(ipfs_endpoint)
+    blocks = [os.urandom(256) for _ in range(BLOCKS)]
+    benchmark.extra_info['blocks'] = BLOCKS
+    benchmark.pedantic(store.many, args=(blocks,), rounds=ROUNDS)
+
+
+def test_store_map(benchmark: BenchmarkFixture, ipfs_endpoint: str):
+    """Measure the throughput of storing many raw blocks concurrently"""
+    store = storage.ipfs(ipfs_endpoint)
+    blocks = [os.urandom(256) for _ in range(BLOCKS)]
+    benchmark.extra_info['blocks'] = BLOCKS
+    benchmark.pedantic(lambda: list(store.map(blocks)), rounds=ROUNDS)
@@ -1,4 +1,5 @@
-from .database import connect, connection, is_open
+from .database import connect, connection, is_open, tune
+from .provider import Provider
 from .types import Connection, Cursor
 
-__all__ = ('connect', 'connection', 'is_open', 'Cursor', 'Connection')
+__all__ = ('connect', 'connection', 'is_open', 'tune', 'Provider', 'Cursor', 'Connection')
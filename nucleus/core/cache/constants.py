@@ -12,3 +12,15 @@ DB_NAME = os.getenv('DB_NAME')
 DB_DEFAULT = f'{ROOT_DIR}/{DB_NAME}'
 DB_ISOLATION_LEVEL = os.getenv('DB_ISOLATION')
 DB_DATE_VERSION = datetime.date.today().strftime('%Y%m%d')
+
+# Tuned pragmas for write intensive databases
+# WAL allows readers to run concurrently with a writer, and with synchronous NORMAL
+# the database is only synced on checkpoints, so it remains consistent after crashes.
+# ref: https://www.sqlite.org/pragma.html
+DB_PRAGMAS = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'temp_store': 'MEMORY',
+    # negative values are interpreted as KiB
+    'cache_size': -16000,
+}
@@ -4,7 +4,7 @@ import sqlite3
 from nucleus.core.exceptions import DatabaseError
 from nucleus.core.types import Any, Iterator
 
-from .constants import DB_DEFAULT
+from .constants import DB_DEFAULT, DB_PRAGMAS
 from .types import Connection
 
 
@@ -44,6 +44,27 @@ def connection(db_path: str = DB_DEFAULT, **k: Any) -> Iterator[Connection]:
     yield connect(db_path, **k)
 
 
+def tune(conn: Connection, **pragmas: Any) -> Connection:
+    """Set the pragmas to the connection.
+
+    Usage:
+
+        conn = tune(connect(), journal_mode='WAL')
+
+    :param conn: Connection to tune
+    :param **pragmas: The pragmas to set, by default the write intensive pragmas are used
+    :return: The tuned connection
+    :raises DatabaseError: If any pragma can not be set
+    """
+    try:
+        for pragma, value in (pragmas or DB_PRAGMAS).items():
+            conn.execute(f'PRAGMA {pragma} = {value}')
+        return conn
+    except sqlite3.Error as e:
+        # proxy exception raising
+        raise DatabaseError(f'error while trying to set database pragmas: {str(e)}')
+
+
 def is_open(conn: Connection) -> bool:
     """Check if connection is open.
 
@@ -54,4 +75,4 @@ def is_open(conn: Connection) -> bool:
     return cursor is not None
 
 
-__all__ = ['connect', 'connection', 'is_open']
+__all__ = ['connect', 'connection', 'is_open', 'tune']
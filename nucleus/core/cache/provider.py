@@ -0,0 +1,88 @@
+import threading
+import weakref
+
+from nucleus.core.types import Any, Callable, Optional
+
+from .constants import DB_DEFAULT
+from .database import connect
+from .types import Connection
+
+
+class _Holder:
+    """Hold the connection of a thread, the holder is released when the thread exits."""
+
+    __slots__ = ('conn', '__weakref__')
+
+    def __init__(self, conn: Connection):
+        self.conn = conn
+
+
+class Provider:
+    """Provide a connection per thread to the same database.
+    Sqlite connections cannot be shared between threads, so each thread lazily opens its own connection
+    the first time it requests one and keeps using it afterwards.
+    The connection is closed when its thread exits, so short-lived thread pools do not leak connections.
+
+    Usage:
+
+        provider = Provider('models.db', setup=cache.tune)
+        # in any thread
+        conn = provider()
+    """
+
+    _db_path: str
+    _setup: Optional[Callable[[Connection], Any]]
+    _settings: Any
+    _local: threading.local
+    _lock: threading.Lock
+    _holders: weakref.WeakSet
+
+    def __init__(self, db_path: str = DB_DEFAULT, setup: Optional[Callable[[Connection], Any]] = None, **kwargs: Any):
+        """Initialize a new provider.
+
+        :param db_path: Sqlite file path
+        :param setup: Callable to prepare each new connection, eg: set pragmas
+        :param **kwargs: Any extra arguments to pass to sqlite connector
+        """
+        self._db_path = db_path
+        self._setup = setup
+        self._settings = kwargs
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._holders = weakref.WeakSet()
+
+    def __call__(self) -> Connection:
+        """Return the connection for the current thread.
+
+        :return: Connection to database
+        :raises DatabaseError: If any error occurs during connection creation
+        """
+        holder = getattr(self._local, 'holder', None)
+        if holder is not None:
+            return holder.conn
+
+        # each connection is only used by its thread, but any thread may close them all
+        conn = connect(self._db_path, check_same_thread=False, **self._settings)
+        if self._setup is not None:
+            self._setup(conn)
+
+        # the thread local storage is released when the thread exits, closing its connection
+        holder = _Holder(conn)
+        weakref.finalize(holder, conn.close)
+        # keep track of the alive connections to close them all later
+        with self._lock:
+            self._holders.add(holder)
+        self._local.holder = holder
+        return conn
+
+    def close(self):
+        """Close the connections opened by all threads."""
+        with self._lock:
+            for holder in list(self._holders):
+                holder.conn.close()
+            self._holders.clear()
+        # new connections are opened if the provider is used again
+        self._local = threading.local()
+
+
+__all__ = ('Provider',)
@@ -1,12 +1,19 @@
+from .multipart import Multipart, Part
 from .partials import delete, get, live_session, post, put, session
-from .session import LiveSession
+from .registry import close_sessions, shared_session
+from .session import KeepAliveAdapter, LiveSession
 from .types import Codes, Response
 
 __all__ = [
     'Response',
     'Codes',
     'LiveSession',
+    'KeepAliveAdapter',
+    'Multipart',
+    'Part',
     'live_session',
+    'shared_session',
+    'close_sessions',
     'session',
     'post',
     'get',
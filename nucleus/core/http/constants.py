@@ -0,0 +1,16 @@
+# Multipart encoding settings
+# The amount of bytes read from disk for each chunk sent over the wire
+MULTIPART_CHUNK_SIZE = 2**16
+MULTIPART_DEFAULT_CONTENT_TYPE = 'application/octet-stream'
+
+# Connection pool settings
+# Number of pools to cache (one per host) and max connections to keep per pool
+HTTP_POOL_CONNECTIONS = 10
+HTTP_POOL_MAXSIZE = 32
+# Retry failed requests with exponential backoff: {backoff factor} * (2 ** retry number)
+# A retried request sends the whole body again, streaming bodies are read again from the start.
+HTTP_MAX_RETRIES = 3
+HTTP_BACKOFF_FACTOR = 0.3
+HTTP_RETRY_STATUS = (429, 502, 503, 504)
+# Only idempotent methods are retried by default, same as urllib3 default
+HTTP_RETRY_METHODS = ('HEAD', 'GET', 'PUT', 'DELETE', 'OPTIONS', 'TRACE')
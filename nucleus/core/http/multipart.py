@@ -0,0 +1,124 @@
+import secrets
+from dataclasses import dataclass
+from urllib.parse import quote
+
+from nucleus.core.types import Iterable, Iterator, List, Optional, Path, Raw, Union
+
+from .constants import MULTIPART_CHUNK_SIZE, MULTIPART_DEFAULT_CONTENT_TYPE
+
+
+@dataclass(slots=True)
+class Part:
+    """Part represent a single entry in a multipart/form-data body.
+    The content is only read from disk when the body is being sent.
+
+    Usage:
+
+        # a file part streamed from disk
+        part = Part('file', 'video.mp4', Path('video.mp4'))
+        # an in-memory part
+        part = Part('file', 'meta', b'hello')
+    """
+
+    name: str
+    filename: str
+    content: Optional[Union[bytes, Path]] = None
+    content_type: str = MULTIPART_DEFAULT_CONTENT_TYPE
+
+    def header(self, boundary: str) -> bytes:
+        """Return the part header preceded by the boundary delimiter.
+        The filename is percent-encoded to allow nested paths in filenames.
+
+        :param boundary: The multipart boundary
+        :return: The encoded part header
+        """
+        filename = quote(self.filename, safe='')
+        return (
+            f'--{boundary}\r\n'
+            f'Content-Disposition: form-data; name="{self.name}"; filename="{filename}"\r\n'
+            f'Content-Type: {self.content_type}\r\n\r\n'
+        ).encode()
+
+    def size(self) -> int:
+        """Return the content size without reading it.
+
+        :return: The content size in bytes
+        """
+        if self.content is None:
+            return 0
+        if isinstance(self.content, bytes):
+            return len(self.content)
+        return int(self.content.size())
+
+    def read(self, chunk_size: int) -> Iterator[bytes]:
+        """Yield the content in chunks.
+
+        :param chunk_size: The max size of each chunk
+        :return: Iterator of content chunks
+        """
+        if self.content is None:
+            return
+        if isinstance(self.content, bytes):
+            yield self.content
+            return
+
+        with self.content.open('rb') as f:
+            while chunk := f.read(chunk_size):
+                yield chunk
+
+
+class Multipart:
+    """Streaming multipart/form-data body.
+    The body length is computed ahead from the parts, so it can be sent with a known Content-Length,
+    while the content is read lazily in chunks, keeping the memory usage constant regardless of media size.
+
+    Usage:
+
+        body = Multipart([Part('file', 'video.mp4', Path('video.mp4'))])
+        session.post(url, data=body, headers=body.headers())
+    """
+
+    _boundary: str
+    _parts: List[Part]
+    _chunk_size: int
+
+    def __init__(self, parts: Iterable[Part], chunk_size: int = MULTIPART_CHUNK_SIZE):
+        self._boundary = secrets.token_hex(16)
+        self._parts = list(parts)
+        self._chunk_size = chunk_size
+
+    def _closing(self) -> bytes:
+        return f'--{self._boundary}--\r\n'.encode()
+
+    def __len__(self) -> int:
+        """Return the total size of the encoded body.
+
+        :return: The body size in bytes
+        """
+        headers = sum(len(p.header(self._boundary)) + p.size() + 2 for p in self._parts)
+        return headers + len(self._closing())
+
+    def __iter__(self) -> Iterator[bytes]:
+        """Yield the encoded body in chunks.
+        Each iteration produces a fresh stream, so the body can be sent again on retries.
+
+        :return: Iterator of encoded body chunks
+        """
+        for part in self._parts:
+            yield part.header(self._boundary)
+            yield from part.read(self._chunk_size)
+            yield b'\r\n'
+        yield self._closing()
+
+    def headers(self) -> Raw:
+        """Return the headers needed to send the body.
+
+        :return: Content-Type and Content-Length headers
+        """
+        return {
+            'Content-Type': f'multipart/form-data; boundary={self._boundary}',
+            'Content-Length': str(len(self)),
+        }
+
+
+__all__ = ('Multipart', 'Part')
@@ -0,0 +1,53 @@
+import os
+import threading
+from urllib.parse import urlsplit
+
+from nucleus.core.types import Any, Dict, Tuple
+
+from .session import LiveSession
+
+# process-wide sessions keyed by process id and base url
+_sessions: Dict[Tuple[int, str], LiveSession] = {}
+_lock = threading.Lock()
+
+
+def _key(base_url: str) -> Tuple[int, str]:
+    """Normalize the base url to use it as registry key.
+    The process id is part of the key since pooled sockets cannot be shared with forked processes.
+    """
+    parsed = urlsplit(base_url)
+    normalized = f'{parsed.scheme.lower()}://{parsed.netloc.lower()}{parsed.path.rstrip("/")}'
+    return os.getpid(), normalized
+
+
+def shared_session(base_url: str, **kwargs: Any) -> LiveSession:
+    """Return the process-wide session for the base url.
+    Every client pointing to the same endpoint shares the same warmed connection pool.
+    The session settings are only used the first time the session is created.
+
+    Usage:
+
+        # both share the same session
+        session = shared_session("http://localhost:5001")
+        same_session = shared_session("http://localhost:5001/")
+
+    :param base_url: The base url to attach the session
+    :param **kwargs: Any extra settings to pass to LiveSession
+    :return: The shared session
+    """
+    key = _key(base_url)
+    with _lock:
+        if key not in _sessions:
+            _sessions[key] = LiveSession(base_url, **kwargs)
+        return _sessions[key]
+
+
+def close_sessions():
+    """Close all the shared sessions and release the connections."""
+    with _lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
+
+
+__all__ = ('shared_session', 'close_sessions')
@@ -1,20 +1,81 @@
+import socket
 from urllib.parse import urljoin
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
 
 from nucleus.core.exceptions import HttpError
-from nucleus.core.types import Any
+from nucleus.core.types import Any, Iterable
+
+from .constants import (
+    HTTP_BACKOFF_FACTOR,
+    HTTP_MAX_RETRIES,
+    HTTP_POOL_CONNECTIONS,
+    HTTP_POOL_MAXSIZE,
+    HTTP_RETRY_METHODS,
+    HTTP_RETRY_STATUS,
+)
+
+
+class KeepAliveAdapter(HTTPAdapter):
+    """Enhance the default adapter enabling TCP keep-alive in pooled connections,
+    so idle connections to the same endpoint are kept warm instead of being dropped.
+    """
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any):
+        keep_alive = [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+        kwargs['socket_options'] = HTTPConnection.default_socket_options + keep_alive
+        super().init_poolmanager(*args, **kwargs)
 
 
 class LiveSession(requests.Session):
-    """Enhance the session behavior by adding the default base url into requests"""
+    """Enhance the session behavior by adding the default base url into requests.
+    The connections are pooled and kept alive, failed requests are retried using backoff policy.
+    Only idempotent methods are retried by default, non idempotent methods must be explicitly allowed.
+    Each retry sends the whole request body again, including streaming bodies.
+
+    Usage:
+
+        # keep up to 100 connections to the same host
+        session = LiveSession("http://localhost:5001", pool_maxsize=100)
+        # also retry POST requests
+        session = LiveSession("http://localhost:5001", retry_methods=('POST',))
+    """
 
     _base_url: str
 
-    def __init__(self, base_url: str):
+    def __init__(
+        self,
+        base_url: str,
+        pool_connections: int = HTTP_POOL_CONNECTIONS,
+        pool_maxsize: int = HTTP_POOL_MAXSIZE,
+        max_retries: int = HTTP_MAX_RETRIES,
+        backoff_factor: float = HTTP_BACKOFF_FACTOR,
+        retry_methods: Iterable[str] = HTTP_RETRY_METHODS,
+    ):
         super().__init__()
         self._base_url = base_url
 
+        retries = Retry(
+            total=max_retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=HTTP_RETRY_STATUS,
+            allowed_methods=frozenset(retry_methods),
+            # return the last response to let the caller handle the error details
+            raise_on_status=False,
+        )
+
+        adapter = KeepAliveAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=retries,
+        )
+
+        self.mount('http://', adapter)
+        self.mount('https://', adapter)
+
     def request(self, method: Any, url: Any, *args: Any, **kwargs: Any):
         """Same as Session request, we add an extra behavior to concat in every request the base url."""
 
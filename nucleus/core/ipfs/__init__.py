@@ -1,12 +1,23 @@
-from .cmd import Add, BlockPut, DagPut, Dir, File, Text
-from .connect import rpc
+from . import unixfs
+from .cmd import Add, Batch, BlockPut, BlockStat, DagPut, Dir, File, PinAdd, Text
+from .connect import async_rpc, rpc
+from .rpc import RPC, AsyncRPC
+from .types import Request
 
 __all__ = (
     'Add',
     'DagPut',
     'BlockPut',
+    'BlockStat',
+    'PinAdd',
     'Text',
     'File',
     'Dir',
+    'Batch',
+    'RPC',
+    'AsyncRPC',
+    'Request',
     'rpc',
+    'async_rpc',
+    'unixfs',
 )
@@ -1,6 +1,7 @@
 from .add import Add
-from .block import BlockPut
+from .block import BlockPut, BlockStat
 from .dag import DagPut
-from .inputs import Dir, File, Text
+from .inputs import Batch, Dir, File, Text
+from .pin import PinAdd
 
-__all__ = ['Add', 'BlockPut', 'DagPut', 'Text', 'File', 'Dir']
+__all__ = ['Add', 'BlockPut', 'BlockStat', 'DagPut', 'PinAdd', 'Text', 'File', 'Dir', 'Batch']
@@ -4,6 +4,7 @@ import nucleus.core.dataclass as dc
 from nucleus.core.http import LiveSession
 from nucleus.core.types import Settings
 
+from ..types import Request
 from .constants import IPFS_API_ADD
 
 
@@ -21,13 +22,18 @@ class Add:
     cid_version: int = 1
     wrap_with_directory: bool = False
 
-    def __call__(self, session: LiveSession):
+    def request(self) -> Request:
         # convert dataclass to request IPFS 'add endpoint' attributes.
         # we don't want `input` into params
         params = dc.asdict_sanitize(self, ('input',))
         compiled_settings = dict(self.input)
+        return Request(IPFS_API_ADD, params, compiled_settings)
+
+    def __call__(self, session: LiveSession):
+        request = self.request()
+        # stream the response to parse output entries as soon as they arrive
         # post request to /add endpoint using defined params and settings
-        return session.post(IPFS_API_ADD, params=params, **compiled_settings)
+        return session.post(request.endpoint, params=request.params, stream=True, **request.settings)
 
 
 __all__ = ('Add',)
@@ -2,9 +2,10 @@ from dataclasses import dataclass
 
 import nucleus.core.dataclass as dc
 from nucleus.core.http import LiveSession
-from nucleus.core.types import Settings
+from nucleus.core.types import CID, Settings
 
-from .constants import IPFS_API_BLOCK_PUT
+from ..types import Request
+from .constants import IPFS_API_BLOCK_PUT, IPFS_API_BLOCK_STAT
 
 
 @dataclass(slots=True)
@@ -20,13 +21,39 @@ class BlockPut:
     cid_codec: str = 'raw'
     allow_big_block: bool = False
 
-    def __call__(self, session: LiveSession):
-        # convert dataclass to request IPFS 'add endpoint' attributes.
+    def request(self) -> Request:
+        # convert dataclass to request IPFS 'block/put endpoint' attributes.
         # we don't want `input` into params
         params = dc.asdict_sanitize(self, ('input',))
         compiled_settings = dict(self.input)
+        return Request(IPFS_API_BLOCK_PUT, params, compiled_settings)
+
+    def __call__(self, session: LiveSession):
+        request = self.request()
+        # stream the response to parse output entries as soon as they arrive
         # post request to /block/put endpoint using defined params and settings
-        return session.post(IPFS_API_BLOCK_PUT, params=params, **compiled_settings)
+        return session.post(request.endpoint, params=request.params, stream=True, **request.settings)
+
+
+@dataclass(slots=True)
+class BlockStat:
+    """Print information of a raw IPFS block.
+    By default the block is only looked up in the local node, so it can be used to check if a block is already stored.
+    ref: http://docs.ipfs.tech/reference/kubo/rpc/#api-v0-block-stat
+    """
+
+    cid: CID
+    offline: bool = True
+
+    def request(self) -> Request:
+        # the block cid is sent as `arg` param
+        params = {'arg': str(self.cid), 'offline': self.offline}
+        return Request(IPFS_API_BLOCK_STAT, params, {})
+
+    def __call__(self, session: LiveSession):
+        request = self.request()
+        # post request to /block/stat endpoint using defined params
+        return session.post(request.endpoint, params=request.params, stream=True, **request.settings)
 
 
-__all__ = ('BlockPut',)
+__all__ = ('BlockPut', 'BlockStat')
@@ -3,5 +3,13 @@ IPFS_API_ADD = '/api/v0/add'
 IPFS_API_BLOCK_PUT = '/api/v0/block/put'
 IPFS_API_BLOCK_GET = '/api/v0/block/get'
 IPFS_API_BLOCK_RM = '/api/v0/block/rm'
+IPFS_API_BLOCK_STAT = '/api/v0/block/stat'
 
 IPFS_API_DAG_PUT = '/api/v0/dag/put'
+
+IPFS_API_PIN_ADD = '/api/v0/pin/add'
+
+# Directory input settings
+# Hidden and temporary files are skipped during directory walk
+DIR_IGNORE_PATTERNS = ('.*', '*~', '*.tmp', '*.temp', '*.part', '*.swp')
+DIR_CONTENT_TYPE = 'application/x-directory'
@@ -4,6 +4,7 @@ import nucleus.core.dataclass as dc
 from nucleus.core.http import LiveSession
 from nucleus.core.types import Settings
 
+from ..types import Request
 from .constants import IPFS_API_DAG_PUT
 
 
@@ -20,13 +21,18 @@ class DagPut:
     input_codec: str = 'dag-json'
     allow_big_block: bool = False
 
-    def __call__(self, session: LiveSession):
-        # convert dataclass to request IPFS 'add endpoint' attributes.
+    def request(self) -> Request:
+        # convert dataclass to request IPFS 'dag/put endpoint' attributes.
         # we don't want `input` into params
         params = dc.asdict_sanitize(self, ('input',))
         compiled_settings = dict(self.input)
+        return Request(IPFS_API_DAG_PUT, params, compiled_settings)
+
+    def __call__(self, session: LiveSession):
+        request = self.request()
+        # stream the response to parse output entries as soon as they arrive
         # post request to /dag/put endpoint using defined params and settings
-        return session.post(IPFS_API_DAG_PUT, params=params, **compiled_settings)
+        return session.post(request.endpoint, params=request.params, stream=True, **request.settings)
 
 
 __all__ = ('DagPut',)
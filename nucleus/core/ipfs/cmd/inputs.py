@@ -1,29 +1,80 @@
+import fnmatch
+import os
 from dataclasses import dataclass
 
 from nucleus.core.exceptions import IPFSRuntimeError
-from nucleus.core.types import Path
+from nucleus.core.http import Multipart, Part
+from nucleus.core.types import Iterator, Path, Sequence, Setting, Tuple
+
+from .constants import DIR_CONTENT_TYPE, DIR_IGNORE_PATTERNS
+
+
+def _body(*parts: Part) -> Setting:
+    """Yield the streaming multipart body and its headers as request settings.
+
+    :param parts: The parts to include in body
+    :return: The iterable tuple (key, value) with request arguments
+    """
+    body = Multipart(parts)
+    yield 'data', body
+    yield 'headers', body.headers()
 
 
 @dataclass(slots=True)
 class Dir:
     """Dir represent directory params in request based on input path.
+    The directory tree is walked recursively and each entry is added using its path relative to the input path,
+    so the whole tree is added in one request. The files content is streamed from disk during the request.
+
+    Usage:
+
+        # skip hidden files and playlists
+        directory = Dir(Path("hls"), ignore=('.*', '*.m3u8'))
 
     :raises IPFSRuntimeError: If directory does not exist.
     """
 
     path: Path
+    # glob patterns matched against entry names to skip
+    ignore: Tuple[str, ...] = DIR_IGNORE_PATTERNS
 
     def __post_init__(self):
         if not self.path.is_dir():
             raise IPFSRuntimeError(f'raised trying to execute `add` with an invalid directory {self.path}')
 
+    def _ignored(self, name: str) -> bool:
+        return any(fnmatch.fnmatch(name, pattern) for pattern in self.ignore)
+
+    def _relative(self, root: str, name: str) -> str:
+        # multipart filenames are relative to input path using posix separators
+        relative_path = os.path.relpath(os.path.join(root, name), self.path)
+        return relative_path.replace(os.sep, '/')
+
+    def _walk(self) -> Iterator[Part]:
+        """Walk the directory tree and yield a part for each entry.
+        Sub-directories are yielded before their content as expected by IPFS.
+
+        :return: Iterator of multipart parts
+        """
+        for root, dirs, files in os.walk(self.path):
+            # prune ignored directories to avoid walking them
+            dirs[:] = sorted(d for d in dirs if not self._ignored(d))
+            for name in dirs:
+                yield Part('file', self._relative(root, name), content_type=DIR_CONTENT_TYPE)
+
+            for name in sorted(files):
+                if self._ignored(name):
+                    continue
+                yield Part('file', self._relative(root, name), Path(os.path.join(root, name)))
+
     def __iter__(self):
-        yield 'files', [('file', (child.name, child.read_bytes())) for child in self.path.iterdir()]
+        yield from _body(*self._walk())
 
 
 @dataclass(slots=True)
 class File:
     """File represent "files" params in request based on input path.
+    The file content is streamed from disk during the request.
 
     :raises IPFSRuntimeError: If file does not exist.
     """
@@ -35,7 +86,7 @@ class File:
             raise IPFSRuntimeError(f'raised trying to execute `add` with an invalid path {self.path}')
 
     def __iter__(self):
-        yield 'files', {'file': (self.path.name, self.path.read_bytes())}
+        yield from _body(Part('file', self.path.name, self.path))
 
 
 @dataclass(slots=True)
@@ -45,7 +96,24 @@ class Text:
     input: bytes
 
     def __iter__(self):
-        yield 'files', {'file': ('meta', self.input)}
+        yield from _body(Part('file', 'meta', self.input))
+
+
+@dataclass(slots=True)
+class Batch:
+    """Batch represent many "data" params in request based on input texts.
+    Commands accepting many inputs process each one independently in the same request, eg: block/put, dag/put.
+
+    Usage:
+
+        # put many blocks in one request
+        command = BlockPut(Batch([b'hello', b'world']))
+    """
+
+    inputs: Sequence[bytes]
+
+    def __iter__(self):
+        yield from _body(*(Part('file', 'meta', data) for data in self.inputs))
 
 
-__all__ = ('File', 'Text')
+__all__ = ('File', 'Text', 'Dir', 'Batch')
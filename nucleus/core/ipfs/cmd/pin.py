@@ -0,0 +1,32 @@
+from dataclasses import dataclass
+
+from nucleus.core.http import LiveSession
+from nucleus.core.types import CID, Sequence
+
+from ..types import Request
+from .constants import IPFS_API_PIN_ADD
+
+
+@dataclass(slots=True)
+class PinAdd:
+    """Pin objects to the local node, so they are not removed by the garbage collector.
+    By default the blocks are only looked up in the local node, so pinning fails if any block is missing.
+    ref: http://docs.ipfs.tech/reference/kubo/rpc/#api-v0-pin-add
+    """
+
+    cids: Sequence[CID]
+    recursive: bool = True
+    offline: bool = True
+
+    def request(self) -> Request:
+        # each cid is sent as a repeated `arg` param
+        params = {'arg': [str(cid) for cid in self.cids], 'recursive': self.recursive, 'offline': self.offline}
+        return Request(IPFS_API_PIN_ADD, params, {})
+
+    def __call__(self, session: LiveSession):
+        request = self.request()
+        # post request to /pin/add endpoint using defined params
+        return session.post(request.endpoint, params=request.params, stream=True, **request.settings)
+
+
+__all__ = ('PinAdd',)
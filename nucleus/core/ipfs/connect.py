@@ -1,18 +1,30 @@
 import nucleus.core.http as http
 from nucleus.core.types import Optional
 
-from .constants import IPFS_DEFAULT_ENDPOINT
-from .rpc import RPC
+from .constants import IPFS_ASYNC_DEFAULT_LIMIT, IPFS_DEFAULT_ENDPOINT, IPFS_RETRY_METHODS
+from .rpc import RPC, AsyncRPC
 
 
 def rpc(endpoint: Optional[str] = None) -> RPC:
     """Create a new IPFS RPC interface object.
+    Every RPC object pointing to the same endpoint shares the same http session.
 
     :param endpoint: The endpoint to attach the RPC.
     :return: A new IPFS API interface object.
     """
     endpoint = endpoint or IPFS_DEFAULT_ENDPOINT
-    return RPC(http.live_session(endpoint))
+    return RPC(http.shared_session(endpoint, retry_methods=IPFS_RETRY_METHODS))
 
 
-__all__ = ('rpc',)
+def async_rpc(endpoint: Optional[str] = None, limit: int = IPFS_ASYNC_DEFAULT_LIMIT) -> AsyncRPC:
+    """Create a new async IPFS RPC interface object.
+
+    :param endpoint: The endpoint to attach the RPC.
+    :param limit: The max number of simultaneous connections to the endpoint.
+    :return: A new async IPFS API interface object.
+    """
+    endpoint = endpoint or IPFS_DEFAULT_ENDPOINT
+    return AsyncRPC(endpoint, limit)
+
+
+__all__ = ('rpc', 'async_rpc')
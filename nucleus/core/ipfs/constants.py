@@ -1 +1,11 @@
 IPFS_DEFAULT_ENDPOINT = 'http://localhost:5001'
+# Max number of simultaneous connections for async client
+IPFS_ASYNC_DEFAULT_LIMIT = 100
+# IPFS RPC calls are POST requests, and writes are content addressed, so retrying them is safe
+IPFS_RETRY_METHODS = ('POST',)
+
+# UnixFS layout settings
+# Same defaults used by kubo to build files: 256KiB chunks and max 174 links per node
+UNIXFS_CHUNK_SIZE = 2**18
+UNIXFS_MAX_LINKS = 174
+UNIXFS_FILE_TYPE = 2
@@ -1,13 +1,76 @@
+from __future__ import annotations
+
+import asyncio
 import json
 
-from requests.exceptions import JSONDecodeError
+import aiohttp
 
-from nucleus.core.exceptions import IPFSRuntimeError
+from nucleus.core.exceptions import HttpError, IPFSRuntimeError
 from nucleus.core.http import LiveSession
-from nucleus.core.types import JSON
+from nucleus.core.types import JSON, Any, AsyncIterator, Iterable, Iterator, Optional, Raw
 
+from .constants import IPFS_ASYNC_DEFAULT_LIMIT
 from .types import RPCCommand
 
+# Sentinel returned when the sync body is exhausted
+_DONE = object()
+
+
+def _size(entry: JSON) -> int:
+    """Return the cumulative size reported in the entry or 0 if not reported."""
+    return int(entry.get('Size', 0))
+
+
+def _root(root: Optional[JSON], entry: JSON) -> JSON:
+    """Return the root entry between the current root and the new entry.
+    We expect many entries when a directory is added, the root is the entry with the largest cumulative size.
+    """
+    if root is None or _size(entry) > _size(root):
+        return entry
+    return root
+
+
+def _error(command: RPCCommand, content: bytes) -> IPFSRuntimeError:
+    """Build a standard exception based on the failed response content.
+
+    :param command: The executed command
+    :param content: The response content
+    :return: The exception to raise
+    """
+    try:
+        error_details = json.loads(content).get('Message')
+    except (json.JSONDecodeError, AttributeError):
+        error_details = content.decode(errors='replace')
+
+    return IPFSRuntimeError(f'error trying to execute IPFS command `{type(command).__name__}`: {error_details}')
+
+
+def _entry(command: RPCCommand, line: bytes) -> Optional[JSON]:
+    """Parse a line of output as json entry.
+
+    :param command: The executed command
+    :param line: The output line
+    :return: The json entry or None if the line is empty
+    :raises IPFSRuntimeException: If an invalid or error entry is received
+    """
+    # skip keep-alive new lines
+    if not line.strip():
+        return None
+
+    try:
+        entry = JSON(json.loads(line))
+    except json.JSONDecodeError as e:
+        raise IPFSRuntimeError(f'invalid output received from IPFS command: {str(e)}')
+
+    # errors occurred after streaming started are sent as an entry
+    if entry.get('Type') == 'error':
+        raise IPFSRuntimeError(f'error during IPFS command `{type(command).__name__}`: {entry["Message"]}')
+    return entry
+
+
+def _empty(command: RPCCommand) -> IPFSRuntimeError:
+    return IPFSRuntimeError(f'empty response received from IPFS command `{type(command).__name__}`')
+
 
 class RPC:
 
@@ -23,6 +86,29 @@ class RPC:
     def __init__(self, http_client: LiveSession):
         self._http = http_client
 
+    def stream(self, command: RPCCommand) -> Iterator[JSON]:
+        """Execute built command and yield each json entry as soon as it is received.
+        IPFS output is a list of json separated by \\n when a directory is added, eg: one entry per added file.
+
+        :return: Iterator of json entries from IPFS API call response
+        :raises IPFSRuntimeException: If status code is not 200 or an error entry is received
+        """
+
+        # we pass an out of the box http session
+        response = command(self._http)
+
+        try:
+            if not response.ok:
+                raise _error(command, response.content)
+
+            for line in response.iter_lines():
+                entry = _entry(command, line)
+                if entry is not None:
+                    yield entry
+        finally:
+            # release the connection back to the pool
+            response.close()
+
     def __call__(self, command: RPCCommand) -> JSON:
         """Execute built command in container
 
@@ -37,33 +123,116 @@ class RPC:
         405 - HTTP Method Not Allowed
         """
 
-        # we pass an out of the box http session
-        response = command(self._http)
+        root = None
+        for entry in self.stream(command):
+            root = _root(root, entry)
 
-        try:
-            json_response = response.json()
-        except JSONDecodeError:
-            # sometime the IPFS output is not JSON
-            byte_content = response.content
-            string_content = byte_content.decode('utf-8')
-
-            # we expect this behavior when a directory is added
-            # IPFS output in this case is a list of json separated by \n
-            matched_delimiter = string_content.split('\n')
-            if len(matched_delimiter) == 0:
-                raise
-
-            json_dicts = map(json.loads, filter(None, matched_delimiter))
-            sorted_sizes = sorted(json_dicts, key=lambda d: int(d['Size']), reverse=True)
-            return JSON(sorted_sizes[0])
-
-        # check if request was successful
-        if not response.ok:
-            error_details = json_response.get('Message')
-            raise IPFSRuntimeError(f'error trying to execute IPFS command `{type(command).__name__}`: {error_details}')
+        if root is None:
+            raise _empty(command)
 
         # ready to use response
-        return json_response
+        return root
+
+
+async def _chunks(body: Iterable[bytes]) -> AsyncIterator[bytes]:
+    """Adapt a sync body to be streamed by the async client.
+    The body reads the files from disk for File and Dir inputs, so each chunk is pulled in a worker thread
+    to keep the event loop responsive while the files are read.
+    """
+    iterator = iter(body)
+    while (chunk := await asyncio.to_thread(next, iterator, _DONE)) is not _DONE:
+        yield chunk  # type: ignore
+
+
+def _stringify(params: Raw) -> Raw:
+    """The async client only accepts str, int or float as query params values.
+    Booleans are converted to string the same way the sync client does.
+    """
+    return {k: str(v) if isinstance(v, bool) else v for k, v in params.items()}
+
+
+class AsyncRPC:
+    """Asynchronous counterpart of RPC.
+    Execute the same commands using the request description they produce,
+    allowing to keep many calls in flight from a single event loop.
+
+    Usage:
+
+        async with ipfs.async_rpc() as api:
+            commands = (BlockPut(Text(data)) for data in blocks)
+            outputs = await asyncio.gather(*map(api, commands))
+    """
+
+    _base_url: str
+    _limit: int
+    _http: Optional[aiohttp.ClientSession]
+
+    def __init__(self, base_url: str, limit: int = IPFS_ASYNC_DEFAULT_LIMIT):
+        self._base_url = base_url
+        self._limit = limit
+        self._http = None
+
+    def _session(self) -> aiohttp.ClientSession:
+        """Lazy initialize the http session, since it must be created inside a running event loop.
+
+        :return: The http session
+        """
+        if self._http is None or self._http.closed:
+            connector = aiohttp.TCPConnector(limit=self._limit)
+            self._http = aiohttp.ClientSession(self._base_url, connector=connector)
+        return self._http
+
+    async def close(self):
+        """Close the underlying http session and release the connections."""
+        if self._http is not None:
+            await self._http.close()
+
+    async def __aenter__(self) -> AsyncRPC:
+        return self
+
+    async def __aexit__(self, *_: Any):
+        await self.close()
+
+    async def stream(self, command: RPCCommand) -> AsyncIterator[JSON]:
+        """Execute built command and yield each json entry as soon as it is received.
+
+        :return: Async iterator of json entries from IPFS API call response
+        :raises IPFSRuntimeException: If status code is not 200 or an error entry is received
+        :raises HttpError: If the request cannot be made
+        """
+
+        request = command.request()
+        settings = dict(request.settings)
+        if 'data' in settings:
+            settings['data'] = _chunks(settings['data'])
+
+        try:
+            params = _stringify(request.params)
+            async with self._session().post(request.endpoint, params=params, **settings) as response:
+                if response.status != 200:
+                    raise _error(command, await response.read())
+
+                async for line in response.content:
+                    entry = _entry(command, line)
+                    if entry is not None:
+                        yield entry
+        except aiohttp.ClientError as e:
+            raise HttpError(f'error trying to make a request to {self._base_url}{request.endpoint}: {str(e)}')
+
+    async def __call__(self, command: RPCCommand) -> JSON:
+        """Execute built command in container
+
+        :return: json response from IPFS API call response
+        :raises IPFSRuntimeException: If status code is not 200
+        """
+
+        root = None
+        async for entry in self.stream(command):
+            root = _root(root, entry)
+
+        if root is None:
+            raise _empty(command)
+        return root
 
 
-__all__ = ('RPC',)
+__all__ = ('RPC', 'AsyncRPC')
@@ -1,5 +1,22 @@
+from dataclasses import dataclass
+
 from nucleus.core.http import LiveSession, Response
-from nucleus.core.types import Protocol
+from nucleus.core.types import Protocol, Raw
+
+
+@dataclass(slots=True)
+class Request:
+    """Request describes an RPC call independently of the http client used to send it.
+
+    Usage:
+
+        # describe a call to /add endpoint
+        request = Request('/api/v0/add', {'pin': False}, {'data': body, 'headers': headers})
+    """
+
+    endpoint: str
+    params: Raw
+    settings: Raw
 
 
 class RPCCommand(Protocol):
@@ -10,6 +27,14 @@ class RPCCommand(Protocol):
 
     """
 
+    def request(self) -> Request:
+        """Describe the request needed to execute the command.
+        The description allows to execute the command using any http client, eg: sync or async.
+
+        :return: Request description
+        """
+        ...
+
     def __call__(self, session: LiveSession) -> Response:
         """This method is called in API handler as a nested call
         ref: http://docs.ipfs.tech/reference/kubo/cli/#ipfs-add
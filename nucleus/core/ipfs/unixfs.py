@@ -0,0 +1,98 @@
+from dataclasses import dataclass
+
+from nucleus.core.types import CID, Iterable, Iterator, List, Sequence, Tuple
+
+from .constants import UNIXFS_FILE_TYPE, UNIXFS_MAX_LINKS
+
+
+def _varint(value: int) -> bytes:
+    """Encode an unsigned integer as protobuf varint."""
+    encoded = bytearray()
+    while value > 0x7F:
+        encoded.append((value & 0x7F) | 0x80)
+        value >>= 7
+    encoded.append(value)
+    return bytes(encoded)
+
+
+def _uint(field: int, value: int) -> bytes:
+    # wire type 0: varint
+    return _varint(field << 3) + _varint(value)
+
+
+def _bytes(field: int, value: bytes) -> bytes:
+    # wire type 2: length delimited
+    return _varint(field << 3 | 2) + _varint(len(value)) + value
+
+
+@dataclass(slots=True)
+class Link:
+    """Link represent a child of a UnixFS file node.
+
+    Usage:
+
+        # a raw leaf with 256KiB of file content
+        link = Link(CID.from_bytes(chunk), len(chunk), len(chunk))
+    """
+
+    cid: CID
+    # the file content size under the link
+    size: int
+    # the cumulative size of the linked dag
+    tsize: int
+
+    def __bytes__(self) -> bytes:
+        # PBLink fields ordered as expected by dag-pb canonical form: Hash, Name, Tsize
+        return _bytes(1, bytes(self.cid)) + _bytes(2, b'') + _uint(3, self.tsize)
+
+
+def node(links: Sequence[Link]) -> bytes:
+    """Encode a UnixFS file node in dag-pb.
+    The links are encoded before the data as expected by dag-pb canonical form.
+    ref: https://ipld.io/specs/codecs/dag-pb/spec/
+
+    :param links: The node children
+    :return: The encoded node
+    """
+    data = _uint(1, UNIXFS_FILE_TYPE) + _uint(3, sum(link.size for link in links))
+    data += b''.join(_uint(4, link.size) for link in links)
+    return b''.join(_bytes(2, bytes(link)) for link in links) + _bytes(1, data)
+
+
+def _group(links: Sequence[Link], width: int) -> Iterator[Tuple[Link, bytes]]:
+    for i in range(0, len(links), width):
+        children = links[i : i + width]
+        encoded = node(children)
+        tsize = len(encoded) + sum(link.tsize for link in children)
+        parent = Link(CID.from_bytes(encoded, 'dag-pb'), sum(link.size for link in children), tsize)
+        yield parent, encoded
+
+
+def layout(leaves: Iterable[Link], width: int = UNIXFS_MAX_LINKS) -> Tuple[Link, List[bytes]]:
+    """Build a balanced UnixFS file tree on top of the stored leaves.
+    Same as kubo does, a single leaf is the file itself and no node is created.
+
+    Usage:
+
+        root, nodes = unixfs.layout(leaves)
+        api(BlockPut(Batch(nodes), cid_codec='dag-pb'))
+
+    :param leaves: The leaves in file order
+    :param width: Max number of links per node
+    :return: The root link and the encoded nodes to store, from bottom to top
+    """
+    level = list(leaves)
+    if not level:
+        # an empty file is a node without links
+        encoded = node(level)
+        return Link(CID.from_bytes(encoded, 'dag-pb'), 0, len(encoded)), [encoded]
+
+    nodes: List[bytes] = []
+    while len(level) > 1:
+        grouped = list(_group(level, width))
+        level = [parent for parent, _ in grouped]
+        nodes += [encoded for _, encoded in grouped]
+    return level[0], nodes
+
+
+__all__ = ('Link', 'node', 'layout')
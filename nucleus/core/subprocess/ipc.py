@@ -4,7 +4,7 @@ import os
 import re
 import subprocess
 
-from nucleus.core.types import List, Sequence, Union
+from nucleus.core.types import List, Optional, Sequence, Union
 
 from .constants import EXIT_FAILURE, EXIT_SUCCESS
 from .protocol import StreamProtocol
@@ -74,11 +74,13 @@ class IPC:
     _cmd: str
     _loop: Loop
     _stream: Reader
+    _transport: Optional[asyncio.SubprocessTransport]
 
     def __init__(self, cmd: str):
         self._cmd = cmd
         self._loop = asyncio.get_event_loop()  # type: ignore
         self._stream = Reader(loop=self._loop)
+        self._transport = None
 
     def stream(self) -> Reader:
         """If we need to read live the output we can get stream directly using this method
@@ -87,6 +89,19 @@ class IPC:
         """
         return self._stream
 
+    async def start(self) -> SubProcess:
+        """Start the process without waiting for it to finish.
+        The output can be read live from `stream` while the process is running.
+
+        :return: Subprocess instance
+        """
+        return await self._run()
+
+    def close(self):
+        """Kill the process if still running and release the pipes."""
+        if self._transport is not None:
+            self._transport.close()
+
     async def pipe(self, data: bytes) -> StdOut:
         """Check the output and analyze it.
         Failed if capture ERROR logs or stderr pipe.
@@ -122,6 +137,7 @@ class IPC:
             env=os.environ.copy(),
         )
 
+        self._transport = transport
         return SubProcess(transport, protocol, self._loop)
 
     def communicate(self, data: bytes = b'') -> StdOut:
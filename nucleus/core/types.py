@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import pathlib
 import urllib.parse as parse
@@ -97,6 +98,18 @@ class CID(_ExtensibleStr):
     def create(cls, *args: Any, **kwargs: Any):
         return cls(str(MultiFormatCID(*args, **kwargs)))
 
+    @classmethod
+    def from_bytes(cls, data: bytes, codec: str = 'raw') -> CID:
+        """Return a new CIDv1 base32 based on data sha2-256 hash and codec.
+        The result is the same CID returned by IPFS when the data is stored using the default settings.
+
+        :param data: The data to create a new CID
+        :param codec: The codec to use for the new CID
+        :return: The new CID
+        """
+        digest = hashlib.sha256(data).digest()
+        return cls.create('base32', 1, codec, ('sha2-256', digest))
+
 
 class URL(_ExtensibleStr):
     """Enhanced bridge string type extended with features needed to handle urls
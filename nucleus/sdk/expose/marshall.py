@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-import hashlib
-
 import dag_cbor
 from jwcrypto.common import json_decode
 
@@ -11,17 +9,6 @@ from nucleus.sdk.storage import Object, Store
 from .types import JWT, Standard
 
 
-def _cid_from_bytes(data: bytes, codec: str = 'raw') -> CID:
-    """Return a new CIDv1 base32 based on data hash and codec.
-
-    :param data: The data to create a new CID
-    :param codec: The codec to use for the new CID
-    :return: The new multi format cid object
-    """
-    digest = hashlib.sha256(data).digest()
-    return CID.create('base32', 1, codec, ('sha2-256', digest))
-
-
 class DagJose:
     """Dag-JOSE serializer implementation."""
 
@@ -38,7 +25,7 @@ class DagJose:
         """
         self._header = standard.header()
         self._cbor = dag_cbor.encode(standard.payload())
-        self._cid = _cid_from_bytes(self._cbor, 'dag-cbor')
+        self._cid = CID.from_bytes(self._cbor, 'dag-cbor')
 
     def __iter__(self) -> Setting:
         """Yield `typ` headers specified in SEP-001 standard.
@@ -82,8 +69,8 @@ class DagJose:
 
         # 1. store cbor in blocks
         # 2. store serialization and return
-        store(self._cbor)
-        return store(self._s11n)
+        *_, obj = store.many([self._cbor, self._s11n])
+        return obj
 
 
 class Compact:
@@ -130,7 +117,7 @@ class Compact:
 
         for key, value in payload.items():
             raw_claim = bytes(JSON(value))
-            payload[key] = str(_cid_from_bytes(raw_claim))
+            payload[key] = str(CID.from_bytes(raw_claim))
         return JSON(payload)
 
     def update(self, jwt: JWT) -> Compact:
@@ -152,11 +139,10 @@ class Compact:
         """
 
         # 1. store claims in blocks
-        for claim in self._claims:
-            store(claim)
-
         # 2. store serialization and return
-        return store(self._s11n)
+        # claims and serialization are raw blocks, so they are stored in one request
+        *_, obj = store.many([*self._claims, self._s11n])
+        return obj
 
     def __iter__(self) -> Setting:
         """Yield `typ` headers specified in SEP-001 standard.
@@ -1,7 +1,24 @@
-from .collectors import load, map, merge
+from .collectors import amerge, load, map, merge, spill, stream
 from .media import Image, Video
 from .models import Media, Model
 from .partials import image, model, video
-from .types import Collector
+from .types import AsyncCollector, Codec, Collector
 
-__all__ = ['Image', 'Collector', 'Video', 'Model', 'Media', 'load', 'map', 'merge', 'model', 'image', 'video']
+__all__ = [
+    'Image',
+    'Collector',
+    'AsyncCollector',
+    'Codec',
+    'Video',
+    'Model',
+    'Media',
+    'load',
+    'map',
+    'merge',
+    'stream',
+    'spill',
+    'amerge',
+    'model',
+    'image',
+    'video',
+]
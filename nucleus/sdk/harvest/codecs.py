@@ -0,0 +1,96 @@
+import pickle
+import struct
+
+import orjson
+
+from nucleus.core.types import Any, Dict, Type
+from nucleus.sdk.exceptions import ModelManagerError
+
+from .constants import SNAPSHOT_HEADER, SNAPSHOT_MAGIC
+from .types import Codec
+
+
+class Pickle:
+    """Pickle snapshot codec.
+    Stores the whole python object, so any model is supported, but snapshots break if the model class changes.
+    Pickle must only be used to load trusted snapshots.
+    """
+
+    tag = 0
+
+    def encode(self, model: Any) -> bytes:
+        return pickle.dumps(model, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def decode(self, model_type: Type[Any], payload: bytes, version: int) -> Any:
+        return pickle.loads(payload)
+
+
+class JSON:
+    """JSON snapshot codec.
+    Stores the model fields only, so the snapshots are portable and can be upgraded when the model schema changes.
+
+    Usage:
+
+        class MyModel(Model):
+            year: int
+
+            class Config:
+                codec = JSON()
+                version = 2
+
+            @classmethod
+            def upgrade(cls, data: Raw, version: int) -> Raw:
+                # snapshots stored before version 2 had a year string
+                return {**data, 'year': int(data['year'])} if version < 2 else data
+    """
+
+    tag = 1
+
+    def encode(self, model: Any) -> bytes:
+        # fields not natively supported by orjson are stored as string
+        return orjson.dumps(model.dict(), default=str)
+
+    def decode(self, model_type: Type[Any], payload: bytes, version: int) -> Any:
+        data = orjson.loads(payload)
+        if version != model_type.__config__.version:
+            data = model_type.upgrade(data, version)
+        return model_type.parse_obj(data)
+
+
+# Known codecs by tag
+_codecs: Dict[int, Codec] = {codec.tag: codec for codec in (Pickle(), JSON())}
+
+
+def encode(model: Any) -> bytes:
+    """Encode the model as snapshot using the codec and version declared in model config.
+
+    :param model: The model to encode
+    :return: The snapshot with header
+    """
+    codec = model.__config__.codec
+    header = struct.pack(SNAPSHOT_HEADER, SNAPSHOT_MAGIC, codec.tag, model.__config__.version)
+    return header + codec.encode(model)
+
+
+def decode(model_type: Type[Any], snapshot: bytes) -> Any:
+    """Decode the snapshot using the codec declared in its header.
+
+    :param model_type: The model class
+    :param snapshot: The stored snapshot
+    :return: The decoded model
+    :raises ModelManagerError: If the snapshot codec is unknown
+    """
+
+    # snapshots stored before codecs were introduced are plain pickle
+    if not snapshot.startswith(SNAPSHOT_MAGIC):
+        return pickle.loads(snapshot)
+
+    header_size = struct.calcsize(SNAPSHOT_HEADER)
+    _, tag, version = struct.unpack(SNAPSHOT_HEADER, snapshot[:header_size])
+    if tag not in _codecs:
+        raise ModelManagerError(f'unknown codec `{tag}` found decoding `{model_type.__name__}` snapshot')
+
+    return _codecs[tag].decode(model_type, snapshot[header_size:], version)
+
+
+__all__ = ('Pickle', 'JSON', 'encode', 'decode')
@@ -1,17 +1,168 @@
+import asyncio
+import concurrent.futures
+import contextlib
+import functools
+import importlib.util
 import inspect
 import itertools
+import json
+import os
 import pkgutil
+import queue
+import sys
+import tempfile
+import threading
+import weakref
 from collections import defaultdict
+from dataclasses import dataclass
+from importlib.metadata import entry_points
 
-from nucleus.core.types import JSON, Any, Iterator, Mapping
+import nucleus.core.cache as cache
+from nucleus.core.cache import Connection
+from nucleus.core.types import (
+    JSON,
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Path,
+    Tuple,
+    Type,
+    Union,
+)
+from nucleus.sdk.exceptions import HarvestingError
 
-from .constants import COLLECTORS_PATH
-from .types import Collector
+from .constants import (
+    COLLECTORS_ENTRY_POINT,
+    COLLECTORS_PATH,
+    COLLECTORS_POLL_TIMEOUT,
+    COLLECTORS_QUEUE_SIZE,
+    COLLECTORS_SPILL_BATCH_SIZE,
+    COLLECTORS_SPILL_PREFIX,
+    SPILL_CLEAR,
+    SPILL_FETCH,
+    SPILL_INDEX,
+    SPILL_INSERT,
+    SPILL_MIGRATE,
+    SPILL_NAMES,
+)
+from .types import AsyncCollector, Collector
 
+# Sentinel sent by each collector when its collection is done
+_DONE = object()
 
-def map(collectors: Iterator[Collector]) -> Mapping[str, Iterator[JSON]]:
+CollectorType = Type[Union[Collector, AsyncCollector]]
+# Discovered collector classes by directory, with the directory mtime at discovery time
+_discovered: Dict[Path, Tuple[int, Tuple[CollectorType, ...]]] = {}
+_lock = threading.Lock()
+
+
+@dataclass(slots=True)
+class _Failure:
+    """Failure sent instead of an entry when a collector raises."""
+
+    collector: Any
+    error: Exception
+
+    def __call__(self) -> HarvestingError:
+        name = type(self.collector).__name__
+        return HarvestingError(f'error during `{name}` collection: {str(self.error)}')
+
+
+def _synchronous(collectors: Iterable[Any]) -> Iterator[Collector]:
+    """Ensure that the collectors can be consumed synchronously.
+
+    :param collectors: Collector iterator
+    :return: Collector iterator
+    :raises HarvestingError: If an async collector is found
+    """
+    for collector in collectors:
+        if isinstance(collector, AsyncCollector):
+            name = type(collector).__name__
+            raise HarvestingError(f'cannot synchronously collect from async collector `{name}`, use `amerge` instead')
+        yield collector
+
+
+def _put(entries: queue.Queue, stop: threading.Event, item: Any) -> bool:
+    """Wait for room in the queue until the item is sent or the consumer stops.
+
+    :return: True if the item was sent, False if the consumer stopped
+    """
+    while not stop.is_set():
+        with contextlib.suppress(queue.Full):
+            entries.put(item, timeout=COLLECTORS_POLL_TIMEOUT)
+            return True
+    return False
+
+
+def _drain(collector: Collector, entries: queue.Queue, stop: threading.Event):
+    """Send the collected entries to the queue. Executed in a worker thread."""
+    try:
+        for entry in collector:
+            if not _put(entries, stop, entry):
+                return
+    except Exception as e:
+        _put(entries, stop, _Failure(collector, e))
+    finally:
+        _put(entries, stop, _DONE)
+
+
+def _parallel(collectors: Iterable[Collector], workers: int, buffer: int) -> Iterator[JSON]:
+    """Run the collectors in a thread pool and yield the entries as they arrive.
+
+    :param collectors: Collector iterator
+    :param workers: Max number of collectors running at once
+    :param buffer: Max number of collected entries waiting to be consumed
+    :return: Merged collected entries
+    :raises HarvestingError: If any collector fails
+    """
+    # validate all the collectors before any of them starts
+    collectors = list(_synchronous(collectors))
+    stop = threading.Event()
+    entries: queue.Queue = queue.Queue(maxsize=buffer)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = len([executor.submit(_drain, collector, entries, stop) for collector in collectors])
+
+        try:
+            while pending:
+                item = entries.get()
+                if item is _DONE:
+                    pending -= 1
+                elif isinstance(item, _Failure):
+                    raise item()
+                else:
+                    yield item
+        finally:
+            # release the paused collectors if the consumer stops early
+            stop.set()
+
+
+def stream(collectors: Iterable[Collector]) -> Iterator[Tuple[str, JSON]]:
+    """Returns a stream of collected entries tagged with the collector name.
+    Unlike `map` the entries are not kept in memory, so it can be used with collectors of any size.
+
+    Usage:
+
+        for name, entry in stream(load()):
+            ...
+
+    :param collectors: Collector iterator.
+    :return: Iterator of (collector name, entry) pairs.
+    """
+
+    for collected in _synchronous(collectors):
+        name = type(collected).__name__
+        yield from ((name, entry) for entry in collected)
+
+
+def map(collectors: Iterable[Collector]) -> Mapping[str, Iterator[JSON]]:
     """Returns a map of collectors.
     Map collectors using name as key and the metadata content as value list.
+    All the collected entries are kept in memory, use `stream` or `spill` for large collections.
 
     :param collectors: Collector iterator.
     :return: Mapped collected data using the name of collector as key and value with meta provided.
@@ -19,40 +170,315 @@ def map(collectors: Iterator[Collector]) -> Mapping[str, Iterator[JSON]]:
 
     mapped: Any = defaultdict(list)
     # For each collector metadata provided lets parse it and map it.
-    for collected in collectors:
-        mapped[type(collected).__name__] += collected
+    for name, entry in stream(collectors):
+        mapped[name].append(entry)
     return mapped
 
 
-def merge(collectors: Iterator[Collector]) -> Iterator[JSON]:
+class _Spill:
+    """Spill database shared by the collector streams.
+    The connection is closed once every stream is exhausted, closed or garbage collected,
+    and the database is removed if it was created for the call.
+    """
+
+    _conn: Connection
+    _db_path: str
+    _temporary: bool
+    _pending: int
+    _lock: threading.Lock
+
+    def __init__(self, conn: Connection, db_path: str, temporary: bool):
+        self._conn = conn
+        self._db_path = db_path
+        self._temporary = temporary
+        self._pending = 0
+        self._lock = threading.Lock()
+
+    def _entries(self, name: str, done: List[weakref.finalize]) -> Iterator[JSON]:
+        """Stream the spilled entries of a collector in chunks."""
+        try:
+            cursor = self._conn.execute(SPILL_FETCH, (name,))
+            while rows := cursor.fetchmany(COLLECTORS_SPILL_BATCH_SIZE):
+                yield from (JSON(json.loads(entry)) for (entry,) in rows)
+        finally:
+            # the finalizer only releases the stream once
+            done[0]()
+
+    def stream(self, name: str) -> Iterator[JSON]:
+        """Return a lazy stream of the spilled entries of a collector.
+
+        :param name: The collector name
+        :return: Iterator of spilled entries
+        """
+        done: List[weakref.finalize] = []
+        entries = self._entries(name, done)
+        # the streams never started are released when garbage collected
+        done.append(weakref.finalize(entries, self.release))
+        with self._lock:
+            self._pending += 1
+        return entries
+
+    def release(self):
+        """Release a stream, the database is closed after the last stream is released."""
+        with self._lock:
+            self._pending -= 1
+            if self._pending <= 0:
+                self.close()
+
+    def close(self):
+        """Close the connection and remove the database if it was created for the call."""
+        self._conn.close()
+        if self._temporary:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(self._db_path)
+
+
+def _temporary() -> str:
+    """Create a new temporary database file."""
+    descriptor, db_path = tempfile.mkstemp(prefix=COLLECTORS_SPILL_PREFIX, suffix='.db')
+    os.close(descriptor)
+    return db_path
+
+
+def spill(
+    collectors: Iterable[Collector],
+    db_path: Optional[str] = None,
+    batch_size: int = COLLECTORS_SPILL_BATCH_SIZE,
+) -> Mapping[str, Iterator[JSON]]:
+    """Returns a map of collectors spilled to a local database.
+    The collected entries are stored in batches while collected, and each mapped value lazily streams
+    the entries back from disk, so the memory usage remains constant regardless of the collection size.
+    By default a temporary database is created for each call and removed once all the streams are released.
+    If a database path is given, any entry spilled by a previous call to the same database is removed.
+
+    Usage:
+
+        mapped = spill(load())
+        for entry in mapped['File']:
+            ...
+
+    :param collectors: Collector iterator.
+    :param db_path: Sqlite file path to spill the entries, by default a temporary database is used.
+    :param batch_size: Max number of entries inserted in the same transaction.
+    :return: Mapped collected data using the name of collector as key and value with meta provided.
+    :raises DatabaseError: If the database connection cannot be created
+    """
+
+    temporary = db_path is None
+    db_path = _temporary() if db_path is None else db_path
+    Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+    conn = cache.tune(cache.connect(db_path))
+    spilled = _Spill(conn, db_path, temporary)
+
+    try:
+        with conn:
+            conn.execute(SPILL_MIGRATE)
+            conn.execute(SPILL_INDEX)
+            conn.execute(SPILL_CLEAR)
+
+        entries = stream(collectors)
+        while batch := list(itertools.islice(entries, batch_size)):
+            with conn:
+                rows = ((name, json.dumps(dict(entry))) for name, entry in batch)
+                conn.executemany(SPILL_INSERT, rows)
+
+        names = [name for (name,) in conn.execute(SPILL_NAMES)]
+    except BaseException:
+        spilled.close()
+        raise
+
+    if not names:
+        spilled.close()
+    return {name: spilled.stream(name) for name in names}
+
+
+def merge(
+    collectors: Iterable[Collector],
+    workers: Optional[int] = None,
+    buffer: int = COLLECTORS_QUEUE_SIZE,
+) -> Iterator[JSON]:
     """Returns merged collectors.
+    By default the collectors are consumed sequentially in order.
+    If workers are set the collectors run concurrently in a thread pool and the entries are yielded as they arrive,
+    so a slow collector does not stall the others. The collectors are paused when `buffer` entries are waiting.
+
+    Usage:
+
+        # run up to 4 collectors at once
+        for entry in merge(load(), workers=4):
+            ...
 
     :param collectors: Collector iterator
+    :param workers: Max number of collectors running at once, by default the collectors run sequentially
+    :param buffer: Max number of collected entries waiting to be consumed
     :return: Merged collectors
+    :raises HarvestingError: If any collector fails during parallel collection or an async collector is found
+    """
+
+    if workers is None:
+        return itertools.chain.from_iterable(_synchronous(collectors))
+    return _parallel(collectors, workers, buffer)
+
+
+async def _acollect(collector: Union[Collector, AsyncCollector]) -> AsyncIterator[JSON]:
+    """Adapt sync or async collectors to be consumed in the event loop.
+    Each entry from a sync collector is collected in a worker thread to avoid blocking the event loop.
     """
+    if isinstance(collector, AsyncCollector):
+        async for entry in collector:
+            yield entry
+        return
+
+    iterator = iter(collector)
+    while (entry := await asyncio.to_thread(next, iterator, _DONE)) is not _DONE:
+        yield entry
+
+
+async def _apump(collector: Union[Collector, AsyncCollector], entries: asyncio.Queue):
+    """Asynchronous counterpart of _drain.
+    Nothing else is sent once cancelled, since the consumer is gone and the queue could be full.
+    """
+    try:
+        async for entry in _acollect(collector):
+            await entries.put(entry)
+    except Exception as e:
+        await entries.put(_Failure(collector, e))
+    await entries.put(_DONE)
+
+
+async def amerge(
+    collectors: Iterable[Union[Collector, AsyncCollector]],
+    buffer: int = COLLECTORS_QUEUE_SIZE,
+) -> AsyncIterator[JSON]:
+    """Asynchronous counterpart of merge.
+    All the collectors run concurrently in the event loop and the entries are yielded as they arrive.
+    Sync collectors are supported and consumed in worker threads.
+
+    Usage:
+
+        async for entry in amerge(load(asynchronous=True)):
+            ...
+
+    :param collectors: Sync or async collector iterator
+    :param buffer: Max number of collected entries waiting to be consumed
+    :return: Async iterator of merged collected entries
+    :raises HarvestingError: If any collector fails
+    """
+
+    entries: asyncio.Queue = asyncio.Queue(maxsize=buffer)
+    tasks = [asyncio.create_task(_apump(collector, entries)) for collector in collectors]
+    pending = len(tasks)
+
+    try:
+        while pending:
+            item = await entries.get()
+            if item is _DONE:
+                pending -= 1
+            elif isinstance(item, _Failure):
+                raise item()
+            else:
+                yield item
+    finally:
+        # stop the running collectors if the consumer stops early
+        for task in tasks:
+            task.cancel()
+        # wait the cancelled collectors, so no task is left pending
+        await asyncio.gather(*tasks, return_exceptions=True)
 
-    return itertools.chain.from_iterable(collectors)
 
+def _is_collector(obj: Any) -> bool:
+    return inspect.isclass(obj) and not inspect.isabstract(obj) and issubclass(obj, Collector | AsyncCollector)
 
-def load(path: str = COLLECTORS_PATH) -> Iterator[Collector]:
-    """Import submodules from a given path and yield module object.
+
+def _import(path: str) -> Tuple[CollectorType, ...]:
+    """Import the submodules from a given path and return the collector classes found.
 
     :param path: The path to search for submodules.
-    :return: Iterator of matched modules.
+    :return: The collector classes sorted by module and class name.
     """
 
+    discovered: List[CollectorType] = []
     for module_finder, name, _ in pkgutil.iter_modules([path]):
-        found_module = module_finder.find_module(name)  # type: ignore
+        spec = module_finder.find_spec(name)  # type: ignore
         # if not module loader available just continue
-        if not found_module:
+        if spec is None or spec.loader is None:
             continue
 
-        module = found_module.load_module(name)
-        # Get the module collector class
-        for _, obj in inspect.getmembers(module):
-            if not inspect.isabstract(obj) and inspect.isclass(obj):
-                if issubclass(obj, Collector):
-                    yield obj()  # yield an instance of collector
+        module = importlib.util.module_from_spec(spec)
+        # registered before execution as expected by import system, eg: to pickle the collected entries
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+        # Get the module collector classes
+        members = sorted(vars(module).items())
+        discovered.extend(obj for _, obj in members if _is_collector(obj))
+
+    return tuple(discovered)
+
+
+def _discover(path: str) -> Tuple[CollectorType, ...]:
+    """Return the collector classes from a given path.
+    The discovered classes are cached and the modules are only imported again if the directory is modified.
+
+    :param path: The path to search for submodules.
+    :return: The collector classes.
+    """
+
+    directory = Path(path).resolve()
+    if not directory.is_dir():
+        return ()
+
+    mtime = directory.stat().st_mtime_ns
+    with _lock:
+        cached = _discovered.get(directory)
+        if cached is None or cached[0] != mtime:
+            cached = (mtime, _import(path))
+            _discovered[directory] = cached
+        return cached[1]
+
+
+@functools.cache
+def _plugins() -> Tuple[CollectorType, ...]:
+    """Return the collector classes registered by installed packages in the collectors entry point group.
+
+    Usage:
+
+        # pyproject.toml
+        [project.entry-points."nucleus.collectors"]
+        movies = "my_package.collectors:Movies"
+
+    :return: The registered collector classes.
+    """
+
+    registered = (entry_point.load() for entry_point in entry_points(group=COLLECTORS_ENTRY_POINT))
+    return tuple(obj for obj in registered if _is_collector(obj))
+
+
+def load(
+    path: str = COLLECTORS_PATH,
+    plugins: bool = True,
+    asynchronous: bool = False,
+) -> Iterator[Union[Collector, AsyncCollector]]:
+    """Import submodules from a given path and yield an instance of each collector found.
+    The collectors registered by installed packages under the `nucleus.collectors` entry point are yielded next.
+    The discovered classes are cached, so the modules are not executed again until the directory is modified.
+    Async collectors can only be consumed by `amerge`, so they are only yielded if requested.
+
+    Usage:
+
+        # load sync and async collectors
+        async for entry in amerge(load(asynchronous=True)):
+            ...
+
+    :param path: The path to search for submodules.
+    :param plugins: If True, the collectors registered as entry points are also yielded.
+    :param asynchronous: If True, the async collectors are also yielded.
+    :return: Iterator of collector instances.
+    """
+
+    discovered = _discover(path) + (_plugins() if plugins else ())
+    for collector in discovered:
+        if asynchronous or not issubclass(collector, AsyncCollector):
+            yield collector()  # yield an instance of collector
 
 
-__all__ = ('load', 'map', 'merge')
+__all__ = ('load', 'map', 'stream', 'spill', 'merge', 'amerge')
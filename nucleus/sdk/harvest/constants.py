@@ -3,10 +3,62 @@ from nucleus.core.constants import ROOT_DIR
 
 # Runtime directories
 COLLECTORS_PATH = f'{ROOT_DIR}/collectors/'
+# Entry point group used by installed packages to register collectors
+COLLECTORS_ENTRY_POINT = 'nucleus.collectors'
 MODELS_PATH = './.models/'
 
+# Parallel collection settings
+# Max number of collected entries waiting to be consumed,
+# the collectors are paused when the queue is full until the entries are consumed.
+COLLECTORS_QUEUE_SIZE = 1000
+# Seconds waited by a paused collector before checking if the consumer stopped
+COLLECTORS_POLL_TIMEOUT = 0.1
+# Collected entries spilled to disk grouped by collector,
+# by default each spill uses its own temporary database named with this prefix.
+COLLECTORS_SPILL_PREFIX = 'nucleus-collected-'
+COLLECTORS_SPILL_BATCH_SIZE = 1000
+# Max number of models inserted in the same transaction
+MODELS_BATCH_SIZE = 1000
+# Max number of models unpickled at once while iterating
+MODELS_FETCH_SIZE = 1000
+
+# Snapshot header: magic bytes, codec tag and model schema version
+# Snapshots stored without header are legacy pickle snapshots
+SNAPSHOT_MAGIC = b'NS'
+SNAPSHOT_HEADER = '>2sBH'
+
 # Query constants
 # Insert template fields are ordered based on model ordered dict field.
-MIGRATE = """CREATE TABLE IF NOT EXISTS %s(m %s);"""
-INSERT = """INSERT INTO %s VALUES(?)"""
-FETCH = """SELECT m FROM %s"""
+# The snapshot column type is the name of the converter used to decode the snapshots
+MIGRATE = """CREATE TABLE IF NOT EXISTS %s(m "%s");"""
+# Sqlite cannot change a column type, so the tables declared with a previous type are copied to a new table
+REBUILD = """
+BEGIN;
+ALTER TABLE %(alias)s RENAME TO %(alias)s_legacy;
+CREATE TABLE %(alias)s(m "%(snapshot)s");
+INSERT INTO %(alias)s(rowid, m) SELECT rowid, m FROM %(alias)s_legacy;
+DROP TABLE %(alias)s_legacy;
+COMMIT;
+"""
+INSERT = """INSERT INTO %s(%s) VALUES(%s)"""
+# A negative limit means no limit in sqlite
+FETCH_RANGE = """SELECT m FROM %s LIMIT ? OFFSET ?"""
+# Keyset pagination, rowid lookups are O(log n) regardless of the page position
+FETCH_PAGE = """SELECT rowid, m FROM %s WHERE rowid > ? ORDER BY rowid LIMIT ?"""
+FETCH_WHERE = """SELECT m FROM %s WHERE %s"""
+EXISTS = """SELECT EXISTS(SELECT 1 FROM %s)"""
+# Indexed columns projected from model fields
+COLUMNS = """PRAGMA table_info(%s)"""
+ADD_COLUMN = """ALTER TABLE %s ADD COLUMN %s"""
+ADD_INDEX = """CREATE INDEX IF NOT EXISTS %s_%s ON %s(%s)"""
+UPDATE = """UPDATE %s SET %s WHERE rowid = ?"""
+UPDATE_SNAPSHOT = """UPDATE %s SET m = ? WHERE rowid = ?"""
+
+# Spilled collected entries
+SPILL_MIGRATE = """CREATE TABLE IF NOT EXISTS collected(collector TEXT, entry TEXT);"""
+SPILL_INDEX = """CREATE INDEX IF NOT EXISTS collected_collector ON collected(collector)"""
+SPILL_CLEAR = """DELETE FROM collected"""
+SPILL_INSERT = """INSERT INTO collected(collector, entry) VALUES(?, ?)"""
+# Collector names in the order they were first collected
+SPILL_NAMES = """SELECT collector FROM collected GROUP BY collector ORDER BY MIN(rowid)"""
+SPILL_FETCH = """SELECT entry FROM collected WHERE collector = ? ORDER BY rowid"""
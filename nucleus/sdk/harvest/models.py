@@ -1,18 +1,97 @@
 from __future__ import annotations
 
-import pickle
+import functools
+import itertools
 import sqlite3
+import threading
 
 import pydantic
 from pydantic import ValidationError
 
 import nucleus.core.cache as cache
 import nucleus.core.decorators as decorators
-from nucleus.core.cache import Connection
-from nucleus.core.types import Any, Generic, Iterator, Path, T
+from nucleus.core.cache import Connection, Cursor
+from nucleus.core.types import Any, Generic, Iterable, Iterator, List, Optional, Path, Raw, T, Tuple
 from nucleus.sdk.exceptions import ModelManagerError, ModelValidationError
 
-from .constants import FETCH, INSERT, MIGRATE, MODELS_PATH
+from . import codecs
+from .constants import (
+    ADD_COLUMN,
+    ADD_INDEX,
+    COLUMNS,
+    EXISTS,
+    FETCH_PAGE,
+    FETCH_RANGE,
+    FETCH_WHERE,
+    INSERT,
+    MIGRATE,
+    MODELS_BATCH_SIZE,
+    MODELS_FETCH_SIZE,
+    MODELS_PATH,
+    REBUILD,
+    UPDATE,
+    UPDATE_SNAPSHOT,
+)
+
+
+def _stream(cursor: Cursor, chunk_size: int) -> Iterator[Any]:
+    """Fetch the rows in chunks, so only one chunk of snapshots is unpickled in memory at once."""
+    while rows := cursor.fetchmany(chunk_size):
+        yield from (row[0] for row in rows)
+
+
+def _keyset(model: _Manager, page: List[Any], chunk_size: int) -> Iterator[Any]:
+    """Walk the table pages using the last seen rowid as the start of the next page.
+    The connection is resolved for each page, so the pages can be consumed from any thread.
+    """
+    while page:
+        yield from (snapshot for _, snapshot in page)
+        (last_rowid, _) = page[-1]
+        page = model._conn.execute(FETCH_PAGE % model._alias, (last_rowid, chunk_size)).fetchall()
+
+
+def _column(value: Any) -> Any:
+    """Adapt a field value to be stored in a projected column."""
+    if value is None or isinstance(value, int | float | str | bytes):
+        return value
+    return str(value)
+
+
+def _row(entry: Base, columns: Tuple[str, ...]) -> Tuple[Any, ...]:
+    """Return the snapshot followed by the projected column values."""
+    return (entry, *(_column(getattr(entry, column)) for column in columns))
+
+
+def _insert(alias: str, columns: Tuple[str, ...]) -> str:
+    return INSERT % (alias, ', '.join(('m', *columns)), ', '.join('?' * (len(columns) + 1)))
+
+
+def _migrate(conn: Connection, alias: str, snapshot: str, columns: Tuple[str, ...]) -> bool:
+    """Create the table and the indexed columns not created yet.
+
+    :param conn: The model database connection
+    :param alias: The model table name
+    :param snapshot: The snapshot column type
+    :param columns: The indexed columns
+    :return: True if the existing entries need to be reindexed, False otherwise
+    """
+    conn.execute(MIGRATE % (alias, snapshot))
+    existing = {info[1]: info[2] for info in conn.execute(COLUMNS % alias)}
+    if existing['m'] != snapshot:
+        # the table was declared with a previous snapshot type, the indexed columns are computed again
+        conn.executescript(REBUILD % {'alias': alias, 'snapshot': snapshot})
+        existing = {info[1]: info[2] for info in conn.execute(COLUMNS % alias)}
+
+    missing = [column for column in columns if column not in existing]
+
+    for column in missing:
+        conn.execute(ADD_COLUMN % (alias, column))
+    for column in columns:
+        conn.execute(ADD_INDEX % (alias, column, alias, column))
+
+    # new columns are empty for the entries stored before the migration
+    (populated,) = conn.execute(EXISTS % alias).fetchone()
+    return bool(missing and populated)
 
 
 class _Manager(pydantic.main.ModelMetaclass):
@@ -20,12 +99,33 @@ class _Manager(pydantic.main.ModelMetaclass):
 
     Each database file is created based on the class name.
     This metaclass prepare the connection to query to the right database according to the class name.
+    Sqlite connections cannot be shared between threads, so each thread gets its own connection to the database.
+    The database is lazily created and migrated on first use, so declaring models has no IO cost.
     """
 
+    def _prepare(cls):
+        """Create the model database and run the migrations once per process."""
+        with cls._lock:
+            if cls._ready:
+                return
+
+            # ensure that model directory exists
+            Path(MODELS_PATH).mkdir(parents=True, exist_ok=True)
+            cls._stale = _migrate(cls._provider(), cls._alias, cls._snapshot, cls._columns)
+            cls._ready = True
+
+    @property
+    def _conn(cls) -> Connection:
+        """Return the model database connection for the current thread."""
+        if not cls._ready:
+            cls._prepare()
+        return cls._provider()
+
     def __new__(mcs, name: Any, bases: Any, attrs: Any, **kwargs: Any):
-        """Start a new connection to cache database and ensure that the database is ready to receive requests."""
-        db_path = Path(MODELS_PATH)
-        db_file = f'{db_path}/{name}.db'
+        """Prepare the connection provider to cache database for the new model.
+        No database is touched until the model is first queried or saved.
+        """
+        db_file = f'{Path(MODELS_PATH)}/{name}.db'
 
         super_new = super().__new__
         # Ensure initialization is only performed for subclasses of _Model
@@ -33,21 +133,36 @@ class _Manager(pydantic.main.ModelMetaclass):
         if not is_subclass_instance:
             return super_new(mcs, name, bases, attrs, **kwargs)
 
-        # ensure that model directory exists
-        if not db_path.exists():
-            db_path.mkdir(parents=True)
-
-        # connect and run migrations for model database
-        conn = cache.connect(db_path=db_file)
-        conn.execute(MIGRATE % (name, name))
+        # connect lazily to model database, each thread gets its own tuned connection
+        provider = cache.Provider(db_file, setup=cache.tune)
         # add new attributes to class
-        new_attrs = {**{'_conn': conn, '_alias': name}, **attrs}
-        return super_new(mcs, name, bases, new_attrs, **kwargs)
+        new_attrs = {**{'_provider': provider, '_alias': name}, **attrs}
+        cls = super_new(mcs, name, bases, new_attrs, **kwargs)
+
+        # project the indexed fields declared in config as table columns
+        columns = tuple(getattr(cls.__config__, 'indexes', ()))
+        unknown = set(columns) - set(cls.__fields__)
+        if unknown:
+            raise ModelManagerError(f'cannot index undeclared fields {unknown} in model `{name}`')
+
+        # register once how the model snapshots are stored and loaded
+        # converters are global to the process, so the type is qualified to not clash with models named alike
+        snapshot = f'{cls.__module__}.{name}'
+        sqlite3.register_converter(snapshot, functools.partial(codecs.decode, cls))
+        sqlite3.register_adapter(cls, codecs.encode)
+
+        # migrations for model database are deferred until first use
+        cls._snapshot = snapshot
+        cls._columns = columns
+        cls._stale = False
+        cls._ready = False
+        cls._lock = threading.Lock()
+        return cls
 
 
 class Base(pydantic.BaseModel, metaclass=_Manager):
     """Base model provides efficient model persistence and data validation capabilities.
-    The persistence mechanism relies on sqlite and pickle, allowing the entire model to be stored as a snapshot
+    The persistence mechanism relies on sqlite and snapshot codecs, allowing the entire model to be stored as a snapshot
 
     Usage:
 
@@ -60,10 +175,28 @@ class Base(pydantic.BaseModel, metaclass=_Manager):
 
         # we should be able to retrieve the same model
         assert MyModel.all() == [stored_model] # True
+
+        # project fields into indexed columns to query them
+        class MyIndexedModel(BaseModel):
+            title: str
+
+            class Config:
+                indexes = ('title',)
+
+        MyIndexedModel.get(title="Model")
     """
 
     _alias: str
-    _conn: Connection
+    _provider: cache.Provider
+    # the snapshot column type, used to find the snapshot converter
+    _snapshot: str
+    # the fields projected as indexed columns
+    _columns: Tuple[str, ...]
+    # True if the entries stored before the columns were added are not indexed yet
+    _stale: bool
+    # True once the model database has been created and migrated
+    _ready: bool
+    _lock: threading.Lock
 
     class Config:
         # Frozen model behavior
@@ -73,6 +206,9 @@ class Base(pydantic.BaseModel, metaclass=_Manager):
         use_enum_values = True
         arbitrary_types_allowed = True
         anystr_strip_whitespace = True
+        # Snapshot codec and model schema version stored in each snapshot
+        codec = codecs.Pickle()
+        version = 0
 
     def __init__(self, *args: Any, **kwargs: Any):
         try:
@@ -80,39 +216,178 @@ class Base(pydantic.BaseModel, metaclass=_Manager):
         except ValidationError as e:
             raise ModelValidationError(f'raised exception during model initialization: {str(e)}')
 
-        sqlite3.register_converter(self._alias, pickle.loads)
-        sqlite3.register_adapter(type(self), pickle.dumps)
+    @classmethod
+    def upgrade(cls, data: Raw, version: int) -> Raw:
+        """Upgrade the data decoded from a snapshot stored with a previous model schema version.
+        By default the data is returned as is, override it to handle model schema changes.
+
+        :param data: The decoded snapshot data
+        :param version: The model schema version used to store the snapshot
+        :return: The data matching the current model schema
+        """
+        return data
+
+    @classmethod
+    @decorators.proxy_exception(
+        expected=sqlite3.ProgrammingError,
+        target=ModelManagerError,
+    )
+    def migrate(cls) -> int:
+        """Re-encode all the stored snapshots using the current model codec and schema version.
+        Allows to migrate existing databases, eg: from legacy pickle snapshots to JSON.
+
+        :return: The number of migrated entries
+        :raises ModelManagerError: If there is an error updating entries
+        """
+
+        migrated = 0
+        conn = cls._conn
+
+        with conn:
+            page = conn.execute(FETCH_PAGE % cls._alias, (0, MODELS_FETCH_SIZE)).fetchall()
+            while page:
+                values = [(codecs.encode(entry), rowid) for rowid, entry in page]
+                conn.executemany(UPDATE_SNAPSHOT % cls._alias, values)
+                migrated += len(values)
+                (last_rowid, _) = page[-1]
+                page = conn.execute(FETCH_PAGE % cls._alias, (last_rowid, MODELS_FETCH_SIZE)).fetchall()
+
+        return migrated
+
+    @classmethod
+    @decorators.proxy_exception(
+        expected=sqlite3.ProgrammingError,
+        target=ModelManagerError,
+    )
+    def reindex(cls):
+        """Compute the indexed columns for all the entries from their snapshots.
+        Reindex is automatically performed before filtering when new indexed columns were added to existing entries.
+
+        :raises ModelManagerError: If there is an error updating entries
+        """
+
+        assignments = ', '.join(f'{column} = ?' for column in cls._columns)
+        conn = cls._conn
+
+        with conn:
+            page = conn.execute(FETCH_PAGE % cls._alias, (0, MODELS_FETCH_SIZE)).fetchall()
+            while page:
+                values = ((*_row(entry, cls._columns)[1:], rowid) for rowid, entry in page)
+                conn.executemany(UPDATE % (cls._alias, assignments), values)
+                (last_rowid, _) = page[-1]
+                page = conn.execute(FETCH_PAGE % cls._alias, (last_rowid, MODELS_FETCH_SIZE)).fetchall()
+
+        cls._stale = False
 
     @classmethod
     @decorators.proxy_exception(
         expected=sqlite3.ProgrammingError,
         target=ModelManagerError,
     )
-    def get(cls) -> Base:
-        """Exec query and fetch first entry from local database.
+    def filter(cls, **criteria: Any) -> Iterator[Base]:
+        """Exec query and stream the entries matching all the criteria from local database.
+        The criteria over indexed fields are resolved by database indexes,
+        any other field is matched while streaming the entries.
+
+        Usage:
+
+            # fetch all the entries with the given title
+            entries = MyModel.filter(title="Model")
+
+        :param criteria: The field values to match
+        :return: The matching snapshots
+        :raises ModelManagerError: If there is an error fetching entries or a criteria field is not declared
+        """
+
+        unknown = set(criteria) - set(cls.__fields__)
+        if unknown:
+            raise ModelManagerError(f'cannot filter by undeclared fields {unknown} in model `{cls._alias}`')
+
+        # the migration run on first use may flag the entries as stale
+        conn = cls._conn
+        if cls._stale:
+            cls.reindex()
+
+        indexed = {k: _column(v) for k, v in criteria.items() if k in cls._columns}
+        scanned = {k: v for k, v in criteria.items() if k not in cls._columns}
+        # an empty predicate matches all the entries
+        predicate = ' AND '.join(f'{column} = ?' for column in indexed) or '1'
 
-        :return: First registered snapshot
-        :raises ModelManagerError: If there is an error fetching entry
+        response = conn.execute(FETCH_WHERE % (cls._alias, predicate), tuple(indexed.values()))
+        entries = _stream(response, MODELS_FETCH_SIZE)
+        return (e for e in entries if all(getattr(e, k) == v for k, v in scanned.items()))
+
+    @classmethod
+    def get(cls, **criteria: Any) -> Base:
+        """Exec query and fetch first entry matching all the criteria from local database.
+
+        Usage:
+
+            # fetch the first stored entry
+            entry = MyModel.get()
+            # fetch the first entry with the given title
+            entry = MyModel.get(title="Model")
+
+        :param criteria: The field values to match
+        :return: First matching snapshot
+        :raises ModelManagerError: If there is an error fetching entry or no entry matches
         """
 
-        response = cls._conn.execute(FETCH % cls._alias)
-        row = response.fetchone()
-        return row[0]
+        entry = next(cls.filter(**criteria), None)
+        if entry is None:
+            raise ModelManagerError(f'no entry found in model `{cls._alias}` matching {criteria}')
+        return entry
+
+    @classmethod
+    @decorators.proxy_exception(
+        expected=sqlite3.ProgrammingError,
+        target=ModelManagerError,
+    )
+    def all(
+        cls,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        chunk_size: int = MODELS_FETCH_SIZE,
+    ) -> Iterator[Base]:
+        """Exec query and stream a list of data from local database.
+
+        Usage:
+
+            # fetch the second page of 100 entries
+            entries = MyModel.all(limit=100, offset=100)
+
+        :param limit: Max number of entries to fetch, by default all the entries are fetched
+        :param offset: Number of entries to skip
+        :param chunk_size: Max number of entries fetched from database at once
+        :return: all registered snapshots
+        :raises ModelManagerError: If there is an error fetching entries
+        """
+        limit = -1 if limit is None else limit
+        response = cls._conn.execute(FETCH_RANGE % cls._alias, (limit, offset))
+        return _stream(response, chunk_size)
 
     @classmethod
     @decorators.proxy_exception(
         expected=sqlite3.ProgrammingError,
         target=ModelManagerError,
     )
-    def all(cls) -> Iterator[Base]:
-        """Exec query and fetch a list of data from local database.
+    def iter_all(cls, chunk_size: int = MODELS_FETCH_SIZE) -> Iterator[Base]:
+        """Exec paginated queries to walk all the data from local database.
+        Unlike `all` no cursor is kept open between pages, and each page is fetched by rowid.
+        This allows walking millions of snapshots with flat memory usage.
 
+        Usage:
+
+            for entry in MyModel.iter_all(chunk_size=500):
+                ...
+
+        :param chunk_size: Max number of entries fetched per page
         :return: all registered snapshots
         :raises ModelManagerError: If there is an error fetching entries
         """
-        response = cls._conn.execute(FETCH % cls._alias)
-        rows = response.fetchall()
-        return map(lambda r: r[0], rows)
+        # the first page is fetched eagerly to raise the errors early
+        page = cls._conn.execute(FETCH_PAGE % cls._alias, (0, chunk_size)).fetchall()
+        return _keyset(cls, page, chunk_size)
 
     @decorators.proxy_exception(
         expected=sqlite3.ProgrammingError,
@@ -126,8 +401,58 @@ class Base(pydantic.BaseModel, metaclass=_Manager):
         """
 
         # https://docs.python.org/3/library/sqlite3.html#sqlite3.Cursor.lastrowid
-        cursor = self._conn.execute(INSERT % self._alias, (self,))
-        return cursor.rowcount > 0
+        conn = type(self)._conn
+        with conn:
+            cursor = conn.execute(_insert(self._alias, self._columns), _row(self, self._columns))
+            return cursor.rowcount > 0
+
+    @classmethod
+    @decorators.proxy_exception(
+        expected=sqlite3.ProgrammingError,
+        target=ModelManagerError,
+    )
+    def save_many(cls, entries: Iterable[Base], batch_size: int = MODELS_BATCH_SIZE) -> int:
+        """Exec bulk insertion query into local database.
+        Each batch is inserted in one transaction, so the disk is synced once per batch instead of once per entry.
+
+        Usage:
+
+            # store all the collected models
+            stored = MyModel.save_many(MyModel(**data) for data in collected)
+
+        :param entries: The models to store
+        :param batch_size: Max number of models inserted in the same transaction
+        :return: The number of stored entries
+        :raises ModelManagerError: If there is an error saving entries
+        """
+
+        stored = 0
+        conn = cls._conn
+        iterator = iter(entries)
+        while batch := list(itertools.islice(iterator, batch_size)):
+            with conn:
+                rows = (_row(entry, cls._columns) for entry in batch)
+                cursor = conn.executemany(_insert(cls._alias, cls._columns), rows)
+                stored += cursor.rowcount
+        return stored
+
+    @classmethod
+    def load(cls, entries: Iterable[Raw], batch_size: int = MODELS_BATCH_SIZE) -> int:
+        """Bulk load trusted data into local database.
+        The models are built without validation, so this must only be used with data already validated,
+        eg: data exported from another model database.
+
+        Usage:
+
+            # load the data exported from another instance
+            stored = MyModel.load(exported)
+
+        :param entries: The models data to store
+        :param batch_size: Max number of models inserted in the same transaction
+        :return: The number of stored entries
+        :raises ModelManagerError: If there is an error saving entries
+        """
+        return cls.save_many((cls.construct(**entry) for entry in entries), batch_size)
 
 
 class Model(Base):
@@ -3,7 +3,7 @@ from __future__ import annotations
 # Convention for importing constants/types
 from abc import ABC, abstractmethod
 
-from nucleus.core.types import JSON, Iterator
+from nucleus.core.types import JSON, Any, AsyncIterator, Iterator, Protocol, Type
 
 
 class Collector(ABC):
@@ -32,4 +32,57 @@ class Collector(ABC):
         ...
 
 
-__all__ = ('Collector',)
+class AsyncCollector(ABC):
+    """AsyncCollector define the asynchronous counterpart of Collector.
+    Subclasses should implement the __aiter__ method to collect metadata from asynchronous data inputs, eg: http APIs.
+    Async collectors are only consumed by `amerge`.
+
+    Usage:
+
+        class Api(AsyncCollector):
+
+            async def __aiter__(self):
+                async with aiohttp.ClientSession() as session:
+                    async with session.get('https://example.org/movies') as response:
+                        for data in await response.json():
+                            yield JSON(data)
+
+    """
+
+    @abstractmethod
+    def __aiter__(self) -> AsyncIterator[JSON]:
+        """Collect metadata from any kind of data input and return an async iterator.
+
+        :return: The async iterable JSON with data to process.
+        """
+        ...
+
+
+class Codec(Protocol):
+    """Codec define how model snapshots are encoded to be stored in the local database.
+    Each codec is identified by a unique tag stored in the snapshot header.
+    Use this class to create snapshot codec subtypes.
+    """
+
+    tag: int
+
+    def encode(self, model: Any) -> bytes:
+        """Encode the model as snapshot payload.
+
+        :param model: The model to encode
+        :return: The encoded payload
+        """
+        ...
+
+    def decode(self, model_type: Type[Any], payload: bytes, version: int) -> Any:
+        """Decode the snapshot payload as model.
+
+        :param model_type: The model class
+        :param payload: The encoded payload
+        :param version: The model schema version used to encode the payload
+        :return: The decoded model
+        """
+        ...
+
+
+__all__ = ('Collector', 'AsyncCollector', 'Codec')
@@ -2,7 +2,7 @@ from .engines import ImageEngine, VideoEngine
 from .image import Coord, Crop, Resampling, Resize
 from .process import engine
 from .types import Engine, File, Introspection
-from .video import BR, FPS, H264, HEVC, HLS, VP9, Bitrate, Copy, Custom, FrameSize, Screen, probe
+from .video import BR, FPS, H264, HEVC, HLS, VP9, Bitrate, Copy, Custom, FrameSize, Progress, Screen, probe
 
 __all__ = [
     'Coord',
@@ -27,4 +27,5 @@ __all__ = [
     'VideoEngine',
     'engine',
     'probe',
+    'Progress',
 ]
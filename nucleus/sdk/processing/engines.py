@@ -1,19 +1,56 @@
 from __future__ import annotations
 
+import concurrent.futures
+import fractions
 import inspect
 import mimetypes
+import os
 import re
+import shlex
+import tempfile
 from collections import ChainMap
+from collections.abc import Container
 
+import ffmpeg
 import PIL.Image
 from ffmpeg.nodes import FilterableStream as FFMPEG
 from PIL.Image import Image as Pillow
 
+import nucleus.core.subprocess as subprocess
 import nucleus.sdk.processing as processing
-from nucleus.core.types import Any, Dynamic, Path, no_type_check
-from nucleus.sdk.exceptions import ProcessingEngineError
+from nucleus.core.types import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dynamic,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Path,
+    Raw,
+    Settings,
+    no_type_check,
+)
+from nucleus.sdk.exceptions import FFProbeError, ProcessingEngineError
 
 from .types import Engine, File, Introspection
+from .video.codecs import Copy
+from .video.constants import (
+    CHUNK_ENCODED_PREFIX,
+    CHUNK_LIST_NAME,
+    CHUNK_MUXER_ARGS,
+    CHUNK_PROBE_ENTRIES,
+    CHUNK_SEGMENT_NAME,
+    COPY_AUDIO_ARGS,
+    COPY_AUDIO_FILTER_ARGS,
+    COPY_FPS_TOLERANCE,
+    COPY_PROBE_ENTRIES,
+    COPY_VIDEO_ALLOWED_ARGS,
+    COPY_VIDEO_ARGS,
+    FFMPEG_PROGRESS_ARGS,
+)
+from .video.types import Progress
 
 
 @no_type_check
@@ -37,39 +74,254 @@ def _to_object(data: Any) -> Any:
     return data
 
 
+def _rate(value: str) -> float:
+    """Parse a frame rate reported by ffprobe as fraction, eg: 30000/1001."""
+    try:
+        return float(fractions.Fraction(value))
+    except (ValueError, ZeroDivisionError):
+        return 0.0
+
+
+def _bitrate(value: str) -> int:
+    """Parse a bitrate setting in bits per second, eg: 2048k."""
+    return int(value.rstrip('k')) * 1000
+
+
+def _within(stream: Raw, target: Optional[str]) -> bool:
+    """Check if the source stream bitrate does not exceed the target bitrate.
+    The source bitrate is not always reported, eg: matroska streams, so it must be re-encoded to ensure the target.
+    """
+    return target is None or 0 < int(stream.get('bit_rate', 0)) <= _bitrate(target)
+
+
+def _fits(stream: Raw, args: Mapping[str, Any]) -> bool:
+    """Check if the source video stream already satisfies the target size, frame rate and bitrate.
+
+    :param stream: The source video stream probe
+    :param args: The output arguments
+    :return: True if the stream satisfies the target settings, False otherwise
+    """
+    if 's' in args and args['s'] != f'{stream.get("width")}x{stream.get("height")}':
+        return False
+    if 'r' in args and abs(_rate(stream.get('r_frame_rate', '0/0')) - float(args['r'])) > COPY_FPS_TOLERANCE:
+        return False
+    return _within(stream, args.get('b:v', args.get('b')))
+
+
+def _encoders(codecs: Iterable[Container[str]], key: str) -> List[Container[str]]:
+    """Filter the codecs encoding a stream type, eg: c:v, a stream copy does not encode the stream."""
+    return [codec for codec in codecs if dict(codec).get(key, 'copy') != 'copy']  # type: ignore
+
+
+def _copy(args: Raw, stream: str, dropped: Iterable[str]) -> Raw:
+    """Replace the encoding arguments for a stream by a codec copy."""
+    copied = {k: v for k, v in args.items() if k not in dropped}
+    return {**copied, **dict(Copy(stream))}  # type: ignore
+
+
+def _split(source: Path, directory: str, segment_time: float) -> List[str]:
+    """Split the source video stream in segments without re-encoding.
+    Since the stream is copied, each segment is cut on the first keyframe after the segment time.
+
+    :param source: The source path
+    :param directory: The directory to store the segments
+    :param segment_time: The target segment duration in seconds
+    :return: The segment paths in playback order
+    """
+    pattern = os.path.join(directory, CHUNK_SEGMENT_NAME)
+    settings = {'c': 'copy', 'f': 'segment', 'segment_time': segment_time, 'reset_timestamps': 1}
+    ffmpeg.run(ffmpeg.input(source)['v:0'].output(pattern, **settings), quiet=True, overwrite_output=True)
+    return sorted(os.path.join(directory, name) for name in os.listdir(directory))
+
+
+def _encode(segment: str, output: str, args: Raw) -> str:
+    """Encode a segment. Executed in a worker process.
+
+    :param segment: The segment path
+    :param output: The encoded segment path
+    :param args: The video encoding arguments
+    :return: The encoded segment path
+    """
+    ffmpeg.run(ffmpeg.input(segment).output(output, **args), quiet=True, overwrite_output=True)
+    return output
+
+
+def _concat(segments: Iterable[str], directory: str) -> str:
+    """Write the concat demuxer list with the encoded segments.
+
+    :param segments: The encoded segment paths in playback order
+    :param directory: The directory to store the list
+    :return: The list path
+    """
+    listing = os.path.join(directory, CHUNK_LIST_NAME)
+    with open(listing, 'w') as f:
+        f.writelines(f"file '{os.path.abspath(segment)}'\n" for segment in segments)
+    return listing
+
+
 class VideoEngine(Engine):
     """Engine that adapts the FFMPEG Python library to support low-level transcoding.
+    If the source path is known, the source streams already satisfying the configured codec and settings
+    are copied to the output without re-encoding, unless passthrough is disabled.
 
     Usage:
 
         # adapt ffmpeg lib
         library = ffmpeg.input(media.path)
-        return VideoEngine(library)
+        return VideoEngine(library, source=media.path)
     """
 
-    def __init__(self, lib: FFMPEG):
+    _source: Optional[Path]
+    _streams: Optional[List[Raw]]
+    _copy_streams: bool
+
+    def __init__(self, lib: FFMPEG, source: Optional[Path] = None, passthrough: bool = True):
+        self._source = source
+        self._streams = None
+        self._copy_streams = passthrough
         super().__init__(lib)
 
-    def _build_output_args(self) -> ChainMap[Any, Any]:
-        """Join config as output arguments for ffmpeg"""
-        mapped_args = [y for _, y in self.compile()]
-        return ChainMap(*mapped_args)
+    def _probe(self, codec_type: str) -> Optional[Raw]:
+        """Return the first source stream of the given type, the source is probed only once.
+
+        :param codec_type: The stream type, eg: video, audio
+        :return: The stream probe or None if not found
+        """
+        if self._source is None:
+            return None
+
+        if self._streams is None:
+            try:
+                probed = processing.probe(self._source, entries=COPY_PROBE_ENTRIES)
+                self._streams = probed.get('streams', [])
+            except FFProbeError:
+                # the source cannot be probed, so the streams are re-encoded
+                self._streams = []
+
+        return next((s for s in self._streams if s.get('codec_type') == codec_type), None)
+
+    def _passthrough(self, args: Raw, codecs: List[Container[str]]) -> Raw:
+        """Switch to codec copy the source streams already satisfying the target settings.
+
+        :param args: The output arguments
+        :param codecs: The configured codecs
+        :return: The output arguments with the copied streams
+        """
+        if not self._copy_streams:
+            return args
+
+        def compliant(stream: Optional[Raw], key: str) -> bool:
+            # without a codec encoding the stream the target encoder is unknown
+            encoders = _encoders(codecs, key)
+            return stream is not None and bool(encoders) and all(stream.get('codec_name') in c for c in encoders)
+
+        video, audio = self._probe('video'), self._probe('audio')
+        # the filters and any other unknown video argument require decoding the source video stream
+        unaltered = all(k in COPY_VIDEO_ALLOWED_ARGS for k in args)
+        if compliant(video, 'c:v') and unaltered and _fits(video, args):  # type: ignore
+            args = _copy(args, 'v', COPY_VIDEO_ARGS)
+        unaltered = not any(k in COPY_AUDIO_FILTER_ARGS for k in args)
+        if compliant(audio, 'c:a') and unaltered and _within(audio, args.get('b:a')):  # type: ignore
+            args = _copy(args, 'a', COPY_AUDIO_ARGS)
+        return args
+
+    def _build_output_args(self, *settings: Settings) -> Raw:
+        """Join config as output arguments for ffmpeg.
+        The given settings take precedence over the engine settings.
+        """
+        mapped_args = [dict(setting) for setting in settings]
+        mapped_args += [y for _, y in self.compile()]
+        codecs = [s for s in (*settings, *self._settings) if isinstance(s, Container)]
+        return self._passthrough(dict(ChainMap(*mapped_args)), codecs)
 
     def introspect(self, path: Path) -> Introspection:
         # process the arg path or use the current media file path
         (mime_type, _) = mimetypes.guess_type(path)
-        video_introspection = _to_object(processing.probe(path))
+        video_introspection = processing.probe(path)
 
-        # extend introspection with custom video ffprobe
+        # extend introspection with custom video ffprobe, converted on access
         return Introspection(
             size=path.size(),
             type=str(mime_type),
-            **vars(video_introspection),
+            **video_introspection,
         )
 
+    def _command(self, path: Path) -> str:
+        """Compile the ffmpeg command reporting the progress to stdout.
+        The output is overwritten since the process cannot be prompted,
+        and ffmpeg replaces the shell process so it is killed on cancellation.
+        """
+        output = self._library.output(path, **self._build_output_args())
+        args = output.global_args(*FFMPEG_PROGRESS_ARGS).overwrite_output().compile()
+        return f'exec {shlex.join(map(str, args))}'
+
+    async def progress(self, path: Path) -> AsyncIterator[Progress]:
+        """Transcode the media without blocking and yield the progress reported by ffmpeg.
+        The ffmpeg process is killed if the iteration is cancelled or stopped before finishing.
+
+        Usage:
+
+            async for progress in engine.progress(path):
+                if progress.done: ...
+
+        :param path: The output path
+        :return: Async iterator of progress reports
+        :raises ProcessingEngineError: If ffmpeg exits with failure
+        """
+        ipc = subprocess.IPC(self._command(path))
+        proc = await ipc.start()
+        fields: Raw = {}
+        errors: List[str] = []
+
+        try:
+            # each progress report is a block of key=value lines ended by the progress key
+            async for raw_line in ipc.stream():
+                line = raw_line.decode(errors='replace').strip()
+                key, sep, value = line.partition('=')
+                if not sep or ' ' in key:
+                    errors.append(line)
+                    continue
+
+                fields[key] = value
+                if key == 'progress':
+                    yield Progress.parse(fields)
+                    fields = {}
+
+            if await proc.wait():
+                raise ProcessingEngineError(f'error while trying to transcode video: {" ".join(filter(len, errors))}')
+        finally:
+            # preempt the running transcoding
+            ipc.close()
+
+    async def asave(self, path: Path, on_progress: Optional[Callable[[Progress], Any]] = None) -> File:
+        """Asynchronous counterpart of save.
+        The transcoding can be cancelled by cancelling the awaiting task.
+
+        Usage:
+
+            task = asyncio.create_task(engine.asave(path, on_progress=print))
+            # preempt the transcoding
+            task.cancel()
+
+        :param path: The output path
+        :param on_progress: Callable to receive each progress report
+        :return: File object
+        :raises ProcessingEngineError: If any exception is captured during processing
+        """
+        try:
+            async for report in self.progress(path):
+                if on_progress is not None:
+                    on_progress(report)
+
+            # after low level processing happen!!
+            i8t = self.introspect(path)
+            return File(path=path, meta=i8t)
+        except Exception as e:
+            # Standard exceptions raised
+            raise ProcessingEngineError(f'error while trying to save video output: {str(e)}')
+
     def save(self, path: Path) -> File:
-        # TODO allow see ffmpeg progress
-        # TODO pubsub? Observer: Keep reading on event?
+        # use asave to follow the transcoding progress
         try:
             output_args = self._build_output_args()
             # We generate the expected path after transcode
@@ -82,6 +334,92 @@ class VideoEngine(Engine):
             # Standard exceptions raised
             raise ProcessingEngineError(f'error while trying to save video output: {str(e)}')
 
+    def save_many(self, renditions: Mapping[Path, Iterable[Settings]]) -> List[File]:
+        """Store many renditions of the media from one transcoding process.
+        All the outputs are produced by the same ffmpeg command, so the input is decoded once for all renditions.
+        Each rendition extends the engine settings with its own settings, eg: screen size, bitrate.
+
+        Usage:
+
+            # one decode for the whole ladder
+            files = engine.save_many({
+                Path('720.mp4'): (Screen.Q720, Bitrate.B720),
+                Path('1080.mp4'): (Screen.Q1080, Bitrate.B1080),
+            })
+
+        :param renditions: The output paths with their rendition settings
+        :return: One File object per rendition in the same order
+        :raises ProcessingEngineError: If any exception is captured during processing
+        """
+        try:
+            outputs = (
+                self._library.output(path, **self._build_output_args(*settings))
+                for path, settings in renditions.items()
+            )
+            ffmpeg.merge_outputs(*outputs).run()
+
+            # after low level processing happen!!
+            return [File(path=path, meta=self.introspect(path)) for path in renditions]
+        except Exception as e:
+            # Standard exceptions raised
+            raise ProcessingEngineError(f'error while trying to save video renditions: {str(e)}')
+
+    def save_chunked(self, path: Path, segments: Optional[int] = None, workers: Optional[int] = None) -> File:
+        """Store the new media encoding the source video in parallel segments.
+        The source video stream is split on keyframes, each segment is encoded in a process pool,
+        and the encoded segments are joined with the concat demuxer along with the source audio stream.
+        The audio and protocol settings are applied once on concatenation,
+        while any other setting, eg: video filters, is applied to each segment.
+        If the source video stream can be copied, the media is stored as usual.
+
+        Usage:
+
+            # encode a long video using 16 local processes
+            file = engine.save_chunked(path, segments=16)
+
+        :param path: The output path
+        :param segments: Number of segments to split the source, by default the number of CPUs
+        :param workers: Max number of segments encoded at once, by default the number of CPUs
+        :return: File object
+        :raises ProcessingEngineError: If any exception is captured during processing
+        """
+        if self._source is None:
+            raise ProcessingEngineError('cannot encode in segments without a source path')
+
+        args = self._build_output_args()
+        if args.get('c:v') == 'copy':
+            return self.save(path)
+
+        segments = segments or os.cpu_count() or 1
+        encoding = {k: v for k, v in args.items() if k not in CHUNK_MUXER_ARGS}
+        muxing = {**{k: v for k, v in args.items() if k in CHUNK_MUXER_ARGS}, 'c:v': 'copy'}
+
+        try:
+            probed = processing.probe(self._source, entries=CHUNK_PROBE_ENTRIES)
+            duration = float(probed['format']['duration'])
+            has_audio = any(s.get('codec_type') == 'audio' for s in probed.get('streams', []))
+
+            # the segments are stored next to the output to avoid filling the temp partition
+            with tempfile.TemporaryDirectory(dir=os.path.dirname(path) or None) as directory:
+                split = os.path.join(directory, 'split')
+                os.mkdir(split)
+                sources = _split(self._source, split, duration / segments)
+                outputs = [os.path.join(directory, f'{CHUNK_ENCODED_PREFIX}{os.path.basename(s)}') for s in sources]
+
+                with concurrent.futures.ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+                    encoded = list(executor.map(_encode, sources, outputs, [encoding] * len(sources)))
+
+                streams = [ffmpeg.input(_concat(encoded, directory), f='concat', safe=0)['v']]
+                streams += [ffmpeg.input(self._source)['a']] if has_audio else []
+                ffmpeg.run(ffmpeg.output(*streams, path, **muxing), quiet=True, overwrite_output=True)
+
+            # after low level processing happen!!
+            i8t = self.introspect(path)
+            return File(path=path, meta=i8t)
+        except Exception as e:
+            # Standard exceptions raised
+            raise ProcessingEngineError(f'error while trying to save video output in segments: {str(e)}')
+
 
 class ImageEngine(Engine):
     """Engine that adapts the Pillow library to support image processing.
@@ -37,7 +37,7 @@ def _(media: Video) -> VideoEngine:
         raise ProcessingEngineError(f'No such file or directory: {media.path}')
 
     library = ffmpeg.input(media.path)
-    return VideoEngine(library)
+    return VideoEngine(library, source=media.path)
 
 
 @engine.register
@@ -6,9 +6,41 @@ from nucleus.core.types import Any, Dynamic, Iterator, List, Path, Settings, Tup
 from nucleus.sdk.harvest import Media
 
 
-class Introspection(Dynamic):
+def _lazy(value: Any) -> Any:
+    """Wrap the nested JSON containers to be converted on access."""
+    if isinstance(value, dict):
+        return Lazy(**{str(k): v for k, v in value.items()})
+    if isinstance(value, list):
+        return list(map(_lazy, value))
+    return value
+
+
+class Lazy(Dynamic):
+    """Dynamic object mirroring a JSON representation.
+    The nested JSON containers are only converted as Dynamic objects the first time they are accessed,
+    so large payloads can be wrapped without walking them.
+
+    Usage:
+
+        obj = Lazy(**{'format': {'duration': '10.0'}})
+        obj.format.duration # '10.0'
+    """
+
+    def __getattribute__(self, name: str) -> Any:
+        value = super().__getattribute__(name)
+        if name.startswith('__') or not isinstance(value, dict | list):
+            return value
+
+        # replace the raw container with the converted one
+        converted = _lazy(value)
+        setattr(self, name, converted)
+        return converted
+
+
+class Introspection(Lazy):
     """Introspection holds internal media information and technical details from media resources.
     The media introspection may vary based on the media type and underlying library.
+    The nested information is converted on access.
 
     Usage:
 
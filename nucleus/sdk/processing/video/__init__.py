@@ -2,6 +2,7 @@ from .codecs import H264, HEVC, VP9, Copy
 from .ffprobe import probe
 from .protocols import HLS
 from .settings import BR, FPS, Bitrate, Custom, FrameSize, Screen
+from .types import Progress
 
 __all__ = [
     'HEVC',
@@ -16,4 +17,5 @@ __all__ = [
     'BR',
     'Custom',
     'probe',
+    'Progress',
 ]
@@ -66,7 +66,7 @@ class HEVC:
     """
 
     def __contains__(self, codec: str) -> bool:
-        videos = ['libx265', 'h265']
+        videos = ['libx265', 'h265', 'hevc']
         audios = ['aac', 'libvo_aacenc', 'libfaac', 'libmp3lame', 'libfdk_aac']
         allowed_codecs = videos + audios
         return codec in allowed_codecs
@@ -91,7 +91,7 @@ class VP9:
     """
 
     def __contains__(self, codec: str) -> bool:
-        videos = ['libvpx', 'libvpx-vp9']
+        videos = ['libvpx', 'libvpx-vp9', 'vp9']
         audios = ['aac', 'libvo_aacenc', 'libfaac', 'libmp3lame', 'libfdk_aac']
         allowed_codecs = videos + audios
         return codec in allowed_codecs
@@ -1,3 +1,55 @@
+# Probe settings
+FFPROBE_CMD = 'ffprobe'
+# Max number of probe results kept in memory
+PROBE_CACHE_SIZE = 256
+
+# Progress report settings
+# ffmpeg writes the progress to stdout as key=value blocks, while stderr only receives the errors
+FFMPEG_PROGRESS_ARGS = ('-progress', 'pipe:1', '-nostats', '-loglevel', 'error')
+
+# Stream copy settings
+# The encoding arguments dropped when the source stream is copied without re-encoding
+COPY_VIDEO_ARGS = ('s', 'r', 'b', 'b:v', 'bf', 'g', 'crf', 'keyint_min', 'sc_threshold', 'x265-params')
+COPY_AUDIO_ARGS = ('b:a',)
+# The audio arguments altering the source audio stream, so it cannot be copied
+COPY_AUDIO_FILTER_ARGS = ('ac', 'ar', 'af', 'filter:a', 'q:a', 'aq')
+# The container and protocol arguments, they do not alter the encoded streams
+COPY_MUXER_ARGS = (
+    'f',
+    'fs',
+    'movflags',
+    'tag:v',
+    'hls_time',
+    'hls_list_size',
+    'hls_playlist_type',
+    'hls_flags',
+    'hls_segment_type',
+    'hls_segment_filename',
+)
+# The arguments allowed along with a video stream copy, any other argument,
+# eg: video filters, pixel format or encoder preset, requires re-encoding the source video stream.
+COPY_VIDEO_ALLOWED_ARGS = (
+    'c:v',
+    *COPY_VIDEO_ARGS,
+    'c:a',
+    *COPY_AUDIO_ARGS,
+    *COPY_AUDIO_FILTER_ARGS,
+    *COPY_MUXER_ARGS,
+)
+# The source entries needed to check if the streams can be copied
+COPY_PROBE_ENTRIES = 'stream=codec_type,codec_name,width,height,r_frame_rate,bit_rate'
+# Max difference allowed between the source and target frame rates
+COPY_FPS_TOLERANCE = 0.01
+
+# Chunked encoding settings
+# The source is split in segments without re-encoding, so the segments are cut on keyframes
+CHUNK_SEGMENT_NAME = 'segment_%05d.mkv'
+CHUNK_ENCODED_PREFIX = 'encoded_'
+CHUNK_LIST_NAME = 'segments.txt'
+CHUNK_PROBE_ENTRIES = 'format=duration:stream=codec_type'
+# The audio and container arguments applied on concatenation, the remaining arguments are applied to each segment
+CHUNK_MUXER_ARGS = ('c:a', *COPY_AUDIO_ARGS, *COPY_AUDIO_FILTER_ARGS, *COPY_MUXER_ARGS)
+
 # HLS default constants
 # https://developer.apple.com/documentation/http-live-streaming/hls-authoring-specification-for-apple-devices
 HLS_TIME = 10
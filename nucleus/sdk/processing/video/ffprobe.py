@@ -1,22 +1,64 @@
+import functools
+import json
+import os
+import subprocess
+
 import ffmpeg
+import ffmpeg._utils
 
 # Convention for importing types
-from nucleus.core.types import Any, Path, Raw
+from nucleus.core.types import Any, Optional, Path, Raw, Tuple
 from nucleus.sdk.exceptions import FFProbeError
 
+from .constants import FFPROBE_CMD, PROBE_CACHE_SIZE
+
+
+def _entries(path: str, entries: str, **kwargs: Any) -> Raw:
+    """Run ffprobe only showing the specified entries.
+
+    :param path: The path to probe
+    :param entries: The entries to show, eg: format=duration:stream=codec_name
+    :return: Dict raw representation of the output
+    :raises ffmpeg.Error: If ffprobe exits with failure
+    """
+    args = [FFPROBE_CMD, '-of', 'json', '-show_entries', entries]
+    args += ffmpeg._utils.convert_kwargs_to_cmd_line_args(kwargs)
+    process = subprocess.run([*args, path], capture_output=True)
+    if process.returncode != 0:
+        raise ffmpeg.Error(FFPROBE_CMD, process.stdout, process.stderr)
+    return json.loads(process.stdout)
+
+
+@functools.lru_cache(maxsize=PROBE_CACHE_SIZE)
+def _probe(path: str, size: int, mtime: int, entries: Optional[str], options: Tuple[Any, ...]) -> Raw:
+    """Run ffprobe once per file version, the size and mtime are part of the cache key to detect file changes."""
+    if entries is None:
+        return ffmpeg.probe(path, **dict(options))
+    return _entries(path, entries, **dict(options))
+
 
-# TODO add auto_probe feature to encoding step
 # TODO set video->0, audio->1 streams methods
-def probe(path: Path, **kwargs: Any) -> Raw:
+def probe(path: Path, entries: Optional[str] = None, **kwargs: Any) -> Raw:
     """Run ffprobe on the specified file and return a dict representation of the output.
+    The output is cached while the file is not modified, so the result is shared and must not be modified.
+
+    Usage:
+
+        # probe the whole media
+        info = probe(path)
+        # limit the probe output to the needed entries
+        info = probe(path, entries='format=duration:stream=codec_name')
 
     :param path: The path to probe
+    :param entries: The entries to show, by default the format and streams are shown
     :return: Dict raw representation of the output
-    :raises FFProbeError: If the file path does not exist
+    :raises FFProbeError: If the file path does not exist or ffprobe fails
     """
     try:
-        return ffmpeg.probe(path, **kwargs)
-    except ffmpeg._run.Error as e:
+        stat = os.stat(path)
+        options = tuple(sorted(kwargs.items()))
+        return _probe(str(path), stat.st_size, stat.st_mtime_ns, entries, options)
+    except (OSError, ffmpeg._run.Error) as e:
         raise FFProbeError(f'error during ffprobe command call: {str(e)}')
 
 
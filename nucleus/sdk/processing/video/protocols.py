@@ -19,6 +19,9 @@ class HLS:
     # default h264 codec
     codec: Codec = H264()
 
+    def __contains__(self, codec: str) -> bool:
+        return codec in self.codec
+
     def __iter__(self):
         yield 'hls_time', HLS_TIME
         yield 'hls_list_size', HLS_LIST_SIZE
@@ -1,6 +1,16 @@
 from __future__ import annotations
 
-from nucleus.core.types import Protocol, Settings
+from dataclasses import dataclass
+
+from nucleus.core.types import Mapping, Protocol, Settings
+
+
+def _number(value: str) -> float:
+    """Parse a progress value, the values not available yet are reported as N/A."""
+    try:
+        return float(value.rstrip('x'))
+    except ValueError:
+        return 0.0
 
 
 class Codec(Settings, Protocol):
@@ -15,3 +25,42 @@ class Codec(Settings, Protocol):
         :returns: True if match else False
         """
         ...
+
+
+@dataclass(slots=True)
+class Progress:
+    """Progress represent a progress report sent by ffmpeg during transcoding.
+
+    Usage:
+
+        async for progress in engine.progress(path):
+            print(f'{progress.out_time}s transcoded at {progress.speed}x')
+    """
+
+    frame: int = 0
+    fps: float = 0.0
+    # the processing speed relative to playback speed
+    speed: float = 0.0
+    # the output time transcoded so far in seconds
+    out_time: float = 0.0
+    # True for the last report
+    done: bool = False
+
+    @classmethod
+    def parse(cls, fields: Mapping[str, str]) -> Progress:
+        """Build the progress from a reported key=value block.
+
+        :param fields: The reported fields
+        :return: Progress object
+        """
+        return cls(
+            frame=int(_number(fields.get('frame', '0'))),
+            fps=_number(fields.get('fps', '0')),
+            speed=_number(fields.get('speed', '0')),
+            # despite its name out_time_ms is also reported in microseconds
+            out_time=_number(fields.get('out_time_us', '0')) / 10**6,
+            done=fields.get('progress') == 'end',
+        )
+
+
+__all__ = ('Codec', 'Progress')
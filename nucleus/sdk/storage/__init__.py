@@ -1,15 +1,19 @@
+from .index import Index, Journal
 from .partials import estuary
 from .services import Estuary
 from .store import ipfs
-from .types import Client, Object, Pin, Storable, Store
+from .types import Client, Object, Pin, Result, Storable, Store
 
 __all__ = [
     'Pin',
     'Storable',
     'Object',
+    'Result',
     'Store',
     'Client',
     'Estuary',
     'estuary',
     'ipfs',
+    'Index',
+    'Journal',
 ]
@@ -1,3 +1,35 @@
 ESTUARY_API_BASE = 'https://api.estuary.tech'
 ESTUARY_API_PIN = '/pinning/pins'
 ESTUARY_API_PUBLIC = '/public'
+
+# Max number of small objects (bytes, str, JSON) sent in the same request
+STORE_BATCH_SIZE = 512
+
+# Local storage database, keeps the index of stored blocks and the uploads journal
+STORAGE_PATH = './.storage/'
+STORAGE_DB = 'storage.db'
+
+# Query constants
+# The blocks are registered by node endpoint, since each node stores its own blocks
+INDEX_MIGRATE = """CREATE TABLE IF NOT EXISTS node_blocks(
+    node TEXT, cid TEXT, size INTEGER,
+    PRIMARY KEY (node, cid)
+);"""
+INDEX_INSERT = """INSERT OR IGNORE INTO node_blocks VALUES(?, ?, ?)"""
+INDEX_FETCH = """SELECT 1 FROM node_blocks WHERE node = ? AND cid = ?"""
+JOURNAL_MIGRATE = """CREATE TABLE IF NOT EXISTS chunks(
+    path TEXT, size INTEGER, mtime REAL, chunk_size INTEGER, idx INTEGER, cid TEXT,
+    PRIMARY KEY (path, size, mtime, chunk_size, idx)
+);"""
+JOURNAL_INSERT = """INSERT OR REPLACE INTO chunks VALUES(?, ?, ?, ?, ?, ?)"""
+JOURNAL_FETCH = """SELECT idx, cid FROM chunks WHERE path = ? AND size = ? AND mtime = ? AND chunk_size = ?"""
+JOURNAL_CLEAR = """DELETE FROM chunks WHERE path = ? AND size = ? AND mtime = ? AND chunk_size = ?"""
+
+# Max number of objects stored concurrently by store.map and store.amap
+STORE_MAX_WORKERS = 8
+# Max number of items in flight per worker, bounding the memory used by lazy input streams
+STORE_WINDOW_FACTOR = 2
+
+# Chunked uploads settings
+# Chunks are stored as raw blocks, so they must not exceed the max block size accepted by IPFS (1MiB inclusive)
+UPLOAD_CHUNK_SIZE = 2**20
@@ -0,0 +1,157 @@
+import sqlite3
+import threading
+
+import nucleus.core.cache as cache
+import nucleus.core.decorators as decorators
+from nucleus.core.cache import Connection
+from nucleus.core.types import CID, Dict, Iterable, Path
+from nucleus.sdk.exceptions import StorageError
+
+from .constants import (
+    INDEX_FETCH,
+    INDEX_INSERT,
+    INDEX_MIGRATE,
+    JOURNAL_CLEAR,
+    JOURNAL_FETCH,
+    JOURNAL_INSERT,
+    JOURNAL_MIGRATE,
+    STORAGE_DB,
+    STORAGE_PATH,
+)
+from .types import Fingerprint, Object
+
+
+def _connect(storage_path: str) -> Connection:
+    """Connect to the local storage database.
+    The connection can be shared between threads, so the callers must serialize the access.
+
+    :param storage_path: The directory where the database is stored
+    :return: Connection to database
+    """
+    # ensure that storage directory exists
+    db_path = Path(storage_path)
+    if not db_path.exists():
+        db_path.mkdir(parents=True)
+
+    return cache.connect(db_path=f'{db_path}/{STORAGE_DB}', check_same_thread=False)
+
+
+class Index:
+    """Content addressed index of the objects already stored by each node.
+    The index only records that a node acknowledged the block, the node could remove it later,
+    eg: after a garbage collection or a node reset, so the indexed blocks must be pinned again instead of skipped.
+
+    Usage:
+
+        index = Index()
+        store = storage.ipfs(index=index)
+        store(b'claim') # upload and register the block
+        store(b'claim') # skip upload, the block is only pinned again
+    """
+
+    _conn: Connection
+    _lock: threading.Lock
+
+    def __init__(self, storage_path: str = STORAGE_PATH):
+        # the index is shared by the storage workers threads
+        self._lock = threading.Lock()
+        self._conn = _connect(storage_path)
+        self._conn.execute(INDEX_MIGRATE)
+
+    @decorators.proxy_exception(
+        expected=sqlite3.Error,
+        target=StorageError,
+    )
+    def contains(self, node: str, cid: CID) -> bool:
+        """Check if the CID is already registered in index for the node.
+
+        :param node: The node endpoint
+        :param cid: The CID to lookup
+        :return: True if the CID is registered, False otherwise
+        :raises StorageError: If there is an error querying the index
+        """
+        with self._lock:
+            response = self._conn.execute(INDEX_FETCH, (node, str(cid)))
+            return response.fetchone() is not None
+
+    @decorators.proxy_exception(
+        expected=sqlite3.Error,
+        target=StorageError,
+    )
+    def add(self, node: str, objects: Iterable[Object]):
+        """Register the objects stored by the node in index.
+
+        :param node: The node endpoint
+        :param objects: The stored objects to register
+        :raises StorageError: If there is an error registering the objects
+        """
+        with self._lock, self._conn:
+            rows = ((node, str(obj.hash), obj.size) for obj in objects)
+            self._conn.executemany(INDEX_INSERT, rows)
+
+
+class Journal:
+    """Journal of the chunks acknowledged during chunked uploads.
+    The chunks are registered by file fingerprint, so an interrupted upload can be resumed
+    while any change in the file or chunk size starts it over.
+
+    Usage:
+
+        journal = Journal()
+        store = storage.ipfs(journal=journal)
+        store.upload(File(...)) # resume from the last acknowledged chunk if interrupted before
+    """
+
+    _conn: Connection
+    _lock: threading.Lock
+
+    def __init__(self, storage_path: str = STORAGE_PATH):
+        self._lock = threading.Lock()
+        self._conn = _connect(storage_path)
+        self._conn.execute(JOURNAL_MIGRATE)
+
+    @decorators.proxy_exception(
+        expected=sqlite3.Error,
+        target=StorageError,
+    )
+    def chunks(self, fingerprint: Fingerprint) -> Dict[int, CID]:
+        """Return the acknowledged chunks for the file.
+
+        :param fingerprint: The file fingerprint
+        :return: Dict of chunk index and the stored chunk CID
+        :raises StorageError: If there is an error querying the journal
+        """
+        with self._lock:
+            response = self._conn.execute(JOURNAL_FETCH, fingerprint)
+            return {idx: CID(cid) for idx, cid in response.fetchall()}
+
+    @decorators.proxy_exception(
+        expected=sqlite3.Error,
+        target=StorageError,
+    )
+    def add(self, fingerprint: Fingerprint, idx: int, cid: CID):
+        """Register an acknowledged chunk.
+
+        :param fingerprint: The file fingerprint
+        :param idx: The chunk index in file
+        :param cid: The stored chunk CID
+        :raises StorageError: If there is an error registering the chunk
+        """
+        with self._lock, self._conn:
+            self._conn.execute(JOURNAL_INSERT, (*fingerprint, idx, str(cid)))
+
+    @decorators.proxy_exception(
+        expected=sqlite3.Error,
+        target=StorageError,
+    )
+    def clear(self, fingerprint: Fingerprint):
+        """Remove the chunks registered for the file.
+
+        :param fingerprint: The file fingerprint
+        :raises StorageError: If there is an error removing the chunks
+        """
+        with self._lock, self._conn:
+            self._conn.execute(JOURNAL_CLEAR, fingerprint)
+
+
+__all__ = ('Index', 'Journal')
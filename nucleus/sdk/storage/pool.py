@@ -0,0 +1,135 @@
+import asyncio
+import collections
+import concurrent.futures
+
+from nucleus.core.types import AsyncIterable, AsyncIterator, Deque, Iterable, Iterator, Union
+
+from .constants import STORE_MAX_WORKERS, STORE_WINDOW_FACTOR
+from .types import Result, Storable, Store
+
+
+def _attempt(store: Store, data: Storable) -> Result:
+    """Store data and capture the failure instead of raising it,
+    so a failed item does not abort the rest of the batch.
+
+    :param store: The store function
+    :param data: The data to store
+    :return: Result with the stored object or the raised error
+    """
+    try:
+        return Result(data, output=store(data))
+    except Exception as e:
+        return Result(data, error=e)
+
+
+def _next(queue: Deque[concurrent.futures.Future], ordered: bool) -> Iterator[Result]:
+    """Wait and yield the next finished results from the in flight queue.
+
+    :param queue: The in flight futures
+    :param ordered: If True, wait for the oldest future, otherwise for the first completed
+    :return: Iterator of finished results
+    """
+    if ordered:
+        yield queue.popleft().result()
+        return
+
+    done, _ = concurrent.futures.wait(queue, return_when=concurrent.futures.FIRST_COMPLETED)
+    for future in done:
+        queue.remove(future)
+        yield future.result()
+
+
+def imap(
+    store: Store,
+    data: Iterable[Storable],
+    workers: int = STORE_MAX_WORKERS,
+    ordered: bool = True,
+) -> Iterator[Result]:
+    """Store data concurrently in a bounded thread pool.
+    Only a bounded window of items is in flight, so the input can be a lazy stream of any size.
+
+    Usage:
+
+        for result in imap(store, files, workers=4, ordered=False):
+            if result.error: ...
+
+    :param store: The store function
+    :param data: The data to store
+    :param workers: Max number of items stored concurrently
+    :param ordered: If True, yield the results in input order, otherwise as soon as they complete
+    :return: Iterator of results
+    """
+    # keep the workers busy while results are consumed
+    window = workers * STORE_WINDOW_FACTOR
+    queue: Deque[concurrent.futures.Future] = collections.deque()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        for item in data:
+            queue.append(executor.submit(_attempt, store, item))
+            if len(queue) >= window:
+                yield from _next(queue, ordered)
+
+        # drain the remaining in flight items
+        while queue:
+            yield from _next(queue, ordered)
+
+
+async def _aiter(data: Union[Iterable[Storable], AsyncIterable[Storable]]) -> AsyncIterator[Storable]:
+    """Adapt sync or async input streams to be consumed in the event loop."""
+    if isinstance(data, AsyncIterable):
+        async for item in data:
+            yield item
+        return
+
+    for item in data:
+        yield item
+
+
+async def _anext(queue: Deque[asyncio.Future], ordered: bool) -> AsyncIterator[Result]:
+    """Asynchronous counterpart of _next."""
+    if ordered:
+        yield await queue.popleft()
+        return
+
+    done, _ = await asyncio.wait(queue, return_when=asyncio.FIRST_COMPLETED)
+    for future in done:
+        queue.remove(future)
+        yield future.result()
+
+
+async def amap(
+    store: Store,
+    data: Union[Iterable[Storable], AsyncIterable[Storable]],
+    workers: int = STORE_MAX_WORKERS,
+    ordered: bool = True,
+) -> AsyncIterator[Result]:
+    """Asynchronous counterpart of imap.
+    The store function is executed in a bounded thread pool without blocking the event loop.
+
+    Usage:
+
+        async for result in amap(store, files, workers=4):
+            if result.error: ...
+
+    :param store: The store function
+    :param data: The data to store, as sync or async iterable
+    :param workers: Max number of items stored concurrently
+    :param ordered: If True, yield the results in input order, otherwise as soon as they complete
+    :return: Async iterator of results
+    """
+    loop = asyncio.get_running_loop()
+    window = workers * STORE_WINDOW_FACTOR
+    queue: Deque[asyncio.Future] = collections.deque()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        async for item in _aiter(data):
+            queue.append(loop.run_in_executor(executor, _attempt, store, item))
+            if len(queue) >= window:
+                async for result in _anext(queue, ordered):
+                    yield result
+
+        # drain the remaining in flight items
+        while queue:
+            async for result in _anext(queue, ordered):
+                yield result
+
+
+__all__ = ('imap', 'amap')
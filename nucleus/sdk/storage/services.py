@@ -29,9 +29,10 @@ class Estuary:
     key: str
 
     def __post_init__(self):
-        self._http = http_client.live_session(self.endpoint)
-        self._http.headers.update({'Authorization': f'Bearer {self.key}'})
-        self._http.headers.update({'Content-Type': 'application/json'})
+        # the session is shared with any other client pointing to the same endpoint,
+        # so the credentials are sent per request instead of being set into session.
+        self._http = http_client.shared_session(self.endpoint)
+        self._headers = {'Authorization': f'Bearer {self.key}', 'Content-Type': 'application/json'}
 
     def _safe_request(self, res: Response) -> JSON:
         """Amplifier helper method to handle response from Estuary API
@@ -69,7 +70,7 @@ class Estuary:
         """
 
         content_uri = f'{ESTUARY_API_PUBLIC}/by-cid/{cid}'
-        req = self._http.get(content_uri)
+        req = self._http.get(content_uri, headers=self._headers)
 
         # expected response as json
         response = self._safe_request(req)
@@ -86,7 +87,7 @@ class Estuary:
         # https://docs.estuary.tech/Reference/SwaggerUI#/pinning/post_pinning_pins
         data = str(JSON({'cid': obj.hash, 'name': obj.name, 'meta': {}, 'origins': []}))
 
-        req = self._http.post(ESTUARY_API_PIN, data=data)
+        req = self._http.post(ESTUARY_API_PIN, data=data, headers=self._headers)
         json_response = self._safe_request(req)
 
         return Pin(
@@ -105,7 +106,7 @@ class Estuary:
 
         # content id is same as pin id
         pin_id = self._content_by_cid(cid).get('id')
-        response = self._http.delete(f'{ESTUARY_API_PIN}/{pin_id}')
+        response = self._http.delete(f'{ESTUARY_API_PIN}/{pin_id}', headers=self._headers)
         # If error happens then raise standard exception.
         self._safe_request(response)
         return cid
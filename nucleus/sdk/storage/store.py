@@ -1,14 +1,131 @@
 import functools
+import itertools
 
 import nucleus.core.ipfs as ipfs_
-from nucleus.core.ipfs import Add, BlockPut, DagPut, Dir, File, Text
-from nucleus.core.types import CID, JSON, Optional, Path
+from nucleus.core.exceptions import IPFSRuntimeError
+from nucleus.core.ipfs import RPC, Add, Batch, BlockPut, BlockStat, DagPut, Dir, File, PinAdd, Text
+from nucleus.core.ipfs.constants import IPFS_DEFAULT_ENDPOINT
+from nucleus.core.types import CID, JSON, Callable, Iterable, Iterator, List, Optional, Path, Sequence, Type
+from nucleus.sdk.exceptions import StorageError
 from nucleus.sdk.processing import File as FileType
 
+from . import pool, upload
+from .constants import STORE_BATCH_SIZE
+from .index import Index, Journal
 from .types import Object, Storable, Store
 
 
-def ipfs(endpoint: Optional[str] = None) -> Store:
+def _kind(data: Storable) -> str:
+    """Classify storable data based on the storage strategy that can be batched.
+
+    :param data: The data to classify
+    :return: `block` for bytes or str, `dag` for JSON, otherwise `single`
+    """
+    if isinstance(data, JSON):
+        return 'dag'
+    # Path is a str subtype, but it is stored as directory
+    if isinstance(data, bytes | str) and not isinstance(data, Path):
+        return 'block'
+    return 'single'
+
+
+def _chunks(data: Iterable[Storable], size: int) -> Iterator[Sequence[Storable]]:
+    """Split data into chunks with max `size` elements."""
+    iterator = iter(data)
+    while chunk := tuple(itertools.islice(iterator, size)):
+        yield chunk
+
+
+def _as_bytes(data: Storable) -> bytes:
+    return bytes(data, 'utf-8') if isinstance(data, str) else bytes(data)  # type: ignore
+
+
+def _batch(api: RPC, command_type: Type[BlockPut | DagPut], batch: Sequence[Storable]) -> List[JSON]:
+    """Store batch of data in one request and return the output entries.
+
+    :raises StorageError: If the output does not match the input data
+    """
+    command = command_type(Batch(list(map(_as_bytes, batch))))
+    outputs = list(api.stream(command))
+    if len(outputs) != len(batch):
+        raise StorageError(f'expected {len(batch)} stored objects, got {len(outputs)}')
+    return outputs
+
+
+def _exists(api: RPC, cid: CID) -> bool:
+    """Check if the raw block is already stored in the local node.
+
+    :param api: The IPFS api
+    :param cid: The block CID to check
+    :return: True if the block exists, False otherwise
+    """
+    try:
+        api(BlockStat(cid))
+        return True
+    except IPFSRuntimeError:
+        # block/stat fails when the block is not found in offline mode
+        return False
+
+
+def _pinned(api: RPC, cids: Sequence[CID]) -> bool:
+    """Pin the blocks already stored in the local node.
+
+    :param api: The IPFS api
+    :param cids: The block CIDs to pin
+    :return: True if all the blocks were pinned, False if any block is missing
+    """
+    try:
+        api(PinAdd(cids))
+        return True
+    except IPFSRuntimeError:
+        # pin/add fails when any block is not found in offline mode
+        return False
+
+
+def _known(api: RPC, node: str, index: Optional[Index], stat: bool, cid: CID) -> bool:
+    """Check if the raw block is already stored, first in local index and then in node if stat is enabled."""
+    if index is not None and index.contains(node, cid):
+        return True
+    return stat and _exists(api, cid)
+
+
+def _blocks(api: RPC, batch: Sequence[Storable], known: Callable[[CID], bool]) -> Iterator[Object]:
+    """Store batch of bytes or str in raw blocks.
+    The CIDs are computed locally, so the blocks already known are only pinned instead of uploaded again.
+    """
+    raw = list(map(_as_bytes, batch))
+    cids = list(map(CID.from_bytes, raw))
+    found = list(map(known, cids))
+    skipped = [cid for cid, exists in zip(cids, found) if exists]
+    if skipped and not _pinned(api, skipped):
+        # the node removed some known blocks, eg: after a garbage collection, so all of them are uploaded again
+        found = [False] * len(raw)
+
+    pending = [data for data, exists in zip(raw, found) if not exists]
+
+    # expected one block/put output per pending input
+    # {Key: .., Size: ..}
+    outputs = iter(_batch(api, BlockPut, pending) if pending else ())
+    for data, cid, exists in zip(raw, cids, found):
+        key = cid if exists else CID(next(outputs)['Key'])
+        yield Object(name=key, hash=key, size=len(data))
+
+
+def _dags(api: RPC, batch: Sequence[Storable]) -> Iterator[Object]:
+    """Store batch of JSON in dag."""
+    # expected one dag/put output per input
+    # {"Cid": { "/": "<cid-string>" }}
+    for data, output in zip(batch, _batch(api, DagPut, batch)):
+        raw_cid = output['Cid']['/']
+        yield Object(name=raw_cid, hash=CID(raw_cid), size=len(data))  # type: ignore
+
+
+def ipfs(
+    endpoint: Optional[str] = None,
+    index: Optional[Index] = None,
+    stat: bool = False,
+    journal: Optional[Journal] = None,
+) -> Store:
     """Higher-order function to handle storage endpoint and
     return a singledispatch generic function with preset storage strategies.
     This is a form of generic function dispatch where the
@@ -19,13 +136,35 @@ def ipfs(endpoint: Optional[str] = None) -> Store:
         store = storage.ipfs() # default localhost:5001
         stored_object = store(b'test bytes') # auto-choose the storage strategy
 
+        # pin the raw blocks already stored instead of uploading them again
+        store = storage.ipfs(index=Index(), stat=True)
+
+        # store many files concurrently
+        results = store.map(files, workers=4)
+
+        # upload large files in chunks, resuming if interrupted
+        stored_object = store.upload(file, progress=callback)
+
 
     :param endpoint: Endpoint to connect to the API. If the endpoint is not specified, localhost is used instead.
+    :param index: Local index used to register the raw blocks stored by the node and only pin them again.
+    :param stat: If True, check if each raw block is already in node before uploading it, and only pin it.
+    :param journal: Journal used to resume interrupted chunked uploads.
     :return: Singledispatch decorated function
     """
 
     # Connect to the IPFS API interface
-    api = ipfs_.rpc(endpoint)
+    node = endpoint or IPFS_DEFAULT_ENDPOINT
+    api = ipfs_.rpc(node)
+
+    # the index is scoped by node, since the blocks stored in a node are unknown for the others
+    known = functools.partial(_known, api, node, index, stat)
+
+    def blocks(batch: Sequence[Storable]) -> List[Object]:
+        stored = list(_blocks(api, batch, known))
+        if index is not None:
+            index.add(node, stored)
+        return stored
 
     @functools.singledispatch
     def store(data: Storable) -> Object:
@@ -86,16 +225,8 @@ def ipfs(endpoint: Optional[str] = None) -> Store:
         :return: Object instance
         """
 
-        command = BlockPut(Text(data))
-        # expected block/put output from API
-        # {Key: .., Size: ..}
-        output = api(command)
-
-        return Object(
-            name=output['Key'],
-            hash=CID(output['Key']),
-            size=len(data),
-        )
+        (stored,) = blocks([data])
+        return stored
 
     @store.register
     def _(data: str) -> Object:
@@ -130,7 +261,40 @@ def ipfs(endpoint: Optional[str] = None) -> Store:
             size=len(data),
         )
 
-    return store
+    def many(data: Iterable[Storable], batch_size: int = STORE_BATCH_SIZE) -> List[Object]:
+        """Store many data in IPFS using as few requests as possible.
+        Consecutive bytes and str are stored as raw blocks in one request per batch,
+        consecutive JSON are stored in dag in one request per batch, and anything else is stored individually.
+        The storage order is the same as the input order.
+
+        Usage:
+
+            # store all the claims in one request
+            objects = store.many([b'claim 1', b'claim 2', 'serialization'])
+
+        :param data: The data to store
+        :param batch_size: Max number of objects to store in the same request
+        :return: List of Object instances in the same order as the input data
+        """
+
+        strategies = {'block': blocks, 'dag': functools.partial(_dags, api)}
+        stored: List[Object] = []
+
+        for kind, group in itertools.groupby(data, key=_kind):
+            if kind not in strategies:
+                stored += map(store, group)
+                continue
+
+            for batch in _chunks(group, batch_size):
+                stored += strategies[kind](batch)
+        return stored
+
+    # bind the bulk storage strategies to store function
+    store.many = many  # type: ignore
+    store.map = functools.partial(pool.imap, store)  # type: ignore
+    store.amap = functools.partial(pool.amap, store)  # type: ignore
+    store.upload = functools.partial(upload.chunked, api, journal)  # type: ignore
+    return store  # type: ignore
 
 
 __all__ = ('ipfs',)
@@ -1,6 +1,22 @@
 from dataclasses import dataclass
 
-from nucleus.core.types import CID, JSON, Callable, NewType, Optional, Path, Protocol, Union, runtime_checkable
+from nucleus.core.types import (
+    CID,
+    JSON,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    NewType,
+    Optional,
+    Path,
+    Protocol,
+    Tuple,
+    Union,
+    runtime_checkable,
+)
 from nucleus.sdk.processing import File
 
 
@@ -38,7 +54,85 @@ class Pin:
 # Alias for allowed media to store
 ID = NewType('ID', str)
 Storable = Union[File, JSON, Path, str, bytes]
-Store = Callable[[Storable], Object]
+# Uploaded file identity: path, size, modification time and chunk size
+Fingerprint = Tuple[str, int, float, int]
+# Upload progress callback receiving the uploaded and total bytes
+Progress = Callable[[int, int], None]
+
+
+@dataclass(slots=True)
+class Result:
+    """Represents the outcome of storing one item in bulk storage operations.
+    Failures are reported per item, so a failed item does not abort the batch.
+
+    Usage:
+
+        for result in store.map(files):
+            if result.error is not None:
+                logger.error(f'failed storing {result.input}: {result.error}')
+    """
+
+    input: Storable
+    output: Optional[Object] = None
+    error: Optional[Exception] = None
+
+
+class Store(Protocol):
+    """Store specifies the storage function returned by storage factories.
+    The storage strategy is chosen based on the type of the data to store.
+    """
+
+    def __call__(self, data: Storable) -> Object:
+        """Store data.
+
+        :param data: The data to store
+        :return: Object instance
+        """
+        ...
+
+    def many(self, data: Iterable[Storable], batch_size: int = ...) -> List[Object]:
+        """Store many data using as few requests as possible.
+
+        :param data: The data to store
+        :param batch_size: Max number of objects to store in the same request
+        :return: List of Object instances in the same order as the input data
+        """
+        ...
+
+    def map(self, data: Iterable[Storable], workers: int = ..., ordered: bool = ...) -> Iterator[Result]:
+        """Store data concurrently in a bounded thread pool.
+
+        :param data: The data to store
+        :param workers: Max number of items stored concurrently
+        :param ordered: If True, yield the results in input order, otherwise as soon as they complete
+        :return: Iterator of results
+        """
+        ...
+
+    def amap(
+        self,
+        data: Union[Iterable[Storable], AsyncIterable[Storable]],
+        workers: int = ...,
+        ordered: bool = ...,
+    ) -> AsyncIterator[Result]:
+        """Store data concurrently without blocking the event loop.
+
+        :param data: The data to store, as sync or async iterable
+        :param workers: Max number of items stored concurrently
+        :param ordered: If True, yield the results in input order, otherwise as soon as they complete
+        :return: Async iterator of results
+        """
+        ...
+
+    def upload(self, data: Union[File, Path], chunk_size: int = ..., progress: Progress = ...) -> Object:
+        """Upload a file in chunks, resuming from the last acknowledged chunk if interrupted.
+
+        :param data: The file to upload
+        :param chunk_size: The size of each chunk
+        :param progress: Callback receiving the uploaded and total bytes after each chunk
+        :return: Object instance
+        """
+        ...
 
 
 @runtime_checkable
@@ -64,4 +158,4 @@ class Client(Protocol):
         ...
 
 
-__all__ = ('Pin', 'Storable', 'Store', 'Client', 'Object')
+__all__ = ('Pin', 'Storable', 'Store', 'Client', 'Object', 'Result', 'Fingerprint', 'Progress')
@@ -0,0 +1,118 @@
+import os
+
+from nucleus.core.ipfs import RPC, Batch, BlockPut, PinAdd, Text, unixfs
+from nucleus.core.types import CID, Dict, Iterator, List, Optional, Path, Union
+from nucleus.sdk.exceptions import StorageError
+from nucleus.sdk.processing import File
+
+from .constants import UPLOAD_CHUNK_SIZE
+from .index import Journal
+from .types import Fingerprint, Object, Progress
+
+
+def _fingerprint(path: Path, chunk_size: int) -> Fingerprint:
+    """Identify the file to upload, any change in the file or chunk size produces a new fingerprint."""
+    stat = os.stat(path)
+    return os.path.abspath(path), stat.st_size, stat.st_mtime, chunk_size
+
+
+def _put(api: RPC, chunk: bytes) -> CID:
+    """Store a chunk in an unpinned raw block and check its integrity.
+
+    :param api: The IPFS api
+    :param chunk: The chunk to store
+    :return: The chunk CID
+    :raises StorageError: If the stored block CID doesn't match the chunk content
+    """
+    cid = CID.from_bytes(chunk)
+    # expected block/put output from API
+    # {Key: .., Size: ..}
+    output = api(BlockPut(Text(chunk), pin=False))
+    if output['Key'] != cid:
+        raise StorageError(f'stored chunk {output["Key"]} does not match the expected {cid}')
+    return cid
+
+
+def _leaves(
+    api: RPC,
+    journal: Journal,
+    fingerprint: Fingerprint,
+    progress: Progress,
+) -> Iterator[unixfs.Link]:
+    """Store the file chunks not acknowledged yet in journal and yield them as leaves.
+
+    :param api: The IPFS api
+    :param journal: The journal with the acknowledged chunks
+    :param fingerprint: The uploaded file fingerprint
+    :param progress: The progress callback
+    :return: Iterator of leaves in file order
+    """
+    path, size, _, chunk_size = fingerprint
+    acknowledged: Dict[int, CID] = journal.chunks(fingerprint)
+    uploaded = 0
+
+    with open(path, 'rb') as f:
+        for idx in range(-(-size // chunk_size)):
+            chunk_length = min(chunk_size, size - idx * chunk_size)
+            cid = acknowledged.get(idx)
+
+            if cid is None:
+                # only the pending chunks are read from disk
+                f.seek(idx * chunk_size)
+                cid = _put(api, f.read(chunk_size))
+                journal.add(fingerprint, idx, cid)
+
+            uploaded += chunk_length
+            progress(uploaded, size)
+            yield unixfs.Link(cid, chunk_length, chunk_length)
+
+
+def _noop(*_: int):
+    ...
+
+
+def chunked(
+    api: RPC,
+    journal: Optional[Journal],
+    data: Union[File, Path],
+    chunk_size: int = UPLOAD_CHUNK_SIZE,
+    progress: Progress = _noop,
+) -> Object:
+    """Upload a file in fixed-size raw blocks and link them with a UnixFS root.
+    Each acknowledged chunk is registered in journal, so an interrupted upload is resumed
+    from the last acknowledged chunk instead of starting over.
+    The chunks and tree nodes are stored unpinned, and only the root is pinned once the whole layout is stored,
+    so unpinning the root releases the whole file.
+
+    Usage:
+
+        store = storage.ipfs()
+        stored_object = store.upload(file, progress=lambda uploaded, total: print(f'{uploaded}/{total}'))
+
+    :param api: The IPFS api
+    :param journal: The uploads journal. If not specified, the default local storage journal is used.
+    :param data: The file to upload
+    :param chunk_size: The size of each chunk, should not exceed the max block size (1MiB)
+    :param progress: Callback receiving the uploaded and total bytes after each chunk
+    :return: Object instance
+    :raises StorageError: If any chunk fails to be stored
+    """
+    path = data.path if isinstance(data, File) else data
+    journal = journal if journal is not None else Journal()
+    fingerprint = _fingerprint(path, chunk_size)
+
+    leaves: List[unixfs.Link] = list(_leaves(api, journal, fingerprint, progress))
+    root, nodes = unixfs.layout(leaves)
+    if nodes:
+        # store all the tree nodes in one request
+        list(api.stream(BlockPut(Batch(nodes), pin=False, cid_codec='dag-pb')))
+
+    # pin recursively the root with the whole layout already stored
+    api(PinAdd([root.cid]))
+
+    # the upload is done, the chunks are not needed anymore
+    journal.clear(fingerprint)
+    return Object(name=os.path.basename(path), hash=root.cid, size=root.tsize)
+
+
+__all__ = ('chunked',)
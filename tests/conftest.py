@@ -4,7 +4,36 @@ import sqlite3
 import pytest
 import responses
 
-from nucleus.core.types import Any, Path
+import nucleus.core.cache as cache
+import nucleus.sdk.harvest.models as models
+from nucleus.core.types import Any, Iterator, Path
+
+
+def _models(base: Any) -> Iterator[Any]:
+    """Walk the declared models, including the models declared by the tests."""
+    for model in base.__subclasses__():
+        yield model
+        yield from _models(model)
+
+
+@pytest.fixture(autouse=True)
+def models_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    """Fixture to store the model databases in a temporary directory, so the entries do not leak between runs"""
+    path = Path(str(tmp_path / 'models'))
+    monkeypatch.setattr(models, 'MODELS_PATH', f'{path}/')
+
+    providers = []
+    for model in _models(models.Base):
+        provider = cache.Provider(f'{path}/{model._alias}.db', setup=cache.tune)
+        monkeypatch.setattr(model, '_provider', provider)
+        # the temporary database is created and migrated on first use
+        monkeypatch.setattr(model, '_ready', False)
+        monkeypatch.setattr(model, '_stale', False)
+        providers.append(provider)
+
+    yield path
+    for provider in providers:
+        provider.close()
 
 
 @pytest.fixture()
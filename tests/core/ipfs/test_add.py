@@ -1,9 +1,20 @@
+from urllib.parse import unquote
+
+import pytest
 import responses
 
 import nucleus.core.ipfs as ipfs
-from nucleus.core.ipfs import Add, File
+from nucleus.core.exceptions import IPFSRuntimeError
+from nucleus.core.ipfs import Add, Dir, File
 from nucleus.core.types import JSON, Path
 
+ADD_ENDPOINT = 'http://localhost:5001/api/v0/add'
+ADD_DIR_OUTPUT = (
+    '{"Name": "hls/index.m3u8", "Hash": "bafkreia", "Size": "120"}\n'
+    '{"Name": "hls", "Hash": "bafybeib", "Size": "4096"}\n'
+    '{"Name": "hls/segment0.ts", "Hash": "bafkreic", "Size": "3900"}\n'
+)
+
 
 @responses.activate
 def test_add(rpc_api_add_request: JSON, mock_local_video_path: Path):
@@ -13,3 +24,78 @@ def test_add(rpc_api_add_request: JSON, mock_local_video_path: Path):
     command = Add(File(mock_local_video_path))
     output = api(command)  # call the command in api
     assert output == rpc_api_add_request
+
+
+@responses.activate
+def test_add_stream_file(rpc_api_add_request: JSON, mock_local_image_path: Path):
+    """Should stream the file content as multipart body"""
+
+    api = ipfs.rpc()  # call to local ipfs
+    command = Add(File(mock_local_image_path))
+    output = api(command)
+
+    request = responses.calls[0].request
+    body = b''.join(request.body)
+    assert output == rpc_api_add_request
+    assert request.headers['Content-Length'] == str(len(body))
+    assert mock_local_image_path.read_bytes() in body
+
+
+def test_dir_recursive_walk(tmp_path: Path):
+    """Should walk nested directories preserving relative paths and skipping ignored files"""
+    rendition = tmp_path / '720p'
+    rendition.mkdir()
+    (rendition / 'segment0.ts').write_bytes(b'segment')
+    (rendition / '.hidden').write_bytes(b'hidden')
+    (tmp_path / 'index.m3u8').write_text('playlist')
+    (tmp_path / 'upload.tmp').write_text('temp')
+
+    body = b''.join(dict(Dir(Path(str(tmp_path))))['data'])
+    dispositions = filter(lambda line: b'filename=' in line, body.split(b'\r\n'))
+    filenames = [unquote(line.split(b'filename="')[1][:-1].decode()) for line in dispositions]
+
+    assert filenames == ['720p', 'index.m3u8', '720p/segment0.ts']
+    assert b'application/x-directory' in body
+
+
+@responses.activate
+def test_add_dir_root_entry(mock_local_path: Path):
+    """Should return the root entry for directory add output"""
+    responses.add(responses.POST, ADD_ENDPOINT, body=ADD_DIR_OUTPUT, status=200)
+
+    api = ipfs.rpc()
+    output = api(Add(Dir(mock_local_path)))
+    assert output == {'Name': 'hls', 'Hash': 'bafybeib', 'Size': '4096'}
+
+
+@responses.activate
+def test_add_dir_stream_entries(mock_local_path: Path):
+    """Should yield each entry for directory add output"""
+    responses.add(responses.POST, ADD_ENDPOINT, body=ADD_DIR_OUTPUT, status=200)
+
+    api = ipfs.rpc()
+    entries = api.stream(Add(Dir(mock_local_path)))
+    assert [entry['Hash'] for entry in entries] == ['bafkreia', 'bafybeib', 'bafkreic']
+
+
+@responses.activate
+def test_add_stream_error_entry(mock_local_path: Path):
+    """Should raise an exception if an error entry is streamed"""
+    error_output = (
+        '{"Name": "hls/index.m3u8", "Hash": "bafkreia", "Size": "120"}\n{"Message": "fail", "Type": "error"}\n'
+    )
+    responses.add(responses.POST, ADD_ENDPOINT, body=error_output, status=200)
+
+    api = ipfs.rpc()
+    with pytest.raises(IPFSRuntimeError):
+        api(Add(Dir(mock_local_path)))
+
+
+@responses.activate
+def test_add_request_error(mock_local_path: Path):
+    """Should raise an exception if the request fails"""
+    responses.add(responses.POST, ADD_ENDPOINT, body='{"Message": "fail", "Code": 0}', status=500)
+
+    api = ipfs.rpc()
+    with pytest.raises(IPFSRuntimeError):
+        api(Add(Dir(mock_local_path)))
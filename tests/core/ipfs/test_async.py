@@ -0,0 +1,85 @@
+import asyncio
+import threading
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+import nucleus.core.ipfs as ipfs
+from nucleus.core.exceptions import IPFSRuntimeError
+from nucleus.core.ipfs import BlockPut, DagPut, Request, Text
+from nucleus.core.ipfs.rpc import _chunks
+from nucleus.core.types import Any
+
+
+async def _block_put(request: web.Request):
+    reader = await request.multipart()
+    part = await reader.next()
+    data = await part.read()  # type: ignore
+    return web.json_response({'Key': data.decode(), 'Size': str(len(data))})
+
+
+async def _dag_put(_: web.Request):
+    return web.json_response({'Message': 'invalid dag', 'Code': 0}, status=500)
+
+
+def _serve(test: Any):
+    """Run the test against a fake IPFS API server"""
+
+    async def run():
+        app = web.Application()
+        app.router.add_post('/api/v0/block/put', _block_put)
+        app.router.add_post('/api/v0/dag/put', _dag_put)
+
+        async with TestServer(app) as server:
+            async with ipfs.async_rpc(str(server.make_url(''))) as api:
+                return await test(api)
+
+    return asyncio.run(run())
+
+
+def test_command_request():
+    """Should describe the request to execute the command"""
+    request = BlockPut(Text(b'hello')).request()
+
+    assert isinstance(request, Request)
+    assert request.endpoint == '/api/v0/block/put'
+    assert request.params['cid-codec'] == 'raw'
+    assert set(request.settings) == {'data', 'headers'}
+
+
+def test_async_block_put_in_flight():
+    """Should execute many commands concurrently"""
+
+    async def test(api: ipfs.AsyncRPC):
+        commands = (BlockPut(Text(bytes(str(i), 'utf-8'))) for i in range(200))
+        return await asyncio.gather(*map(api, commands))
+
+    outputs = _serve(test)
+    assert [o['Key'] for o in outputs] == [str(i) for i in range(200)]
+
+
+def test_async_request_error():
+    """Should raise an exception if the request fails"""
+
+    async def test(api: ipfs.AsyncRPC):
+        return await api(DagPut(Text(b'{}')))
+
+    with pytest.raises(IPFSRuntimeError):
+        _serve(test)
+
+
+def test_async_body_read_off_loop():
+    """Should read the request body outside the event loop thread"""
+    threads = set()
+
+    def body():
+        for chunk in (b'he', b'llo'):
+            threads.add(threading.get_ident())
+            yield chunk
+
+    async def test():
+        return [chunk async for chunk in _chunks(body())]
+
+    assert asyncio.run(test()) == [b'he', b'llo']
+    assert threading.get_ident() not in threads
@@ -1,8 +1,8 @@
 import responses
 
 import nucleus.core.ipfs as ipfs
-from nucleus.core.ipfs import BlockPut, Text
-from nucleus.core.types import JSON
+from nucleus.core.ipfs import BlockPut, BlockStat, Text
+from nucleus.core.types import CID, JSON
 
 
 @responses.activate
@@ -13,3 +13,16 @@ def test_block_put(rpc_api_block_put_request: JSON):
     command = BlockPut(Text(b'hello'))
     output = api(command)  # call the command in api
     assert output == rpc_api_block_put_request
+
+
+@responses.activate
+def test_block_stat():
+    """Should check the block in local node only"""
+    cid = CID.from_bytes(b'hello')
+    expected_output = f'{{"Key": "{cid}", "Size": 5}}'
+    responses.add(responses.POST, 'http://localhost:5001/api/v0/block/stat', body=expected_output, status=200)
+
+    api = ipfs.rpc()  # call to local ipfs
+    output = api(BlockStat(cid))
+    assert output['Key'] == cid
+    assert responses.calls[0].request.params == {'arg': cid, 'offline': 'True'}
@@ -0,0 +1,22 @@
+from urllib.parse import parse_qs, urlparse
+
+import responses
+
+import nucleus.core.ipfs as ipfs
+from nucleus.core.ipfs import PinAdd
+from nucleus.core.types import CID
+
+
+@responses.activate
+def test_pin_add():
+    """Should pin all the blocks in one request using the local node only"""
+    cids = [CID.from_bytes(b'hello'), CID.from_bytes(b'world')]
+    expected_output = f'{{"Pins": ["{cids[0]}", "{cids[1]}"]}}'
+    responses.add(responses.POST, 'http://localhost:5001/api/v0/pin/add', body=expected_output, status=200)
+
+    api = ipfs.rpc()  # call to local ipfs
+    output = api(PinAdd(cids))
+    params = parse_qs(urlparse(responses.calls[0].request.url).query)
+
+    assert output['Pins'] == cids
+    assert params == {'arg': cids, 'recursive': ['True'], 'offline': ['True']}
@@ -0,0 +1,34 @@
+from nucleus.core.ipfs import unixfs
+from nucleus.core.types import CID
+
+
+def _leaves(data: bytes, chunk_size: int):
+    chunks = [data[i : i + chunk_size] for i in range(0, len(data), chunk_size)]
+    return [unixfs.Link(CID.from_bytes(c), len(c), len(c)) for c in chunks]
+
+
+def test_empty_file():
+    """Should return the well known empty file node"""
+    root, nodes = unixfs.layout([])
+    assert root.cid == 'bafybeif7ztnhq65lumvvtr4ekcwd2ifwgm3awq4zfr3srh462rwyinlb4y'
+    assert nodes == [b'\n\x04\x08\x02\x18\x00']
+
+
+def test_single_leaf():
+    """Should return the leaf itself as root without nodes"""
+    leaves = _leaves(b'hello', 10)
+    root, nodes = unixfs.layout(leaves)
+    assert root == leaves[0]
+    assert nodes == []
+
+
+def test_balanced_tree():
+    """Should build a balanced tree bounded by max links per node"""
+    leaves = _leaves(b'x' * 10, 2)
+    root, nodes = unixfs.layout(leaves, width=2)
+
+    # 5 leaves -> 3 nodes -> 2 nodes -> root
+    assert len(nodes) == 6
+    assert root.size == 10
+    assert root.cid == CID.from_bytes(nodes[-1], 'dag-pb')
+    assert root.tsize == sum(map(len, nodes)) + 10
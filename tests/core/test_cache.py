@@ -1,6 +1,11 @@
+import concurrent.futures
+import gc
 import os
+import sqlite3
 from unittest.mock import patch
 
+import pytest
+
 import nucleus.core.cache as cache
 from nucleus.core.constants import ROOT_DIR
 from nucleus.core.types import Path
@@ -29,3 +34,39 @@ def test_valid_connection_for_valid_file():
         assert conn.cursor() is not None
         assert Path(TEST_DB).exists() is True
         os.remove(TEST_DB)
+
+
+def test_tune_connection():
+    """Should set the write intensive pragmas to connection"""
+    with cache.connection(TEST_DB) as conn:
+        cache.tune(conn)
+        assert conn.execute('PRAGMA journal_mode').fetchone()[0] == 'wal'
+        assert conn.execute('PRAGMA synchronous').fetchone()[0] == 1  # NORMAL
+        conn.close()
+        os.remove(TEST_DB)
+
+
+def test_provider_connection_per_thread():
+    """Should reuse the connection in the same thread and open a new one for other threads"""
+    provider = cache.Provider(TEST_DB, setup=cache.tune)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        other = executor.submit(provider).result()
+
+    assert provider() is provider()
+    assert provider() is not other
+    assert provider().execute('PRAGMA journal_mode').fetchone()[0] == 'wal'
+    provider.close()
+    os.remove(TEST_DB)
+
+
+def test_provider_close_exited_threads():
+    """Should close the connections of the exited threads"""
+    provider = cache.Provider(TEST_DB)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+        connections = list(executor.map(lambda _: provider(), range(4)))
+
+    gc.collect()
+    assert len(provider._holders) == 0
+    with pytest.raises(sqlite3.ProgrammingError):
+        connections[0].execute('SELECT 1')
+    os.remove(TEST_DB)
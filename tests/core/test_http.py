@@ -0,0 +1,38 @@
+import nucleus.core.http as http
+import nucleus.core.ipfs as ipfs
+from nucleus.core.http import KeepAliveAdapter
+
+
+def test_shared_session_same_endpoint():
+    """Should return the same session for the same endpoint"""
+    session = http.shared_session('http://localhost:5001')
+    assert session is http.shared_session('http://LOCALHOST:5001/')
+    assert session is not http.shared_session('http://localhost:8080')
+
+
+def test_close_sessions():
+    """Should create a new session after closing the shared sessions"""
+    session = http.shared_session('http://localhost:5001')
+    http.close_sessions()
+    assert session is not http.shared_session('http://localhost:5001')
+
+
+def test_live_session_pool_settings():
+    """Should mount a keep alive adapter with the configured pool and retry settings"""
+    session = http.live_session('http://localhost:5001', pool_maxsize=100, max_retries=5)
+    adapter = session.get_adapter('http://localhost:5001')
+
+    assert isinstance(adapter, KeepAliveAdapter)
+    assert adapter._pool_maxsize == 100  # type: ignore
+    assert adapter.max_retries.total == 5
+
+
+def test_live_session_retry_methods():
+    """Should only retry idempotent methods unless non idempotent methods are allowed"""
+    session = http.live_session('http://localhost:5001')
+    rpc_session = ipfs.rpc('http://localhost:5002')._http
+    retries = session.get_adapter('http://localhost:5001').max_retries
+    rpc_retries = rpc_session.get_adapter('http://localhost:5002').max_retries
+
+    assert 'POST' not in retries.allowed_methods
+    assert 'POST' in rpc_retries.allowed_methods
@@ -0,0 +1,26 @@
+from nucleus.core.http import Multipart, Part
+from nucleus.core.types import Path
+
+
+def test_multipart_length_match_body(mock_local_image_path: Path):
+    """Should compute the same length as the encoded body"""
+    body = Multipart([Part('file', 'meta', b'hello'), Part('file', mock_local_image_path.name, mock_local_image_path)])
+    assert len(body) == len(b''.join(body))
+
+
+def test_multipart_stream_file_in_chunks(mock_local_image_path: Path):
+    """Should stream the file content in chunks lower or equal than chunk size"""
+    body = Multipart([Part('file', mock_local_image_path.name, mock_local_image_path)], chunk_size=1024)
+    chunks = list(body)
+
+    assert max(map(len, chunks)) <= 1024
+    assert mock_local_image_path.read_bytes() in b''.join(chunks)
+
+
+def test_multipart_headers():
+    """Should return the expected multipart headers"""
+    body = Multipart([Part('file', 'meta', b'hello')])
+    headers = body.headers()
+
+    assert headers['Content-Type'].startswith('multipart/form-data; boundary=')
+    assert headers['Content-Length'] == str(len(body))
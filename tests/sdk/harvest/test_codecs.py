@@ -0,0 +1,59 @@
+import pickle
+
+import pytest
+
+import nucleus.sdk.harvest.codecs as codecs
+from nucleus.core.types import Raw
+from nucleus.sdk.exceptions import ModelManagerError
+from nucleus.sdk.harvest import Model
+
+
+class Series(Model):
+    year: int
+
+    class Config:
+        codec = codecs.JSON()
+        version = 2
+
+    @classmethod
+    def upgrade(cls, data: Raw, version: int) -> Raw:
+        # year was stored as "year-month" string before version 2
+        return {**data, 'year': data['year'].split('-')[0]} if version < 2 else data
+
+
+def test_json_codec():
+    """Should store the model as versioned JSON snapshot"""
+    series = Series(title='Series', description='JSON snapshot', year=2010)
+    snapshot = codecs.encode(series)
+
+    assert snapshot.startswith(b'NS\x01\x00\x02{')
+    assert codecs.decode(Series, snapshot) == series
+
+
+def test_json_codec_upgrade():
+    """Should upgrade the snapshots stored with previous schema version"""
+    snapshot = b'NS\x01\x00\x01{"title": "Series", "description": "", "year": "2010-01"}'
+    assert codecs.decode(Series, snapshot).year == 2010
+
+
+def test_legacy_pickle_snapshot():
+    """Should decode the snapshots stored without header as pickle"""
+    series = Series(title='Series', description='legacy snapshot', year=2010)
+    assert codecs.decode(Series, pickle.dumps(series)) == series
+
+
+def test_unknown_codec():
+    """Should fail decoding snapshots with unknown codec"""
+    with pytest.raises(ModelManagerError):
+        codecs.decode(Series, b'NS\x09\x00\x02{}')
+
+
+def test_migrate():
+    """Should re-encode the legacy snapshots using the model codec"""
+    series = Series(title='Series', description='migrated snapshot', year=2010)
+    Series._conn.execute('INSERT INTO Series(m) VALUES(?)', (pickle.dumps(series),))
+
+    assert Series.migrate() > 0
+    raw = Series._conn.execute('SELECT CAST(m AS BLOB) FROM Series').fetchall()
+    assert all(snapshot.startswith(b'NS\x01') for (snapshot,) in raw)
+    assert series in Series.all()
@@ -1,5 +1,13 @@
+import asyncio
+import os
+import sqlite3
+import time
+
+import pytest
+
 import nucleus.sdk.harvest as harvest
-from nucleus.core.types import JSON
+from nucleus.core.types import JSON, Path
+from nucleus.sdk.exceptions import HarvestingError
 
 mock_collectors_dir = 'tests/_mock/collectors/'
 
@@ -29,3 +37,138 @@ def test_map_collector(mock_raw_collected: JSON, mock_raw_collected2: JSON):
 
     assert list(got_values) == [[mock_raw_collected], [mock_raw_collected2]]
     assert list(got_keys) == ['Dummy', 'File']
+
+
+class Slow(harvest.Collector):
+    def __iter__(self):
+        time.sleep(0.05)
+        yield JSON({'collector': 'slow'})
+
+
+class Fast(harvest.Collector):
+    def __iter__(self):
+        yield from (JSON({'collector': 'fast', 'index': i}) for i in range(3))
+
+
+class Broken(harvest.Collector):
+    def __iter__(self):
+        raise ValueError('unavailable source')
+        yield
+
+
+class Stream(harvest.AsyncCollector):
+    async def __aiter__(self):
+        for i in range(2):
+            await asyncio.sleep(0)
+            yield JSON({'collector': 'stream', 'index': i})
+
+
+def test_parallel_merge_collector():
+    """Should yield the entries from fast collectors without waiting the slow ones"""
+    data_merged = list(harvest.merge([Slow(), Fast()], workers=2, buffer=1))
+    assert data_merged[-1] == {'collector': 'slow'}
+    assert len(data_merged) == 4
+
+
+def test_parallel_merge_raise_harvesting_error():
+    """Should fail if any collector fails during parallel collection"""
+    with pytest.raises(HarvestingError):
+        list(harvest.merge([Fast(), Broken()], workers=2))
+
+
+def test_amerge_collector():
+    """Should merge the entries from sync and async collectors"""
+
+    async def _collect():
+        return [entry async for entry in harvest.amerge([Fast(), Stream()])]
+
+    data_merged = asyncio.run(_collect())
+    assert sorted(e['collector'] for e in data_merged) == ['fast'] * 3 + ['stream'] * 2
+
+
+def test_amerge_collector_stop_early():
+    """Should wait the cancelled collectors if the consumer stops early"""
+
+    async def _collect():
+        entries = harvest.amerge([Fast(), Stream()], buffer=1)
+        first = await entries.__anext__()
+        await entries.aclose()
+        return first, [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+
+    first, pending = asyncio.run(_collect())
+    assert first['collector'] in ('fast', 'stream')
+    assert pending == []
+
+
+def test_stream_collector(mock_raw_collected: JSON, mock_raw_collected2: JSON):
+    """Should stream collected metadata tagged with the collector name"""
+    loaded_collectors = harvest.load(mock_collectors_dir)
+    data_streamed = harvest.stream(loaded_collectors)
+    assert list(data_streamed) == [('Dummy', mock_raw_collected), ('File', mock_raw_collected2)]
+
+
+def test_spill_collector(mock_raw_collected: JSON, mock_raw_collected2: JSON):
+    """Should map collected metadata spilled to local database"""
+    loaded_collectors = harvest.load(mock_collectors_dir)
+    data_spilled = harvest.spill(loaded_collectors, batch_size=1)
+
+    assert list(data_spilled.keys()) == ['Dummy', 'File']
+    assert list(data_spilled['Dummy']) == [mock_raw_collected]
+    assert list(data_spilled['File']) == [mock_raw_collected2]
+
+
+def test_spill_collector_isolated(mock_raw_collected: JSON, mock_raw_collected2: JSON):
+    """Should spill each call to its own database and remove it once the streams are exhausted"""
+    first = harvest.spill(harvest.load(mock_collectors_dir))
+    second = harvest.spill(harvest.load(mock_collectors_dir))
+    spilled = first['Dummy'].gi_frame.f_locals['self']
+    db_path = spilled._db_path
+
+    # the second spill does not clear the entries of the first one
+    assert list(first['Dummy']) == [mock_raw_collected]
+    assert list(second['Dummy']) == [mock_raw_collected]
+    assert os.path.exists(db_path)
+
+    assert list(first['File']) == [mock_raw_collected2]
+    assert not os.path.exists(db_path)
+    with pytest.raises(sqlite3.ProgrammingError):
+        spilled._conn.execute('SELECT 1')
+
+
+def test_load_cached_collector(tmp_path: Path):
+    """Should reuse the discovered collectors until the directory is modified"""
+    collector = (
+        'from nucleus.sdk.harvest import Collector\n\n'
+        'class {0}(Collector):\n'
+        '    def __iter__(self):\n'
+        '        yield {{}}\n'
+    )
+    (tmp_path / 'first.py').write_text(collector.format('First'))
+    first = list(harvest.load(str(tmp_path)))
+    cached = list(harvest.load(str(tmp_path)))
+    # the same classes are returned without executing the modules again
+    assert isinstance(cached[0], type(first[0]))
+
+    (tmp_path / 'second.py').write_text(collector.format('Second'))
+    # ensure the directory mtime changes in filesystems with low resolution
+    os.utime(tmp_path, ns=(time.time_ns(), time.time_ns() + 10**9))
+    loaded = [type(c).__name__ for c in harvest.load(str(tmp_path))]
+    assert loaded == ['First', 'Second']
+
+
+def test_load_async_collector(tmp_path: Path):
+    """Should only load async collectors if requested, and fail to consume them synchronously"""
+    (tmp_path / 'api.py').write_text(
+        'from nucleus.sdk.harvest import AsyncCollector\n\n'
+        'class Api(AsyncCollector):\n'
+        '    async def __aiter__(self):\n'
+        '        yield {}\n'
+    )
+
+    assert list(harvest.load(str(tmp_path))) == []
+    with pytest.raises(HarvestingError):
+        list(harvest.merge(harvest.load(str(tmp_path), asynchronous=True)))
+    with pytest.raises(HarvestingError):
+        harvest.map(harvest.load(str(tmp_path), asynchronous=True))
+    with pytest.raises(HarvestingError):
+        list(harvest.merge(harvest.load(str(tmp_path), asynchronous=True), workers=2))
@@ -1,6 +1,10 @@
+import concurrent.futures
+
 import pytest
 
-from nucleus.sdk.exceptions import ModelValidationError
+import nucleus.sdk.harvest.codecs as codecs
+from nucleus.core.types import Any, Path
+from nucleus.sdk.exceptions import ModelManagerError, ModelValidationError
 from nucleus.sdk.harvest import Model
 from tests._mock.models import Movie
 
@@ -40,6 +44,7 @@ def test_model_freeze(mock_models: Movie):
 def test_movie_fetch_frozen(mock_models: Movie):
     """Should query a valid fetch of movies"""
     # store a movie
+    mock_models.save()
     expected = [mock_models]
     result = mock_models.all()
     movies = list(result)
@@ -53,3 +58,142 @@ def test_movie_get_frozen(mock_models: Movie):
     result = Movie.get()
     movies = result
     assert movies == mock_models
+
+
+def test_movie_save_many(mock_raw_metadata: Any):
+    """Should store all the entries in batches"""
+    entries = [Movie.parse_obj({**mock_raw_metadata, 'title': f'Movie {i}'}) for i in range(5)]
+    stored = Movie.save_many(iter(entries), batch_size=2)
+    movies = list(Movie.all())
+
+    assert stored == 5
+    assert all(entry in movies for entry in entries)
+
+
+def test_movie_all_range(mock_raw_metadata: Any):
+    """Should stream the entries in the requested range"""
+    Movie.save_many(Movie.parse_obj({**mock_raw_metadata, 'title': f'Movie {i}'}) for i in range(5))
+    movies = list(Movie.all())
+
+    assert list(Movie.all(limit=2, chunk_size=1)) == movies[:2]
+    assert list(Movie.all(limit=2, offset=3)) == movies[3:5]
+
+
+def test_movie_iter_all(mock_raw_metadata: Any):
+    """Should walk all the entries by pages"""
+    Movie.save_many(Movie.parse_obj({**mock_raw_metadata, 'title': f'Movie {i}'}) for i in range(5))
+    assert list(Movie.iter_all(chunk_size=2)) == list(Movie.all())
+
+
+class IndexedMovie(Model):
+    imdb_code: str
+    rating: float
+
+    class Config:
+        indexes = ('imdb_code',)
+
+
+def test_indexed_filter():
+    """Should fetch the entries matching the criteria over indexed and not indexed fields"""
+    entries = [IndexedMovie(title='Movie', description='', imdb_code=f'tt{i % 2}', rating=i) for i in range(4)]
+    IndexedMovie.save_many(entries)
+
+    assert set(IndexedMovie.filter(imdb_code='tt1')) >= {entries[1], entries[3]}
+    assert set(IndexedMovie.filter(imdb_code='tt1', rating=3)) == {entries[3]}
+    assert IndexedMovie.get(imdb_code='tt0') == entries[0]
+
+
+def test_indexed_query_plan():
+    """Should resolve the indexed criteria using the index"""
+    plan = IndexedMovie._conn.execute('EXPLAIN QUERY PLAN SELECT m FROM IndexedMovie WHERE imdb_code = ?', ('tt1',))
+    assert 'USING INDEX' in plan.fetchone()[-1]
+
+
+def test_get_raise_model_manager_error():
+    """Should fail if there is no entry matching the criteria or the field is not declared"""
+    with pytest.raises(ModelManagerError):
+        IndexedMovie.get(imdb_code='not stored')
+
+    with pytest.raises(ModelManagerError):
+        IndexedMovie.get(undeclared='field')
+
+
+def test_indexed_reindex():
+    """Should index the entries stored before the indexed columns were added"""
+    entry = IndexedMovie(title='Movie', description='', imdb_code='tt-legacy', rating=1)
+    # simulate an entry stored before the migration
+    IndexedMovie._conn.execute('INSERT INTO IndexedMovie(m) VALUES(?)', (entry,))
+    IndexedMovie._stale = True
+
+    assert IndexedMovie.get(imdb_code='tt-legacy') == entry
+    assert IndexedMovie._stale is False
+
+
+def test_load_trusted_data(mock_raw_metadata: Any):
+    """Should store the trusted data without validation"""
+    raw = [{**mock_raw_metadata, 'title': f'Trusted {i}'} for i in range(3)]
+    stored = Movie.load(raw)
+
+    assert stored == 3
+    assert {m.title for m in Movie.filter(imdb_code=mock_raw_metadata['imdb_code'])} >= {e['title'] for e in raw}
+
+
+def test_concurrent_save_and_fetch():
+    """Should save and fetch entries from many threads at once"""
+    entries = [IndexedMovie(title='Movie', description='', imdb_code=f'tt-thread-{i}', rating=i) for i in range(8)]
+
+    def save_and_get(entry: IndexedMovie) -> IndexedMovie:
+        entry.save()
+        return IndexedMovie.get(imdb_code=entry.imdb_code)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+        fetched = list(executor.map(save_and_get, entries))
+
+    assert fetched == entries
+
+
+class LazyMovie(Movie):
+    ...
+
+
+def test_lazy_database_creation(mock_raw_metadata: Any, models_path: Path):
+    """Should only create the model database on first use"""
+    db_file = Path(f'{models_path}/LazyMovie.db')
+    assert not db_file.exists()
+
+    LazyMovie.parse_obj(mock_raw_metadata).save()
+    assert db_file.exists()
+
+
+class Review(Model):
+    class Config:
+        codec = codecs.JSON()
+
+
+def test_models_named_alike():
+    """Should decode the snapshots with the model declared in the same module"""
+    Review(title='Review', description='').save()
+
+    # a model with the same name declared in another module does not replace the converter
+    type('Review', (Model,), {'__module__': 'tests._mock.other'})
+    assert type(Review.get()) is Review
+
+
+class LegacyMovie(IndexedMovie):
+    ...
+
+
+def test_legacy_snapshot_type(models_path: Path):
+    """Should keep the entries and the indexes of the tables declared with the unqualified snapshot type"""
+    entry = LegacyMovie(title='Movie', description='', imdb_code='tt-legacy', rating=1)
+    models_path.mkdir(parents=True, exist_ok=True)
+    conn = LegacyMovie._provider()
+    # simulate a table created before the snapshot type was qualified by module
+    with conn:
+        conn.execute('CREATE TABLE LegacyMovie(m LegacyMovie, imdb_code)')
+        conn.execute('CREATE INDEX LegacyMovie_imdb_code ON LegacyMovie(imdb_code)')
+        conn.execute('INSERT INTO LegacyMovie(m, imdb_code) VALUES(?, ?)', (entry, entry.imdb_code))
+
+    assert LegacyMovie.get(imdb_code='tt-legacy') == entry
+    plan = conn.execute('EXPLAIN QUERY PLAN SELECT m FROM LegacyMovie WHERE imdb_code = ?', ('tt1',))
+    assert 'USING INDEX' in plan.fetchone()[-1]
@@ -1,9 +1,13 @@
+import asyncio
+import concurrent.futures
+import time
 from unittest.mock import patch
 
+import ffmpeg
 import pytest
 
 import nucleus.sdk.processing as processing
-from nucleus.core.types import Any, Path
+from nucleus.core.types import Any, List, Path
 from nucleus.sdk.exceptions import ProcessingEngineError
 from nucleus.sdk.harvest import Image, Media, Video
 
@@ -62,3 +66,190 @@ def test_image_engine(mock_local_image_path: Path):
         # Validate output
         assert media.path == output
         assert isinstance(media, Media)
+
+
+def test_video_engine_save_many():
+    """Should produce all the renditions from one ffmpeg command"""
+    video = processing.VideoEngine(ffmpeg.input('input.mp4'))
+    video.configure(processing.H264())
+    video.configure(processing.Bitrate.B480)
+    renditions = {
+        Path('720.mp4'): (processing.Screen.Q720, processing.Bitrate.B720),
+        Path('1080.mp4'): (processing.Screen.Q1080,),
+    }
+
+    meta = processing.Introspection(size=1, type='video/mp4')
+    with patch('nucleus.sdk.processing.engines.ffmpeg.merge_outputs') as merge, patch.object(
+        processing.VideoEngine, 'introspect', return_value=meta
+    ):
+        files = video.save_many(renditions)
+        (outputs, _) = merge.call_args
+
+    args = [output.get_args() for output in outputs]
+    assert merge.return_value.run.called
+    assert [file.path for file in files] == list(renditions)
+    # each rendition settings take precedence over the engine settings
+    assert args[0][args[0].index('-s') + 1] == '1280x720'
+    assert args[0][args[0].index('-b:v') + 1] == '2048k'
+    assert args[1][args[1].index('-s') + 1] == '1920x1080'
+    assert args[1][args[1].index('-b:v') + 1] == '750k'
+
+
+FAKE_PROGRESS = (
+    "printf 'frame=10\\nfps=25.0\\nout_time_us=400000\\nspeed=N/A\\nprogress=continue\\n"
+    "frame=20\\nfps=25.0\\nout_time_us=800000\\nspeed=1.5x\\nprogress=end\\n'"
+)
+
+
+def test_video_engine_progress():
+    """Should report the ffmpeg progress while transcoding"""
+    video = processing.VideoEngine(ffmpeg.input('input.mp4'))
+    meta = processing.Introspection(size=1, type='video/mp4')
+    reports: List[processing.Progress] = []
+
+    with patch.object(video, '_command', return_value=FAKE_PROGRESS), patch.object(
+        video, 'introspect', return_value=meta
+    ):
+        file = asyncio.run(video.asave(Path('video.mp4'), on_progress=reports.append))
+
+    assert file.path == Path('video.mp4')
+    assert reports == [
+        processing.Progress(frame=10, fps=25.0, speed=0.0, out_time=0.4),
+        processing.Progress(frame=20, fps=25.0, speed=1.5, out_time=0.8, done=True),
+    ]
+
+
+def test_video_engine_progress_raise_processing_engine_error():
+    """Should fail if ffmpeg exits with failure"""
+    video = processing.VideoEngine(ffmpeg.input('input.mp4'))
+    with patch.object(video, '_command', return_value="echo 'Invalid argument' && exit 1"):
+        with pytest.raises(ProcessingEngineError):
+            asyncio.run(video.asave(Path('video.mp4')))
+
+
+def test_video_engine_cancel():
+    """Should kill the ffmpeg process when the transcoding is cancelled"""
+    video = processing.VideoEngine(ffmpeg.input('input.mp4'))
+
+    async def _cancel():
+        task = asyncio.create_task(video.asave(Path('video.mp4')))
+        await asyncio.sleep(0.1)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    with patch.object(video, '_command', return_value='exec sleep 5'):
+        started = time.monotonic()
+        asyncio.run(_cancel())
+        assert time.monotonic() - started < 5
+
+
+SOURCE_STREAMS = {
+    'streams': [
+        {'codec_type': 'video', 'codec_name': 'h264', 'width': 1280, 'height': 720, 'bit_rate': '1500000'},
+        {'codec_type': 'audio', 'codec_name': 'aac', 'bit_rate': '128000'},
+    ]
+}
+
+
+def test_video_engine_passthrough():
+    """Should copy the source streams already satisfying the configured settings"""
+    video = processing.VideoEngine(ffmpeg.input('input.mp4'), source=Path('input.mp4'))
+    video.configure(processing.HLS(processing.H264()))
+    video.configure(processing.Screen.Q720)
+    video.configure(processing.Bitrate.B720)
+
+    with patch('nucleus.sdk.processing.probe', return_value=SOURCE_STREAMS):
+        args = video._build_output_args()
+
+    assert args['c:v'] == 'copy' and args['c:a'] == 'copy'
+    assert 's' not in args and 'crf' not in args
+    assert args['hls_time'] == 10
+
+
+def test_video_engine_passthrough_reencode():
+    """Should re-encode the source streams not satisfying the configured settings"""
+    video = processing.VideoEngine(ffmpeg.input('input.mp4'), source=Path('input.mp4'))
+    video.configure(processing.H264())
+    video.configure(processing.Screen.Q1080)
+    video.configure(processing.BR(2048, 96))
+
+    with patch('nucleus.sdk.processing.probe', return_value=SOURCE_STREAMS):
+        args = video._build_output_args()
+
+    assert args['c:v'] == 'libx264' and args['s'] == '1920x1080'
+    assert args['c:a'] == 'aac' and args['b:a'] == '96k'
+
+
+def test_video_engine_passthrough_encoded_streams():
+    """Should only copy the streams encoded by a configured codec"""
+    video = processing.VideoEngine(ffmpeg.input('input.mp4'), source=Path('input.mp4'))
+    video.configure(processing.Copy('v'))
+
+    with patch('nucleus.sdk.processing.probe', return_value=SOURCE_STREAMS):
+        args = video._build_output_args()
+
+    # the audio stream is re-encoded as usual
+    assert args == {'c:v': 'copy'}
+
+
+def test_video_engine_passthrough_filtered():
+    """Should re-encode the source video stream if it is filtered, or if passthrough is disabled"""
+    video = processing.VideoEngine(ffmpeg.input('input.mp4'), source=Path('input.mp4'))
+    video.configure(processing.H264())
+    video.configure(processing.Custom(vf='hflip'))
+
+    with patch('nucleus.sdk.processing.probe', return_value=SOURCE_STREAMS):
+        args = video._build_output_args()
+
+    assert args['c:v'] == 'libx264' and args['vf'] == 'hflip'
+    assert args['c:a'] == 'copy'
+
+    video = processing.VideoEngine(ffmpeg.input('input.mp4'), source=Path('input.mp4'), passthrough=False)
+    video.configure(processing.H264())
+
+    with patch('nucleus.sdk.processing.probe', return_value=SOURCE_STREAMS) as probe:
+        args = video._build_output_args()
+
+    assert args['c:v'] == 'libx264' and args['c:a'] == 'aac'
+    probe.assert_not_called()
+
+
+def test_video_engine_save_chunked(tmp_path: Path):
+    """Should encode the source video in segments and concatenate them with the source audio"""
+    video = processing.VideoEngine(ffmpeg.input('input.mp4'), source=Path('input.mp4'))
+    video.configure(processing.HLS(processing.H264()))
+    video.configure(processing.Bitrate.B720)
+    video.configure(processing.Custom(vf='hflip', pix_fmt='yuv420p'))
+    commands: List[List[str]] = []
+
+    def run(stream: Any, **_: Any):
+        args = ffmpeg.get_args(stream)
+        commands.append(args)
+        # simulate the segment muxer output
+        if 'segment' in args:
+            for i in range(3):
+                Path(args[-1] % i).write_text('segment')
+
+    probed = {'format': {'duration': '30.0'}, 'streams': [{'codec_type': 'video'}, {'codec_type': 'audio'}]}
+    meta = processing.Introspection(size=1, type='video/mp4')
+    output = Path(str(tmp_path / 'video.mp4'))
+
+    with patch('nucleus.sdk.processing.engines.ffmpeg.run', side_effect=run), patch(
+        'nucleus.sdk.processing.probe', return_value=probed
+    ), patch('concurrent.futures.ProcessPoolExecutor', concurrent.futures.ThreadPoolExecutor), patch.object(
+        video, 'introspect', return_value=meta
+    ):
+        file = video.save_chunked(output, segments=3)
+
+    (split, *encoded, concat) = commands
+    assert file.path == output
+    assert split[split.index('-segment_time') + 1] == '10.0'
+    assert len(encoded) == 3
+    # the segments only encode the video stream, including the video filters
+    assert all('libx264' in args and '-c:a' not in args for args in encoded)
+    assert all('hflip' in args and 'yuv420p' in args and '-hls_time' not in args for args in encoded)
+    assert concat[concat.index('-c:v') + 1] == 'copy'
+    assert '-vf' not in concat and '-pix_fmt' not in concat and '-hls_time' in concat
+    assert concat[concat.index('-c:a') + 1] == 'aac'
+    assert ['-map', '1:a'] == concat[concat.index('1:a') - 1 : concat.index('1:a') + 1]
@@ -1,9 +1,13 @@
+import subprocess
+from unittest.mock import patch
+
 import pytest
 
 import nucleus.sdk.processing as processing
 from nucleus.core.types import Path
+from nucleus.sdk.exceptions import FFProbeError
 from nucleus.sdk.harvest import Video
-from nucleus.sdk.processing import H264, HLS, Copy
+from nucleus.sdk.processing import H264, HLS, Copy, Introspection
 
 # TODO add mocking
 
@@ -27,3 +31,46 @@ def test_probe_video(mock_local_video_path: Path):
     video_engine.configure(HLS(output_codec))
     # then let see if the video match the output codec
     assert input_codec in H264()
+
+
+def test_probe_cache(tmp_path: Path):
+    """Should reuse the probe result until the file is modified"""
+    media = tmp_path / 'video.mp4'
+    media.write_bytes(b'video')
+
+    with patch('nucleus.sdk.processing.video.ffprobe.ffmpeg.probe', return_value={'streams': []}) as ffprobe:
+        processing.probe(Path(str(media)))
+        processing.probe(Path(str(media)))
+        assert ffprobe.call_count == 1
+
+        media.write_bytes(b'modified video')
+        processing.probe(Path(str(media)))
+        assert ffprobe.call_count == 2
+
+
+def test_probe_entries(tmp_path: Path):
+    """Should only request the selected entries to ffprobe"""
+    media = tmp_path / 'video.mp4'
+    media.write_bytes(b'video')
+    output = subprocess.CompletedProcess([], 0, stdout=b'{"streams": [{"codec_name": "h264"}]}', stderr=b'')
+
+    with patch('nucleus.sdk.processing.video.ffprobe.subprocess.run', return_value=output) as run:
+        probed = processing.probe(Path(str(media)), entries='stream=codec_name')
+        (args,), _ = run.call_args
+
+    assert probed == {'streams': [{'codec_name': 'h264'}]}
+    assert args[args.index('-show_entries') + 1] == 'stream=codec_name'
+
+
+def test_probe_raise_ffprobe_error():
+    """Should fail if the file path does not exist"""
+    with pytest.raises(FFProbeError):
+        processing.probe(Path('invalid_path'))
+
+
+def test_lazy_introspection():
+    """Should convert the nested probe output on access"""
+    introspection = Introspection(size=1, type='video/mp4', format={'duration': '10.0'}, streams=[{'index': 0}])
+    assert isinstance(vars(introspection)['format'], dict)
+    assert introspection.format.duration == '10.0'
+    assert introspection.streams[0].index == 0
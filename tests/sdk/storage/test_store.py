@@ -1,9 +1,14 @@
+import asyncio
+
+import pytest
 import responses
 
 import nucleus.sdk.storage as store
-from nucleus.core.types import JSON, Path
+from nucleus.core.exceptions import IPFSRuntimeError
+from nucleus.core.types import CID, JSON, Path
+from nucleus.sdk.exceptions import StorageError
 from nucleus.sdk.processing import File, Introspection
-from nucleus.sdk.storage import Object
+from nucleus.sdk.storage import Index, Journal, Object
 
 
 @responses.activate
@@ -26,3 +31,199 @@ def test_storage_file(rpc_api_add_request: JSON, mock_local_video_path: Path):
     assert stored.name == output_name
     assert stored.size == output_size
     assert isinstance(stored, Object)
+
+
+BLOCK_PUT_ENDPOINT = 'http://localhost:5001/api/v0/block/put'
+DAG_PUT_ENDPOINT = 'http://localhost:5001/api/v0/dag/put'
+BLOCK_CIDS = [
+    'bafkreigks6arfsq3xxfpvqrrwonchxcnu6do76auprhhfomao6c273sixm',
+    'bafkreib6epubmabzlffdhckpmvsodmjuro6xuaei2qwevs3t52xnlhaatu',
+    'bafkreibopuwahkkqplrgl3hvwu2wrbnfgoj2eau5eqjzjglsmwq2ewxpyy',
+]
+DAG_CID = 'baguqeeradcwd442d6alisdcrb2j7snjgcfu5ty7vmvbwikmdb6xqsnhu7dsa'
+
+
+def _block_output(*cids: str) -> str:
+    return ''.join(f'{{"Key": "{cid}", "Size": 1}}\n' for cid in cids)
+
+
+@responses.activate
+def test_storage_many():
+    """Should store consecutive blocks and dags in one request per batch keeping the input order"""
+    responses.add(responses.POST, BLOCK_PUT_ENDPOINT, body=_block_output(*BLOCK_CIDS), status=200)
+    responses.add(responses.POST, DAG_PUT_ENDPOINT, body=f'{{"Cid": {{"/": "{DAG_CID}"}}}}\n', status=200)
+
+    local_node = store.ipfs()
+    stored = local_node.many([b'a', 'b', b'c', JSON({'d': 1})])
+
+    assert [s.name for s in stored] == [*BLOCK_CIDS, DAG_CID]
+    assert len(responses.calls) == 2
+    assert responses.calls[0].request.url.startswith(BLOCK_PUT_ENDPOINT)
+    assert responses.calls[1].request.url.startswith(DAG_PUT_ENDPOINT)
+
+
+@responses.activate
+def test_storage_many_batch_size():
+    """Should split the blocks in many requests based on batch size"""
+    responses.add(responses.POST, BLOCK_PUT_ENDPOINT, body=_block_output(BLOCK_CIDS[0]), status=200)
+
+    local_node = store.ipfs()
+    stored = local_node.many([b'a', b'b', b'c'], batch_size=1)
+
+    assert len(stored) == 3
+    assert len(responses.calls) == 3
+
+
+@responses.activate
+def test_storage_many_mismatch():
+    """Should fail if the stored objects do not match the input data"""
+    responses.add(responses.POST, BLOCK_PUT_ENDPOINT, body=_block_output(BLOCK_CIDS[0]), status=200)
+
+    local_node = store.ipfs()
+    with pytest.raises(StorageError):
+        local_node.many([b'a', b'b'])
+
+
+PIN_ADD_ENDPOINT = 'http://localhost:5001/api/v0/pin/add'
+
+
+@responses.activate
+def test_storage_index(tmp_path: Path):
+    """Should pin the blocks already registered in index instead of uploading them again"""
+    responses.add(responses.POST, BLOCK_PUT_ENDPOINT, body=_block_output(BLOCK_CIDS[0]), status=200)
+    responses.add(responses.POST, BLOCK_PUT_ENDPOINT, body=_block_output(BLOCK_CIDS[1]), status=200)
+    responses.add(responses.POST, PIN_ADD_ENDPOINT, body=f'{{"Pins": ["{BLOCK_CIDS[0]}"]}}', status=200)
+
+    local_node = store.ipfs(index=Index(str(tmp_path)))
+    local_node(b'a')
+    stored = local_node.many([b'a', b'b'])
+
+    assert [s.name for s in stored] == BLOCK_CIDS[:2]
+    # the second request only uploads the new block
+    assert [call.request.url.split('?')[0] for call in responses.calls] == [
+        BLOCK_PUT_ENDPOINT,
+        PIN_ADD_ENDPOINT,
+        BLOCK_PUT_ENDPOINT,
+    ]
+
+
+@responses.activate
+def test_storage_index_scoped(tmp_path: Path):
+    """Should not skip the blocks registered in index by another node"""
+    other_endpoint = 'http://remote:5001/api/v0/block/put'
+    responses.add(responses.POST, BLOCK_PUT_ENDPOINT, body=_block_output(BLOCK_CIDS[0]), status=200)
+    responses.add(responses.POST, other_endpoint, body=_block_output(BLOCK_CIDS[0]), status=200)
+
+    index = Index(str(tmp_path))
+    store.ipfs(index=index)(b'a')
+    store.ipfs('http://remote:5001', index=index)(b'a')
+
+    assert [call.request.url.split('?')[0] for call in responses.calls] == [BLOCK_PUT_ENDPOINT, other_endpoint]
+
+
+@responses.activate
+def test_storage_index_removed(tmp_path: Path):
+    """Should upload again the indexed blocks removed from the node"""
+    responses.add(responses.POST, BLOCK_PUT_ENDPOINT, body=_block_output(BLOCK_CIDS[0]), status=200)
+    responses.add(responses.POST, PIN_ADD_ENDPOINT, body='{"Message": "block not found"}', status=500)
+
+    local_node = store.ipfs(index=Index(str(tmp_path)))
+    local_node(b'a')
+    stored = local_node(b'a')
+
+    assert stored.name == BLOCK_CIDS[0]
+    assert responses.assert_call_count(
+        f'{BLOCK_PUT_ENDPOINT}?mhtype=sha2-256&mhlen=-1&pin=True&cid-codec=raw&allow-big-block=False', 2
+    )
+
+
+@responses.activate
+def test_storage_stat():
+    """Should skip uploading the blocks already stored in node"""
+    stat_endpoint = 'http://localhost:5001/api/v0/block/stat'
+    responses.add(responses.POST, stat_endpoint, body=_block_output(BLOCK_CIDS[0]), status=200)
+    responses.add(responses.POST, stat_endpoint, body='{"Message": "block not found"}', status=500)
+    responses.add(responses.POST, BLOCK_PUT_ENDPOINT, body=_block_output(BLOCK_CIDS[1]), status=200)
+    responses.add(responses.POST, PIN_ADD_ENDPOINT, body=f'{{"Pins": ["{BLOCK_CIDS[0]}"]}}', status=200)
+
+    local_node = store.ipfs(stat=True)
+    stored = local_node.many([b'a', b'b'])
+
+    assert [s.name for s in stored] == BLOCK_CIDS[:2]
+    assert responses.assert_call_count(
+        f'{BLOCK_PUT_ENDPOINT}?mhtype=sha2-256&mhlen=-1&pin=True&cid-codec=raw&allow-big-block=False', 1
+    )
+
+
+@responses.activate
+def test_storage_map():
+    """Should store the data concurrently and report each failure without aborting the batch"""
+    responses.add(responses.POST, BLOCK_PUT_ENDPOINT, body=_block_output(BLOCK_CIDS[0]), status=200)
+
+    local_node = store.ipfs()
+    data = [b'a', object(), b'a', object()]
+    results = list(local_node.map(data, workers=2))
+
+    assert [r.input for r in results] == data
+    assert [r.output.name for r in results if r.output] == BLOCK_CIDS[:1] * 2
+    assert all(isinstance(r.error, NotImplementedError) for r in results[1::2])
+
+
+@responses.activate
+def test_storage_amap():
+    """Should store the data concurrently from the event loop"""
+    responses.add(responses.POST, BLOCK_PUT_ENDPOINT, body=_block_output(BLOCK_CIDS[0]), status=200)
+
+    async def _collect():
+        local_node = store.ipfs()
+        return [r async for r in local_node.amap([b'a'] * 10, workers=3, ordered=False)]
+
+    results = asyncio.run(_collect())
+    assert len(results) == 10
+    assert all(r.error is None for r in results)
+
+
+def _block_put_callback(fail_at: int = -1):
+    """Reply block/put requests with the CID of the received block, failing at the given request"""
+    calls = []
+
+    def callback(request):
+        calls.append(request)
+        if len(calls) == fail_at:
+            return 500, {}, '{"Message": "connection reset"}'
+
+        body = b''.join(request.body)
+        blocks = body.split(b'\r\n\r\n')[1:]
+        return 200, {}, _block_output(*(CID.from_bytes(b.rsplit(b'\r\n--', 1)[0]) for b in blocks))
+
+    return callback, calls
+
+
+@responses.activate
+def test_storage_upload(tmp_path: Path):
+    """Should resume the chunked upload from the last acknowledged chunk"""
+    media = tmp_path / 'media.bin'
+    media.write_bytes(b'0123456789')
+    journal = Journal(str(tmp_path))
+
+    callback, calls = _block_put_callback(fail_at=3)
+    responses.add_callback(responses.POST, BLOCK_PUT_ENDPOINT, callback=callback)
+    responses.add(responses.POST, PIN_ADD_ENDPOINT, body='{"Pins": []}', status=200)
+    local_node = store.ipfs(journal=journal)
+
+    with pytest.raises(IPFSRuntimeError):
+        local_node.upload(Path(str(media)), chunk_size=4)
+
+    progress = []
+    stored = local_node.upload(Path(str(media)), chunk_size=4, progress=lambda *p: progress.append(p))
+
+    # 2 acknowledged chunks + failed chunk + resumed chunk + root node
+    assert len(calls) == 5
+    assert progress == [(4, 10), (8, 10), (10, 10)]
+    assert stored.name == 'media.bin'
+    assert stored.size > 10
+    # the chunks and nodes are stored unpinned, only the root is pinned
+    puts = [call for call in responses.calls if call.request.url.startswith(BLOCK_PUT_ENDPOINT)]
+    pins = [call for call in responses.calls if call.request.url.startswith(PIN_ADD_ENDPOINT)]
+    assert all('pin=False' in call.request.url for call in puts)
+    assert len(pins) == 1 and f'arg={stored.hash}' in pins[0].request.url